@@ -1,30 +1,86 @@
 # backend/app/app.py
 
+import threading
+from contextlib import asynccontextmanager
+from typing import List
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from .routers import registration, positive_diary, main_diary, emotion_graph, mypage
+from fastapi.concurrency import run_in_threadpool
+from .routers import registration, positive_diary, main_diary, emotion_graph, mypage, monitoring
+from .service import comment_jobs, inference_client, image_service
+from .service.image_storage import UPLOAD_DIR, get_storage
+from .service.model_registry import registry
+from .database import get_async_engine
+from .http_cache import ImmutableStaticFiles, PreloadedStaticFiles
+from .responses import default_response_class
+from .middleware import HTTP_GZIP_ENABLED, CompressionMiddleware, HeaderPolicyMiddleware, TimingMiddleware
 
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.responses import RedirectResponse
 
 import os
 
-async def add_cache_control_header(request, call_next):
-    response = await call_next(request)
+## 시작 시 모델 warm-up 여부 (끝나기 전까지 /health/ready 는 503)
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "1") == "1"
+## 1 이면 import 시점에 모델을 로드 -> gunicorn --preload 로 fork 된 워커들이 copy-on-write 로 공유
+# 예) gunicorn app.app:app --preload -w 4 -k uvicorn.workers.UvicornWorker
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "0") == "1"
+
+
+def models_for_this_process() -> List[str]:
+    ## 코멘트 생성이 워커 프로세스에서 돌면 API 프로세스에는 KoBART 가 필요 없음
+    # 추론 서버(INFERENCE_SERVER_URL)를 쓰면 API 프로세스는 모델을 올리지 않음
+    if inference_client.is_remote():
+        return []
+    names = ["nlp"]
+    if not comment_jobs.COMMENT_JOBS_ENABLED:
+        names.append("chatbot")
+    return names
+
+
+def warm_up_models(app: FastAPI) -> None:
+    names = models_for_this_process()
+    for name in names:
+        registry.warm_up(name)
+    if comment_jobs.COMMENT_JOBS_ENABLED:
+        comment_jobs.warm_up_workers()
+    ## 로드 / warm-up 에 실패한 모델이 있으면 ready 로 바꾸지 않음 (/health/ready 503 유지)
+    app.state.models_ready = registry.all_warm(names)
+    if app.state.models_ready:
+        print(f"INFO: Model warm-up finished: {registry.status()}")
+    else:
+        print(f"ERROR: Model warm-up incomplete, staying not ready: {registry.status()}")
+
+
+if PRELOAD_MODELS:
+    registry.preload(models_for_this_process())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ## 이전 실행에서 pending 상태로 남은 AI 코멘트 작업 재등록 (동기 DB 세션 사용)
+    await run_in_threadpool(comment_jobs.resume_pending_jobs)
     
-    # 정적 파일 경로 확인 (/static/emoji/ 또는 /static/images/)
-    if request.url.path.startswith("/static/emoji/"):
-        
-        # 캐싱 헤더 적용
-        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
-        
-    return response
+    ## 이모지 이미지를 메모리에 로드 (요청마다 디스크를 읽지 않도록)
+    emoji_count = await run_in_threadpool(emoji_files.load)
+    print(f"INFO: Preloaded {emoji_count} emoji files")
+    
+    ## warm-up 은 백그라운드에서 진행 (서버는 바로 떠서 health check 에 응답)
+    app.state.models_ready = not MODEL_WARMUP
+    if MODEL_WARMUP:
+        threading.Thread(target=warm_up_models, args=(app,), name="model-warmup", daemon=True).start()
+    yield
+    comment_jobs.shutdown()
+    image_service.shutdown()
+    await get_async_engine().dispose()
 
 
-app = FastAPI()
+## FAST_JSON_RESPONSES=1 이면 orjson 기반 응답 클래스 사용 (app/responses.py)
+app = FastAPI(lifespan=lifespan, default_response_class=default_response_class())
 
-app.add_middleware(BaseHTTPMiddleware, dispatch=add_cache_control_header)
+## 나중에 추가한 middleware 가 바깥쪽 (Timing -> CORS -> Compression -> HeaderPolicy -> 라우터)
+app.add_middleware(HeaderPolicyMiddleware)
+if HTTP_GZIP_ENABLED:
+    app.add_middleware(CompressionMiddleware)
 
 origins = ["*"]
 
@@ -36,12 +92,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(TimingMiddleware)
+
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__)) 
 EMOJI_STATIC_DIR = os.path.join(CURRENT_DIR, "emoji")
-IMAGES_STATIC_DIR = os.path.join(CURRENT_DIR, "images")
 
-app.mount("/static/emoji", StaticFiles(directory=EMOJI_STATIC_DIR), name="static_emoji")
-app.mount("/static/images", StaticFiles(directory=IMAGES_STATIC_DIR), name="static_images")
+## 이모지는 메모리에서 응답 (lifespan 에서 미리 로드), 업로드 이미지는 immutable 캐시 + strong ETag
+emoji_files = PreloadedStaticFiles(directory=EMOJI_STATIC_DIR)
+app.mount("/static/emoji", emoji_files, name="static_emoji")
+if get_storage().is_local:
+    app.mount("/static/images", ImmutableStaticFiles(directory=UPLOAD_DIR), name="static_images")
+else:
+    ## object storage 사용 시 예전 URL 로 들어온 요청은 presigned / CDN 주소로 redirect (byte 는 storage 가 직접 전송)
+    @app.get("/static/images/{user_pk}/{filename}", include_in_schema=False)
+    async def redirect_image(user_pk: str, filename: str):
+        return RedirectResponse(get_storage().url(user_pk, filename), status_code=307)
 
 
 
@@ -50,7 +115,8 @@ app.include_router(main_diary.router)
 app.include_router(positive_diary.router)
 app.include_router(emotion_graph.router)
 app.include_router(mypage.router)
+app.include_router(monitoring.router)
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"Hello": "World"}
@@ -0,0 +1,181 @@
+# backend/app/benchmarks/middleware_stack.py
+"""
+middleware 구성별 처리량 벤치마크: 기존 BaseHTTPMiddleware(캐시 헤더) vs pure ASGI middleware (app/middleware.py)
+같은 앱 / 같은 DB 에서 middleware 구성만 바꿔 가며 일기 / 그래프 조회 API 를 동시에 호출하고
+초당 요청 수 / 지연 시간 / 응답 크기(전송 byte)를 비교 (네트워크 없이 ASGI 로 직접 호출)
+    legacy     CORS + BaseHTTPMiddleware
+    asgi       TimingMiddleware + CORS + HeaderPolicyMiddleware
+    asgi+gzip  asgi + CompressionMiddleware (현재 app.py 구성)
+
+    # 임시 SQLite DB 에 샘플 데이터를 만들어 실행 (기본)
+    python -m app.benchmarks.middleware_stack --requests 2000 --concurrency 32
+
+    # 이미 데이터가 있는 DB 에서 실행 (--user 는 TB_user.user_id)
+    DATABASE_URL=mysql+pymysql://... python -m app.benchmarks.middleware_stack --existing-db --user plan_user_0
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from datetime import date, timedelta
+from statistics import mean, median
+from typing import Dict, List, Tuple
+
+import httpx
+from starlette.middleware import Middleware
+
+STACKS = ("legacy", "asgi", "asgi+gzip")
+
+
+async def legacy_cache_control_header(request, call_next):
+    ## app.py 에 있던 기존 middleware (비교 기준)
+    response = await call_next(request)
+    if request.url.path.startswith("/static/emoji/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+def install_stack(application, stack: str) -> None:
+    ## user_middleware 는 바깥쪽부터, middleware_stack 을 비우면 다음 요청 때 다시 조립됨
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from fastapi.middleware.cors import CORSMiddleware
+    from ..middleware import CompressionMiddleware, HeaderPolicyMiddleware, TimingMiddleware
+
+    cors = next(middleware for middleware in application.user_middleware if middleware.cls is CORSMiddleware)
+    if stack == "legacy":
+        middlewares = [cors, Middleware(BaseHTTPMiddleware, dispatch=legacy_cache_control_header)]
+    else:
+        middlewares = [Middleware(TimingMiddleware), cors]
+        if stack == "asgi+gzip":
+            middlewares.append(Middleware(CompressionMiddleware))
+        middlewares.append(Middleware(HeaderPolicyMiddleware))
+    application.user_middleware = middlewares
+    application.middleware_stack = None
+
+
+def benchmark_paths(diary_id: str, today: date) -> List[Tuple[str, str]]:
+    month = today.strftime("%Y-%m")
+    return [
+        ("diary main (month)", f"/api/diaries/main/{month}"),
+        ("diary detail", f"/api/diaries/detail/{diary_id}"),
+        ("diary timeline", "/api/diaries/timeline"),
+        ("graph monthly", f"/api/graphs/monthly/{month}"),
+        ("graph range (year)", f"/api/graphs/range?from={today - timedelta(days=364)}&to={today}&bucket=week"),
+    ]
+
+
+async def measure(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    wire_bytes: List[int] = []
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            wire_bytes.append(response.num_bytes_downloaded)
+            if response.status_code != 200:
+                raise SystemExit(f"{path}: HTTP {response.status_code} {response.text[:200]}")
+
+    ## warm-up (커넥션 / 월별 집계 캐시)
+    for _ in range(5):
+        await client.get(path)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50_ms": median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "bytes": mean(wire_bytes),
+    }
+
+
+async def run(login_id: str, total: int, concurrency: int) -> None:
+    from sqlalchemy import select
+    from .. import auth
+    from ..app import app as application
+    from ..database import AsyncSessionLocal, get_async_engine
+    from ..models.user import User
+    from ..models.diary import Diary
+
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        user_pk = await db.scalar(select(User.id).where(User.user_id == login_id))
+        if user_pk is None:
+            raise SystemExit(f"사용자를 찾을 수 없습니다: {login_id}")
+        diary_id = await db.scalar(
+            select(Diary.id).where(Diary.user_id == user_pk).order_by(Diary.diary_date.desc()).limit(1)
+        )
+
+    headers = {
+        "Authorization": f"Bearer {auth.create_access_token(data={'id': user_pk})}",
+        "Accept-Encoding": "gzip",
+    }
+    transport = httpx.ASGITransport(app=application)
+    try:
+        print(f"{'case':<22}{'stack':<11}{'req/s':>9}{'p50(ms)':>9}{'p95(ms)':>9}{'bytes':>9}")
+        for name, path in benchmark_paths(diary_id, date.today()):
+            results = {}
+            for stack in STACKS:
+                install_stack(application, stack)
+                async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", headers=headers) as client:
+                    results[stack] = stats = await measure(client, path, total, concurrency)
+                print(f"{name:<22}{stack:<11}{stats['rps']:>9.0f}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+                      f"{stats['bytes']:>9.0f}")
+            legacy = results["legacy"]
+            ## req/s 는 asgi 의 변화량, bytes 는 gzip 으로 줄어든 비율
+            print(f"{'':<22}{'-> change':<11}{results['asgi']['rps'] / legacy['rps'] - 1:>+9.0%}{'':>18}"
+                  f"{results['asgi+gzip']['bytes'] / legacy['bytes'] - 1:>+9.0%}")
+    finally:
+        await get_async_engine().dispose()
+
+
+def prepare_sample_db(url: str) -> None:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from ..database import Base
+    from ..query_plan_check import seed_sample_data
+
+    engine = create_engine(url)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            seed_sample_data(db)
+    finally:
+        engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="BaseHTTPMiddleware vs pure ASGI middleware 처리량 벤치마크")
+    parser.add_argument("--existing-db", action="store_true", help="DATABASE_URL 의 기존 DB 사용 (없으면 임시 SQLite)")
+    parser.add_argument("--user", default="plan_user_0", help="조회할 사용자 로그인 아이디")
+    parser.add_argument("--requests", type=int, default=2000, help="경로 / 구성마다 보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    ## 앱 모듈은 DATABASE_URL 을 import 시점에 읽으므로 환경 변수를 먼저 설정한 뒤 import
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    if args.existing_db:
+        asyncio.run(run(args.user, args.requests, args.concurrency))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = f"sqlite:///{os.path.join(tmp_dir, 'middleware_stack.db')}"
+        os.environ["DATABASE_URL"] = url
+        os.environ.pop("ASYNC_DATABASE_URL", None)
+        prepare_sample_db(url)
+        asyncio.run(run(args.user, args.requests, args.concurrency))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
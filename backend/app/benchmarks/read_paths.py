@@ -0,0 +1,175 @@
+# backend/app/benchmarks/read_paths.py
+"""
+조회 경로 벤치마크: ORM 엔티티 전체 로드 vs 컬럼 projection + NamedTuple (app/repositories)
+요청 하나에 해당하는 조회를 새 세션으로 반복 실행하고 지연 시간 / 요청당 최대 할당 메모리를 비교
+
+    # 임시 SQLite DB 에 샘플 데이터를 만들어 실행 (기본)
+    python -m app.benchmarks.read_paths --iterations 300
+
+    # 이미 데이터가 있는 DB 에서 실행 (--user 는 TB_user.user_id)
+    python -m app.benchmarks.read_paths --url sqlite:///./grooming.db --user plan_user_0
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+from statistics import mean, median
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from ..database import Base, to_async_url
+from ..models.user import User
+from ..models.diary import Diary
+from ..models.positiveDiary import PositiveDiary
+from ..models.positiveQuestion import PositiveQuestion
+from ..query_plan_check import seed_sample_data
+from ..repositories import diary_repository, positive_repository
+
+## 실제 일기와 비슷한 크기로 본문 / 코멘트 채우기 (샘플 데이터는 너무 짧음)
+SAMPLE_CONTENT = "오늘은 아침부터 비가 와서 기분이 가라앉았다. " * 40
+SAMPLE_COMMENT = "오늘 하루도 정말 고생 많았어. 네 마음을 천천히 돌아봐 줘서 고마워. " * 4
+
+Query = Callable[[AsyncSession, str], Awaitable[object]]
+
+
+def benchmark_cases(today: date) -> List[Tuple[str, Query, Query]]:
+    month_start = today.replace(day=1)
+    month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    two_weeks = today - timedelta(days=14)
+
+    async def orm_calendar(db, user_pk):
+        return (await db.execute(
+            select(Diary).where(Diary.user_id == user_pk, Diary.diary_date >= month_start,
+                                Diary.diary_date <= month_end).order_by(Diary.diary_date.asc())
+        )).scalars().all()
+
+    async def orm_scores(db, user_pk):
+        return (await db.execute(
+            select(Diary).where(Diary.user_id == user_pk, Diary.diary_date >= two_weeks)
+                .order_by(Diary.diary_date.desc())
+        )).scalars().all()
+
+    async def orm_emotions(db, user_pk):
+        return (await db.execute(
+            select(Diary).where(Diary.user_id == user_pk, Diary.diary_date >= month_start,
+                                Diary.diary_date <= month_end)
+        )).scalars().all()
+
+    async def orm_past_answers(db, user_pk):
+        return (await db.execute(
+            select(PositiveDiary, PositiveQuestion).where(PositiveDiary.user_id == user_pk)
+                .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id)
+                .order_by(PositiveDiary.diary_date.desc())
+        )).all()
+
+    return [
+        ("calendar (month)", orm_calendar,
+         lambda db, user_pk: diary_repository.list_calendar(db, user_pk, month_start, month_end)),
+        ("emotion score (14 days)", orm_scores,
+         lambda db, user_pk: diary_repository.list_scores_since(db, user_pk, two_weeks)),
+        ("graph aggregate (month)", orm_emotions,
+         lambda db, user_pk: diary_repository.list_emotions(db, user_pk, month_start, month_end)),
+        ("positive past answers", orm_past_answers,
+         lambda db, user_pk: positive_repository.list_past_answers(db, user_pk)),
+    ]
+
+
+async def measure(session_factory: async_sessionmaker, query: Query, user_pk: str,
+                  iterations: int) -> Dict[str, float]:
+    async def one_request():
+        async with session_factory() as db:
+            return await query(db, user_pk)
+
+    ## warm-up (커넥션 / 컴파일 캐시)
+    for _ in range(10):
+        await one_request()
+
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await one_request()
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+
+    ## 요청 하나의 최대 할당량 (tracemalloc 은 느리므로 지연 시간과 따로 측정)
+    peaks = []
+    tracemalloc.start()
+    for _ in range(min(iterations, 50)):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        rows = await one_request()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+        del rows
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "mean_us": mean(latencies),
+        "p50_us": median(latencies),
+        "p95_us": latencies[int(len(latencies) * 0.95) - 1],
+        "peak_kib": median(peaks) / 1024,
+    }
+
+
+def prepare_sample_db(url: str) -> None:
+    engine = create_engine(url)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            seed_sample_data(db)
+            db.execute(update(Diary).values(content=SAMPLE_CONTENT, ai_comment=SAMPLE_COMMENT))
+            db.commit()
+    finally:
+        engine.dispose()
+
+
+async def run(url: str, login_id: str, iterations: int) -> None:
+    engine = create_async_engine(to_async_url(url))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            user_pk = await db.scalar(select(User.id).where(User.user_id == login_id))
+        if user_pk is None:
+            raise SystemExit(f"사용자를 찾을 수 없습니다: {login_id}")
+
+        print(f"{'case':<26}{'mode':<11}{'mean(us)':>10}{'p50(us)':>10}{'p95(us)':>10}{'peak(KiB)':>11}")
+        for name, orm_query, projected_query in benchmark_cases(date.today()):
+            results = {}
+            for mode, query in (("orm", orm_query), ("projected", projected_query)):
+                results[mode] = stats = await measure(session_factory, query, user_pk, iterations)
+                print(f"{name:<26}{mode:<11}{stats['mean_us']:>10.0f}{stats['p50_us']:>10.0f}"
+                      f"{stats['p95_us']:>10.0f}{stats['peak_kib']:>11.1f}")
+            orm, projected = results["orm"], results["projected"]
+            print(f"{'':<26}{'-> saved':<11}{1 - projected['mean_us'] / orm['mean_us']:>10.0%}{'':>20}"
+                  f"{1 - projected['peak_kib'] / orm['peak_kib']:>11.0%}")
+    finally:
+        await engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ORM 엔티티 조회 vs 컬럼 projection 조회 벤치마크")
+    parser.add_argument("--url", help="DB URL (없으면 임시 SQLite 파일에 샘플 데이터 생성)")
+    parser.add_argument("--user", default="plan_user_0", help="조회할 사용자 로그인 아이디")
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    if args.url:
+        asyncio.run(run(args.url, args.user, args.iterations))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = f"sqlite:///{os.path.join(tmp_dir, 'read_paths.db')}"
+        prepare_sample_db(url)
+        asyncio.run(run(url, args.user, args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
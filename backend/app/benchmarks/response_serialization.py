@@ -0,0 +1,184 @@
+# backend/app/benchmarks/response_serialization.py
+"""
+응답 직렬화 micro 벤치마크 (app/responses.py)
+API 별로 실제와 같은 모양의 응답 데이터를 만들고, 핸들러 반환 이후의 처리 시간만 비교
+    validated  기존 경로: 핸들러에서 pydantic 객체 생성 -> FastAPI response_model 검증 / 직렬화 -> JSONResponse
+               (그래프 API 는 이미 dict 를 JSONResponse 로 바로 반환)
+    fast/json  trusted_response + FastJSONResponse (orjson 이 없을 때의 표준 json)
+    fast/orjson  trusted_response + FastJSONResponse (orjson 설치 시)
+모든 모드의 응답 byte 가 같은지도 확인
+
+    python -m app.benchmarks.response_serialization --iterations 2000
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+from datetime import date, datetime, timedelta
+from statistics import median
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from .. import responses
+from ..schemas import diarySchema
+from ..service.monthly_emotion_service import EMOTION_LABEL, EMOTION_LABEL_CHART
+
+Render = Callable[[], Awaitable[bytes]]
+
+
+def diary_payload(index: int, today: date) -> Dict[str, Any]:
+    ## create_diary_response() 와 같은 key
+    diary_id = f"00000000-0000-4000-8000-{index:012d}"
+    return {
+        "id": diary_id,
+        "user_id": "11111111-1111-4111-8111-111111111111",
+        "user_name": "홍길동",
+        "diary_date": today - timedelta(days=index),
+        "content": "오늘은 아침부터 비가 와서 기분이 가라앉았지만 저녁에 친구를 만나서 조금 나아졌다.",
+        "image_url": f"/static/images/u/{'a' * 64}.jpg",
+        "primary_image_url": f"/static/images/u/{'a' * 64}.jpg",
+        "thumbnail_image_url": f"/static/images/u/{'a' * 64}.thumb.webp",
+        "display_image_url": f"/static/images/u/{'a' * 64}.display.webp",
+        "emotion_score": 72.4,
+        "emotion_emoji": "happy.png",
+        "emotion_label": "Happy",
+        "overall_emotion_score": {"Angry": 0.02, "Fear": 0.05, "Happy": 0.72, "Tender": 0.13, "Sad": 0.08},
+        "ai_comment": "오늘 하루도 정말 고생 많았어. 네 마음을 천천히 돌아봐 줘서 고마워. " * 3,
+        "comment_status": "done",
+        "comment_profile": "balanced",
+        "created_at": datetime(2025, 11, 13, 21, 30, 15, 123456),
+    }
+
+
+def benchmark_cases(today: date) -> List[Tuple[str, Optional[Type[BaseModel]], Dict[str, Any]]]:
+    from ..routers.emotion_graph import render_monthly_state
+
+    month_start = today.replace(day=1)
+    days = [month_start + timedelta(days=offset) for offset in range(31)]
+    created = diary_payload(0, today)
+    del created["user_name"]
+
+    aggregate = SimpleNamespace(
+        diary_cnt=len(days),
+        emotion_cnt={label: 6 for label in EMOTION_LABEL},
+        daily_scores={day.strftime("%Y-%m-%d"): [0.1, 0.05, 0.6, 0.15, 0.1] for day in days},
+    )
+    weeks = [(today - timedelta(weeks=52 - offset)).strftime("%Y-%m-%d") for offset in range(53)]
+    graph_range = {
+        "start_date": weeks[0], "end_date": today.strftime("%Y-%m-%d"), "bucket": "week", "window": 4,
+        "diary_cnt": 300, "emotion_total": {label: 60 for label in EMOTION_LABEL_CHART},
+        "buckets": weeks, "diary_cnts": [6] * len(weeks),
+        "emotion_cnts": {label: [1] * len(weeks) for label in EMOTION_LABEL_CHART},
+        "mean_scores": {label: [0.123456] * len(weeks) for label in EMOTION_LABEL_CHART},
+        "moving_avg": {label: [0.234567] * len(weeks) for label in EMOTION_LABEL_CHART},
+    }
+
+    return [
+        ("diary create", diarySchema.DiaryResponse, created),
+        ("diary detail", diarySchema.DiaryDetailResponse, diary_payload(1, today)),
+        ("diary main (month)", diarySchema.MainPageResponse, {
+            "monthly_year": month_start.strftime("%Y-%m"), "monthly_name_en": month_start.strftime("%B"),
+            "user_emotion_score": 63.2,
+            "diaries": [{"id": f"diary-{day}", "diary_date": day, "emotion_emoji": "/static/emoji/happy.webp"}
+                        for day in days],
+        }),
+        ("diary timeline (20)", diarySchema.TimelineResponse, {
+            "diaries": [{"id": f"diary-{index}", "diary_date": today - timedelta(days=index),
+                         "primary_image_url": f"/static/images/u/{'b' * 64}.thumb.webp",
+                         "emotion_label": "Happy", "preview": "오늘은 아침부터 비가 와서 기분이 가라앉았지만 저녁에는"}
+                        for index in range(20)],
+            "next_cursor": "eyJkIjoiMjAyNS0xMS0wMSIsImlkIjoiZGlhcnkifQ",
+        }),
+        ("graph monthly", None, render_monthly_state(aggregate, month_start.strftime("%Y-%m"), days[0], days[-1])),
+        ("graph range (year)", None, graph_range),
+    ]
+
+
+def validated_render(model: Optional[Type[BaseModel]], content: Dict[str, Any]) -> Render:
+    ## FastAPI 가 response_model 이 있는 핸들러 반환값을 처리하는 방식 그대로
+    field = create_model_field(name="Response", type_=model, mode="serialization") if model else None
+
+    async def render() -> bytes:
+        if model is None:
+            return JSONResponse(content).body
+        returned = model.model_validate(content)
+        serialized = await serialize_response(field=field, response_content=returned)
+        return JSONResponse(serialized).body
+    return render
+
+
+def fast_render(model: Optional[Type[BaseModel]], content: Dict[str, Any]) -> Render:
+    async def render() -> bytes:
+        if model is None:
+            return responses.json_response(content).body
+        return responses.trusted_response(model, content).body
+    return render
+
+
+def use_orjson(enabled: bool) -> bool:
+    ## FastJSONResponse 의 orjson 사용 여부를 바꿈 (설치되어 있지 않으면 False)
+    responses._orjson_checked = False
+    responses._orjson = None
+    if enabled:
+        return responses._load_orjson() is not None
+    responses._orjson_checked = True
+    return True
+
+
+async def measure(render: Render, iterations: int) -> Tuple[float, bytes]:
+    body = await render()
+    for _ in range(min(iterations, 100)):
+        await render()
+    ## 작은 작업이므로 50번씩 묶어서 측정한 뒤 중앙값
+    samples = []
+    for _ in range(max(iterations // 50, 1)):
+        started = time.perf_counter()
+        for _ in range(50):
+            await render()
+        samples.append((time.perf_counter() - started) * 1_000_000 / 50)
+    return median(samples), body
+
+
+async def run(iterations: int) -> None:
+    responses.FAST_JSON_RESPONSES = True
+    modes: List[Tuple[str, Callable[..., Render], Optional[bool]]] = [
+        ("validated", validated_render, None),
+        ("fast/json", fast_render, False),
+    ]
+    if use_orjson(True):
+        modes.append(("fast/orjson", fast_render, True))
+    else:
+        print("orjson 이 설치되어 있지 않아 fast/orjson 은 건너뜁니다.")
+
+    print(f"{'case':<22}{'mode':<13}{'us/resp':>10}{'bytes':>8}{'speedup':>9}  same")
+    for name, model, content in benchmark_cases(date.today()):
+        baseline = None
+        baseline_body = b""
+        for mode, make_render, orjson_enabled in modes:
+            if orjson_enabled is not None:
+                use_orjson(orjson_enabled)
+            elapsed_us, body = await measure(make_render(model, content), iterations)
+            if baseline is None:
+                baseline, baseline_body = elapsed_us, body
+            print(f"{name:<22}{mode:<13}{elapsed_us:>10.1f}{len(body):>8}{baseline / elapsed_us:>8.1f}x  "
+                  f"{'yes' if body == baseline_body else 'NO'}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="response_model 검증 + JSONResponse vs trusted_response + orjson 벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args(argv)
+    ## 그래프 라우터 import 시 auth 모듈이 SECRET_KEY 를 요구함
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    asyncio.run(run(args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# backend/app/benchmarks/upload_writer.py
+"""
+업로드 저장 벤치마크: 기존 방식(run_in_threadpool + shutil.copyfileobj) vs upload_service.save_upload
+동시에 여러 업로드를 저장하면서 처리량 / 업로드당 지연 시간 / 이벤트 루프 지연을 비교하고,
+크기 제한을 넘는 업로드를 얼마나 빨리 거절하는지 측정
+
+    python -m app.benchmarks.upload_writer --size-mib 4 --concurrency 8 --rounds 5
+"""
+import os
+import sys
+import time
+import uuid
+import shutil
+import asyncio
+import argparse
+import tempfile
+from statistics import mean, median
+from typing import Awaitable, Callable, Dict, List
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import UploadFile
+
+from ..service import upload_service
+
+## multipart 파서가 만드는 것과 같은 spooled 파일 (1MiB 를 넘으면 디스크로 넘어감)
+_SPOOL_MAX_BYTES = 1024 * 1024
+_JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00"
+
+Writer = Callable[[UploadFile, str], Awaitable[int]]
+
+
+def make_upload(payload: bytes, known_size: bool = True) -> UploadFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    spooled.write(payload)
+    spooled.seek(0)
+    return UploadFile(spooled, size=len(payload) if known_size else None, filename="photo.jpg")
+
+
+async def legacy_writer(upload: UploadFile, dest_dir: str) -> int:
+    ## 변경 전 main_diary 의 저장 방식 (크기 제한 / 형식 확인 / 임시 파일 없음)
+    def write() -> int:
+        os.makedirs(dest_dir, exist_ok=True)
+        file_path = os.path.join(dest_dir, str(uuid.uuid4()) + ".jpg")
+        with open(file_path, "wb") as buffer:
+            shutil.copyfileobj(upload.file, buffer)
+        return os.path.getsize(file_path)
+    return await run_in_threadpool(write)
+
+
+async def streaming_writer(upload: UploadFile, dest_dir: str) -> int:
+    return (await upload_service.save_upload(upload, dest_dir)).size
+
+
+async def _loop_lag(stop: asyncio.Event, lags: List[float], interval: float = 0.001) -> None:
+    ## 이벤트 루프가 다른 요청을 처리하지 못하고 밀린 시간
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def measure(writer: Writer, payload: bytes, concurrency: int, rounds: int, dest_dir: str) -> Dict[str, float]:
+    latencies: List[float] = []
+    lags: List[float] = []
+
+    async def one_upload() -> None:
+        upload = make_upload(payload)
+        started = time.perf_counter()
+        try:
+            await writer(upload, dest_dir)
+        finally:
+            await upload.close()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    await one_upload()
+    latencies.clear()
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_loop_lag(stop, lags))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(one_upload() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    latencies.sort()
+    return {
+        "mib_per_s": len(payload) * concurrency * rounds / (1024 * 1024) / elapsed,
+        "mean_ms": mean(latencies),
+        "p50_ms": median(latencies),
+        "p95_ms": latencies[max(int(len(latencies) * 0.95) - 1, 0)],
+        "max_lag_ms": max(lags, default=0.0),
+    }
+
+
+async def measure_oversize(writer: Writer, payload: bytes, dest_dir: str) -> Dict[str, float]:
+    ## 크기를 모르는 업로드 (chunked 전송 등) 로 가정해 size=None 으로 만들어서 스트리밍 중 거절을 측정
+    upload = make_upload(payload, known_size=False)
+    started = time.perf_counter()
+    status_code = 200
+    try:
+        await writer(upload, dest_dir)
+    except HTTPException as e:
+        status_code = e.status_code
+    finally:
+        await upload.close()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    written = sum(entry.stat().st_size for entry in os.scandir(dest_dir)) if os.path.isdir(dest_dir) else 0
+    return {"status": status_code, "ms": elapsed_ms, "written_mib": written / (1024 * 1024)}
+
+
+async def run(size_mib: float, concurrency: int, rounds: int, limit_mib: float) -> None:
+    payload = _JPEG_HEADER + os.urandom(int(size_mib * 1024 * 1024) - len(_JPEG_HEADER))
+    oversize = _JPEG_HEADER + os.urandom(int(limit_mib * 4 * 1024 * 1024))
+    upload_service.UPLOAD_MAX_BYTES = int(limit_mib * 1024 * 1024)
+    writers = (("legacy", legacy_writer), ("streaming", streaming_writer))
+
+    print(f"upload {size_mib} MiB x {concurrency} concurrent x {rounds} rounds")
+    print(f"{'mode':<11}{'MiB/s':>9}{'mean(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'loop lag(ms)':>14}")
+    for mode, writer in writers:
+        with tempfile.TemporaryDirectory() as dest_dir:
+            stats = await measure(writer, payload, concurrency, rounds, dest_dir)
+        print(f"{mode:<11}{stats['mib_per_s']:>9.1f}{stats['mean_ms']:>10.1f}{stats['p50_ms']:>10.1f}"
+              f"{stats['p95_ms']:>10.1f}{stats['max_lag_ms']:>14.1f}")
+
+    print(f"\noversize upload {len(oversize) / (1024 * 1024):.0f} MiB (limit {limit_mib} MiB)")
+    print(f"{'mode':<11}{'status':>8}{'ms':>9}{'written(MiB)':>14}")
+    for mode, writer in writers:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stats = await measure_oversize(writer, oversize, os.path.join(tmp_dir, "user"))
+        print(f"{mode:<11}{stats['status']:>8}{stats['ms']:>9.1f}{stats['written_mib']:>14.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="업로드 저장 방식 벤치마크 (copyfileobj vs 스트리밍 저장)")
+    parser.add_argument("--size-mib", type=float, default=4, help="업로드 한 건의 크기")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시에 저장할 업로드 수")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--limit-mib", type=float, default=10, help="스트리밍 저장의 크기 제한")
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.size_mib, args.concurrency, args.rounds, args.limit_mib))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,9 @@ from .models.user import User
 from .models.diary import Diary
 from .models.positiveDiary import PositiveDiary
 from .models.positiveQuestion import PositiveQuestion
+from .models.userEmotionScore import UserEmotionScore
+from .models.monthlyEmotion import MonthlyEmotion
+from .database_migrate import run_migrations
 
 import sys
 import os
@@ -15,6 +18,9 @@ def create_tables():
     
     # 3. Base 객체를 사용하여 테이블을 생성합니다. (models.Base.metadata 오류 해결)
     Base.metadata.create_all(bind=engine)
+    
+    # 이미 있던 테이블에는 create_all 이 컬럼/인덱스를 추가하지 않으므로 migration 적용
+    run_migrations()
 
     # 작업 완료 메시지 출력
     print("테이블 생성 완료")
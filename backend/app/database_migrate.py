@@ -0,0 +1,129 @@
+# backend/app/database_migrate.py
+"""
+이미 만들어진 DB 를 현재 ORM 모델에 맞게 올리는 migration (여러 번 실행해도 안전)
+create_all 은 기존 테이블에 컬럼/인덱스를 추가하지 않으므로 변경 사항을 여기에 순서대로 추가
+
+    python -m app.database_migrate
+"""
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import Column, Table, inspect
+from sqlalchemy.engine import Connection, Engine
+
+from .database import engine
+from .models.diary import Diary
+from .models.positiveDiary import PositiveDiary
+from .models.positiveQuestion import PositiveQuestion
+
+
+def _add_column_if_missing(conn: Connection, table: Table, column: Column) -> bool:
+    existing = {col["name"] for col in inspect(conn).get_columns(table.name)}
+    if column.name in existing:
+        return False
+
+    column_type = column.type.compile(dialect=conn.dialect)
+    ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+    if column.server_default is not None:
+        ddl += f" DEFAULT '{column.server_default.arg}'"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    conn.exec_driver_sql(ddl)
+    return True
+
+
+def _create_indexes_if_missing(conn: Connection, table: Table) -> List[str]:
+    existing = {index["name"] for index in inspect(conn).get_indexes(table.name)}
+    created = []
+    for index in sorted(table.indexes, key=lambda item: item.name):
+        if index.name not in existing:
+            index.create(conn)
+            created.append(index.name)
+    return created
+
+
+def _drop_single_column_unique(conn: Connection, table: Table, column_name: str) -> List[str]:
+    """
+    예전 모델의 unique=True (diary_date 하나에만 걸린 unique 인덱스) 제거
+    SQLite 는 테이블 정의에 포함된 제약이라 지울 수 없으므로 경고만 출력
+    """
+    inspector = inspect(conn)
+    candidates = [
+        index["name"] for index in inspector.get_indexes(table.name)
+        if index.get("unique") and index["column_names"] == [column_name]
+    ]
+    candidates += [
+        constraint["name"] for constraint in inspector.get_unique_constraints(table.name)
+        if constraint["column_names"] == [column_name] and constraint["name"] not in candidates
+    ]
+
+    dropped = []
+    for name in candidates:
+        if conn.dialect.name == "sqlite" or not name:
+            print(f"WARNING: {table.name}.{column_name} unique constraint cannot be dropped on {conn.dialect.name}. Recreate the table to remove it.")
+            continue
+        if conn.dialect.name == "mysql":
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} DROP INDEX `{name}`")
+        else:
+            conn.exec_driver_sql(f"DROP INDEX {name}")
+        dropped.append(name)
+    return dropped
+
+
+## 1. AI 코멘트 비동기 생성 상태 / 디코딩 프로파일 컬럼
+def add_comment_columns(conn: Connection) -> List[str]:
+    table = Diary.__table__
+    return [
+        f"{table.name}.{name}"
+        for name in ("comment_status", "comment_profile")
+        if _add_column_if_missing(conn, table, table.c[name])
+    ]
+
+
+## 2. (user_id, diary_date) 복합 인덱스 + question_number 인덱스, 날짜 단독 unique 제거
+def add_user_date_indexes(conn: Connection) -> List[str]:
+    changes = []
+    for table in (Diary.__table__, PositiveDiary.__table__, PositiveQuestion.__table__):
+        changes += [f"+{name}" for name in _create_indexes_if_missing(conn, table)]
+    ## 복합 unique 인덱스가 생긴 뒤에 기존 unique 제거 (사용자별 하루 한 개 제약은 유지)
+    for table in (Diary.__table__, PositiveDiary.__table__):
+        changes += [f"-{table.name}.{name}" for name in _drop_single_column_unique(conn, table, "diary_date")]
+    return changes
+
+
+## 3. 업로드 이미지 WebP 파생본 URL 컬럼
+def add_image_variants_column(conn: Connection) -> List[str]:
+    table = Diary.__table__
+    if _add_column_if_missing(conn, table, table.c.image_variants):
+        return [f"{table.name}.image_variants"]
+    return []
+
+
+## 4. pending 코멘트 작업을 맡은 프로세스 (여러 worker 가 같은 작업을 다시 등록하지 않도록)
+def add_comment_claim_columns(conn: Connection) -> List[str]:
+    table = Diary.__table__
+    return [
+        f"{table.name}.{name}"
+        for name in ("comment_claimed_by", "comment_claimed_at")
+        if _add_column_if_missing(conn, table, table.c[name])
+    ]
+
+
+MIGRATIONS: List[Tuple[str, Callable[[Connection], List[str]]]] = [
+    ("add_comment_columns", add_comment_columns),
+    ("add_user_date_indexes", add_user_date_indexes),
+    ("add_image_variants_column", add_image_variants_column),
+    ("add_comment_claim_columns", add_comment_claim_columns),
+]
+
+
+def run_migrations(bind: Optional[Engine] = None) -> None:
+    for name, migration in MIGRATIONS:
+        with (bind or engine).begin() as conn:
+            changes = migration(conn)
+        if changes:
+            print(f"INFO: Migration '{name}' applied: {', '.join(changes)}")
+
+
+if __name__ == "__main__":
+    run_migrations()
+    print("마이그레이션 완료")
@@ -0,0 +1,181 @@
+# backend/app/http_cache.py
+"""
+HTTP 캐시 helper (ETag / Range) + 정적 파일 서빙 (/static/emoji, /static/images)
+- 이모지: 시작 시 전부 메모리에 올려 두고 요청마다 디스크를 읽지 않음
+         webp 를 받을 수 있는 클라이언트가 .png 를 요청하면 같은 이름의 .webp 를 응답 (Vary: Accept)
+- 업로드 이미지: 파일 이름이 내용 해시(예전 파일은 UUID)라 같은 URL 의 내용이 바뀌지 않으므로
+         immutable 캐시 + 파일 이름 기반 strong ETag (stat 값 해시 대신)
+둘 다 If-None-Match(304) / Range(206) 지원
+"""
+import os
+import re
+import hashlib
+import mimetypes
+from email.utils import formatdate
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_EMOJI_CACHE_CONTROL = os.getenv("STATIC_EMOJI_CACHE_CONTROL", IMMUTABLE_CACHE_CONTROL)
+## 메모리에 올릴 이모지 파일 확장자
+EMOJI_PRELOAD_EXTENSIONS = (".png", ".webp")
+
+## <sha256>.<ext>, <sha256>.<variant>.webp (image_store) 또는 예전 <uuid>.<ext>
+_CONTENT_NAME = re.compile(r"^(?P<stem>[0-9a-f]{64}(?:\.[a-z]+)?|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})\.[A-Za-z0-9]+$")
+_NOT_MODIFIED_HEADERS = ("cache-control", "etag", "vary", "last-modified")
+## 파이썬 버전에 따라 mimetypes 에 없는 형식
+_MEDIA_TYPES = {".webp": "image/webp", ".heic": "image/heic"}
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+def parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    "bytes=a-b" / "bytes=a-" / "bytes=-n" -> (start, end) (end 는 포함하지 않음)
+    여러 구간 / 해석할 수 없는 값은 None (전체 응답), 파일 범위를 벗어난 구간은 ValueError (416)
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+    if not first:
+        ## 마지막 n byte
+        length = int(last)
+        if length == 0:
+            raise ValueError("range not satisfiable")
+        return max(size - length, 0), size
+    start = int(first)
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    end = int(last) + 1 if last else size
+    if end <= start:
+        return None
+    return start, min(end, size)
+
+
+class CachedFile(NamedTuple):
+    body: bytes
+    media_type: str
+    etag: str
+    last_modified: str
+
+
+def cached_file_response(entry: CachedFile, scope: Scope, cache_control: str, vary: Optional[str] = None) -> Response:
+    ## 메모리에 있는 파일 응답 (304 / 206 / 416 / 200)
+    request_headers = Headers(scope=scope)
+    headers: Dict[str, str] = {
+        "cache-control": cache_control,
+        "etag": entry.etag,
+        "last-modified": entry.last_modified,
+        "accept-ranges": "bytes",
+    }
+    if vary:
+        headers["vary"] = vary
+    if etag_matches(request_headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers={key: headers[key] for key in _NOT_MODIFIED_HEADERS if key in headers})
+
+    body = entry.body
+    status_code = 200
+    range_header = request_headers.get("range")
+    if_range = request_headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == entry.etag):
+        try:
+            byte_range = parse_range(range_header, len(body))
+        except ValueError:
+            return Response(status_code=416, headers={"content-range": f"bytes */{len(body)}"})
+        if byte_range is not None:
+            start, end = byte_range
+            headers["content-range"] = f"bytes {start}-{end - 1}/{len(body)}"
+            body = body[start:end]
+            status_code = 206
+
+    if scope["method"] == "HEAD":
+        headers["content-length"] = str(len(body))
+        body = b""
+    return Response(body, status_code=status_code, headers=headers, media_type=entry.media_type)
+
+
+class PreloadedStaticFiles(StaticFiles):
+    """
+    작은 파일 묶음(이모지)을 메모리에 올려 두고 응답, 없는 파일만 기존 StaticFiles 로 처리
+    """
+
+    def __init__(self, *, directory: str, cache_control: str = STATIC_EMOJI_CACHE_CONTROL,
+                 extensions: Tuple[str, ...] = EMOJI_PRELOAD_EXTENSIONS):
+        super().__init__(directory=directory)
+        self.cache_control = cache_control
+        self.extensions = extensions
+        self.files: Dict[str, CachedFile] = {}
+        self.loaded = False
+
+    def load(self) -> int:
+        files: Dict[str, CachedFile] = {}
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if not name.lower().endswith(self.extensions) or not os.path.isfile(path):
+                continue
+            with open(path, "rb") as source:
+                body = source.read()
+            files[name] = CachedFile(
+                body=body,
+                media_type=_MEDIA_TYPES.get(os.path.splitext(name)[1].lower())
+                    or mimetypes.guess_type(name)[0] or "application/octet-stream",
+                etag=f'"{hashlib.sha1(body).hexdigest()}"',
+                last_modified=formatdate(os.stat(path).st_mtime, usegmt=True),
+            )
+        self.files = files
+        self.loaded = True
+        return len(files)
+
+    def _select(self, path: str, scope: Scope) -> Tuple[Optional[CachedFile], Optional[str]]:
+        ## .png 요청 + Accept: image/webp -> 같은 이름의 .webp (더 작음)
+        entry = self.files.get(path)
+        stem, extension = os.path.splitext(path)
+        webp = self.files.get(stem + ".webp") if extension.lower() == ".png" else None
+        if entry is None or webp is None:
+            return entry, None
+        if "image/webp" in Headers(scope=scope).get("accept", ""):
+            return webp, "Accept"
+        return entry, "Accept"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not self.loaded:
+            self.load()
+        if scope["method"] in ("GET", "HEAD"):
+            entry, vary = self._select(path, scope)
+            if entry is not None:
+                return cached_file_response(entry, scope, self.cache_control, vary)
+        return await super().get_response(path, scope)
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    내용이 바뀌지 않는 이름(내용 해시 / UUID)의 파일은 immutable 캐시 + 파일 이름 기반 strong ETag
+    Range / If-Range 는 FileResponse 가 처리
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        headers: Dict[str, str] = {}
+        match = _CONTENT_NAME.match(os.path.basename(full_path))
+        if match:
+            headers["etag"] = f'"{match.group("stem")}"'
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        response = FileResponse(full_path, status_code=status_code, headers=headers, stat_result=stat_result)
+        if etag_matches(Headers(scope=scope).get("if-none-match"), response.headers["etag"]):
+            return Response(status_code=304, headers={
+                key: response.headers[key] for key in _NOT_MODIFIED_HEADERS if key in response.headers
+            })
+        return response
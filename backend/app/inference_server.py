@@ -0,0 +1,83 @@
+# backend/app/inference_server.py
+"""
+KoBERT / KoBART 전용 추론 서버 (API 워커와 별도 프로세스로 실행)
+
+    uvicorn app.inference_server:app --uds /tmp/grooming-inference.sock
+    uvicorn app.inference_server:app --host 127.0.0.1 --port 8001
+
+API 서버에는 INFERENCE_SERVER_URL=unix:///tmp/grooming-inference.sock (또는 http://127.0.0.1:8001) 설정
+"""
+import json
+import queue
+import threading
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .schemas import inferenceSchema
+from .service import nlp_service, chatbot_service
+from .service.model_registry import registry
+
+
+def warm_up_models(app: FastAPI) -> None:
+    registry.warm_up("nlp")
+    registry.warm_up("chatbot")
+    app.state.models_ready = registry.all_warm(["nlp", "chatbot"])
+    print(f"INFO: Inference server warm-up finished: {registry.status()}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.models_ready = False
+    threading.Thread(target=warm_up_models, args=(app,), name="model-warmup", daemon=True).start()
+    yield
+
+
+app = FastAPI(lifespan=lifespan, title="Grooming Inference")
+
+## 감정 분석 (동시 요청은 nlp_service 배치 스케줄러에서 하나의 배치로 묶임)
+@app.post("/analyze", response_model=inferenceSchema.AnalyzeResponse)
+def analyze(request: inferenceSchema.AnalyzeRequest):
+    return nlp_service.get_emotion_analysis(request.text)
+
+## AI 코멘트 본문 생성
+@app.post("/comment", response_model=inferenceSchema.CommentResponse)
+def comment(request: inferenceSchema.CommentRequest):
+    comment_text, profile = chatbot_service.generate_comment(request.content, request.profile or chatbot_service.DEFAULT_PROFILE)
+    return {"comment": comment_text, "profile": profile}
+
+## AI 코멘트 본문 스트리밍 (한 줄에 JSON 하나: {"text": 조각} ... 마지막 {"comment": 최종 본문, "profile": 프로파일})
+@app.post("/comment/stream")
+def comment_stream(request: inferenceSchema.CommentRequest):
+    chunks: queue.Queue = queue.Queue()
+
+    def produce():
+        try:
+            profile = request.profile or chatbot_service.PROFILE_FAST
+            comment_text, used_profile = chatbot_service.stream_comment(request.content, chunks, profile)
+            chunks.put({"comment": comment_text, "profile": used_profile})
+        except Exception as e:
+            print(f"ERROR: Streaming comment generation failed: {e}")
+            chunks.put({"error": str(e)})
+        finally:
+            chunks.put(None)
+
+    def lines():
+        while True:
+            item = chunks.get()
+            if item is None:
+                break
+            if isinstance(item, str):
+                item = {"text": item}
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+
+    threading.Thread(target=produce, name="comment-stream", daemon=True).start()
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@app.get("/health/ready")
+def health_ready():
+    body = {"models": registry.status()}
+    if not app.state.models_ready or registry.any_failed():
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
@@ -0,0 +1,54 @@
+# backend/app/metrics.py
+
+import bisect
+import threading
+from typing import Dict, List, Sequence
+
+
+class Histogram:
+    """
+    누적 버킷 히스토그램 (Prometheus 방식의 le 버킷)
+    여러 스레드에서 observe 해도 안전하도록 lock 사용
+    """
+
+    def __init__(self, name: str, buckets: Sequence[float]):
+        self.name = name
+        self.buckets: List[float] = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        ## 누적 카운트로 변환
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, cnt in zip(self.buckets, counts):
+            running += cnt
+            cumulative[f"{bound:g}"] = running
+        cumulative["+Inf"] = running + counts[-1]
+
+        return {
+            "name": self.name,
+            "count": total_count,
+            "sum": round(total_sum, 6),
+            "buckets": cumulative,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
@@ -0,0 +1,266 @@
+# backend/app/middleware.py
+"""
+pure ASGI middleware (BaseHTTPMiddleware 대신 사용)
+BaseHTTPMiddleware 는 요청마다 task 와 메모리 stream 을 만들고 응답 body 를 한 번 더 옮겨 담으므로,
+여기서는 send 를 감싸서 http.response.start 헤더 / body 메시지만 고친다
+    HeaderPolicyMiddleware  경로 prefix 별 기본 응답 헤더 (응답에 이미 같은 헤더가 있으면 유지)
+    CompressionMiddleware   JSON / 텍스트 응답 gzip (이미지, SSE, 206 / 304 응답은 그대로, 강한 ETag 는 W/ 로)
+    TimingMiddleware        Server-Timing 헤더 + route 별 처리 시간 히스토그램 (/metrics/http)
+"""
+import os
+import time
+import zlib
+import threading
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .http_cache import STATIC_EMOJI_CACHE_CONTROL
+from .metrics import Histogram
+
+HTTP_GZIP_ENABLED = os.getenv("HTTP_GZIP_ENABLED", "1") == "1"
+## 이보다 작은 응답은 압축하지 않음 (헤더 / CPU 비용이 더 큼)
+HTTP_GZIP_MIN_BYTES = int(os.getenv("HTTP_GZIP_MIN_BYTES", 1024))
+HTTP_GZIP_LEVEL = int(os.getenv("HTTP_GZIP_LEVEL", 5))
+HTTP_SERVER_TIMING = os.getenv("HTTP_SERVER_TIMING", "1") == "1"
+
+## 압축할 Content-Type (PNG / WebP / JPEG 는 이미 압축된 형식, text/event-stream 은 이벤트마다 바로 보내야 함)
+COMPRESSIBLE_MEDIA_TYPES = frozenset({
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/plain",
+})
+_SKIP_COMPRESSION_STATUS = (204, 206, 304)
+_TIMING_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class HeaderRule(NamedTuple):
+    prefix: str
+    headers: Dict[str, str]
+
+
+## 성공 응답(< 400)에만 적용, 라우터 / 정적 파일이 직접 정한 값이 우선
+DEFAULT_HEADER_RULES = [
+    HeaderRule("/static/emoji/", {"cache-control": STATIC_EMOJI_CACHE_CONTROL}),
+    ## 사용자별 데이터는 공유 캐시(프록시 / CDN)에 남지 않도록
+    HeaderRule("/api/", {"cache-control": "private, no-cache"}),
+]
+
+
+class HeaderPolicyMiddleware:
+    def __init__(self, app: ASGIApp, rules: Sequence[HeaderRule] = DEFAULT_HEADER_RULES):
+        self.app = app
+        self.rules = list(rules)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        rules = [rule for rule in self.rules if path.startswith(rule.prefix)]
+        if not rules:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                for rule in rules:
+                    for name, value in rule.headers.items():
+                        headers.setdefault(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+def accepts_gzip(headers: Headers) -> bool:
+    for coding in headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            ## gzip;q=0 은 거부
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class CompressionMiddleware:
+    """
+    응답 시작 메시지를 첫 body 까지 붙잡아 두고 크기 / 형식을 보고 압축 여부를 결정
+    한 번에 오는 body 는 통째로, 여러 조각으로 오는 body 는 조각마다 이어서 압축
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = HTTP_GZIP_MIN_BYTES, level: int = HTTP_GZIP_LEVEL,
+                 media_types: Iterable[str] = COMPRESSIBLE_MEDIA_TYPES):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.media_types = frozenset(media_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not accepts_gzip(Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+        await _GzipResponder(self, send).run(self.app, scope, receive)
+
+    def compressible(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in _SKIP_COMPRESSION_STATUS:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        return media_type in self.media_types
+
+
+class _GzipResponder:
+    def __init__(self, middleware: CompressionMiddleware, send: Send):
+        self.middleware = middleware
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def run(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.send_compressed)
+
+    def _start_gzip(self) -> None:
+        ## wbits 31 = gzip 헤더 포함
+        self.compressor = zlib.compressobj(self.middleware.level, zlib.DEFLATED, 31)
+        headers = MutableHeaders(scope=self.start_message)
+        headers["content-encoding"] = "gzip"
+        headers.add_vary_header("Accept-Encoding")
+        ## 압축한 표현은 원래 응답과 byte 가 다르므로 강한 ETag 를 약한 ETag 로 (etag_matches 는 W/ 를 무시하고 비교)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+        ## 여러 조각으로 보내는 경우 길이를 미리 알 수 없음 (chunked)
+        if "content-length" in headers:
+            del headers["content-length"]
+
+    def _set_length(self, content_length: int) -> None:
+        MutableHeaders(scope=self.start_message)["content-length"] = str(content_length)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            if self.middleware.compressible(message):
+                self.start_message = message
+            else:
+                self.passthrough = True
+                await self.send(message)
+            return
+        if self.passthrough or message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body:
+                ## body 전체를 한 번에 받은 경우 (JSONResponse 등)
+                if len(body) < self.middleware.minimum_size:
+                    self.passthrough = True
+                    await self.send(self.start_message)
+                    await self.send(message)
+                    return
+                self._start_gzip()
+                compressed = self.compressor.compress(body) + self.compressor.flush()
+                self._set_length(len(compressed))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            self._start_gzip()
+            await self.send(self.start_message)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.flush()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class RequestMetrics:
+    """
+    route 경로(템플릿) 별 처리 시간 히스토그램
+    id 가 들어간 실제 경로 대신 /api/diaries/detail/{id} 처럼 템플릿으로 묶어서 개수가 늘어나지 않도록
+    """
+
+    def __init__(self, buckets: Sequence[float] = _TIMING_BUCKETS_MS):
+        self.buckets = list(buckets)
+        self._histograms: Dict[str, Histogram] = {}
+        self._status_counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, status_code: int, elapsed_ms: float) -> None:
+        histogram = self._histograms.get(route)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(route, Histogram(f"http {route}", self.buckets))
+                self._status_counts.setdefault(route, {})
+        status_class = f"{status_code // 100}xx"
+        with self._lock:
+            counts = self._status_counts[route]
+            counts[status_class] = counts.get(status_class, 0) + 1
+        histogram.observe(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            routes = sorted(self._histograms.items())
+            status_counts = {route: dict(counts) for route, counts in self._status_counts.items()}
+        return {
+            route: {"status": status_counts.get(route, {}), "latency_ms": histogram.snapshot()}
+            for route, histogram in routes
+        }
+
+
+request_metrics = RequestMetrics()
+
+
+def route_label(scope: Scope, root_path: str) -> str:
+    ## 라우팅이 끝난 scope 에서 route 템플릿 / mount 경로를 찾음
+    route = scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+    mounted = scope.get("root_path", "")
+    if mounted != root_path and mounted.startswith(root_path):
+        return mounted[len(root_path):] or "/"
+    return "unmatched"
+
+
+class TimingMiddleware:
+    """
+    응답 헤더를 보낼 때까지 걸린 시간은 Server-Timing 헤더로,
+    마지막 body 를 보낼 때까지 걸린 시간은 route 별 히스토그램으로 기록
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics,
+                 server_timing: bool = HTTP_SERVER_TIMING):
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        root_path = scope.get("root_path", "")
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    elapsed_ms = (time.perf_counter() - started) * 1000.0
+                    MutableHeaders(scope=message).append("server-timing", f"app;dur={elapsed_ms:.1f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.metrics.observe(route_label(scope, root_path), status_code,
+                                 (time.perf_counter() - started) * 1000.0)
@@ -1,4 +1,6 @@
 from .user import User
 from .diary import Diary
 from .positiveDiary import PositiveDiary
-from .positiveQuestion import PositiveQuestion
\ No newline at end of file
+from .positiveQuestion import PositiveQuestion
+from .userEmotionScore import UserEmotionScore
+from .monthlyEmotion import MonthlyEmotion
\ No newline at end of file
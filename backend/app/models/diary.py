@@ -1,7 +1,7 @@
 #backend/app/models/diary.py
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Date, Text, DateTime, Float, ForeignKey, JSON
+from sqlalchemy import Column, String, Date, Text, DateTime, Float, ForeignKey, JSON, Index
 from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -10,14 +10,19 @@ import uuid
 
 class Diary(Base):
     __tablename__="TB_diary"
+    ## 사용자별 날짜 조회(달력, 최근 14일, 월별 그래프)용 복합 인덱스 + 사용자별 하루 한 개 제약
+    __table_args__ = (
+        Index("ix_diary_user_date", "user_id", "diary_date", unique=True),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     
     user_id = Column(CHAR(36), ForeignKey("TB_user.id"), nullable=False)
     
-    diary_date = Column(Date, unique=True, nullable=False)
+    diary_date = Column(Date, nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(String(255), nullable=True)
+    image_variants = Column(JSON, nullable=True, comment="WebP 파생본 URL (thumb/display)")
     
     emotion_score = Column(Float, nullable=False)
     emotion_emoji = Column(String(255), nullable=False)
@@ -27,6 +32,28 @@ class Diary(Base):
 
     
     ai_comment = Column(Text, nullable=False, comment="AI 봇이 일기에 대해 남긴 코멘트") 
+    comment_status = Column(
+        String(20),
+        nullable=False,
+        default="done",
+        server_default="done",
+        comment="AI 코멘트 생성 상태 (pending/done/failed)"
+    )
+    comment_profile = Column(
+        String(20),
+        nullable=True,
+        comment="AI 코멘트 생성에 사용한 디코딩 프로파일 (quality/balanced/fast)"
+    )
+    comment_claimed_by = Column(
+        String(255),
+        nullable=True,
+        comment="pending 코멘트 작업을 맡은 프로세스 (host:pid)"
+    )
+    comment_claimed_at = Column(
+        DateTime,
+        nullable=True,
+        comment="코멘트 작업을 맡은 시각 (UTC)"
+    )
     
     created_at = Column(
         DateTime, 
@@ -0,0 +1,29 @@
+#backend/app/models/monthlyEmotion.py
+
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Date, DateTime, Integer, ForeignKey, JSON
+from sqlalchemy.dialects.mysql import CHAR
+from ..database import Base
+
+class MonthlyEmotion(Base):
+    __tablename__="TB_monthly_emotion"
+    
+    ## 사용자별 월간 감정 집계 (감정 그래프 API 용, 일기가 있는 달만 저장)
+    user_id = Column(CHAR(36), ForeignKey("TB_user.id"), primary_key=True)
+    month_start = Column(Date, primary_key=True, comment="해당 월 1일")
+    
+    diary_cnt = Column(Integer, nullable=False, default=0)
+    emotion_cnt = Column(JSON, nullable=False, comment="감정 라벨별 일기 개수")
+    daily_scores = Column(JSON, nullable=False, comment="날짜(YYYY-MM-DD) -> 차트 라벨 순서의 감정 점수 목록")
+    
+    etag = Column(String(64), nullable=False, comment="집계 내용 해시 (ETag / 304 응답용)")
+    
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    
+    def __repr__(self):
+        return f"<MonthlyEmotion(user_id='{self.user_id}', month='{self.month_start}', cnt={self.diary_cnt})>"
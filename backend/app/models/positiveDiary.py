@@ -1,6 +1,6 @@
 #backend/app/models/positiveDiary.py
 
-from sqlalchemy import Column, Date, Text, ForeignKey
+from sqlalchemy import Column, Date, Text, ForeignKey, Index
 from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -8,6 +8,10 @@ import uuid
 
 class PositiveDiary(Base):
     __tablename__ = "TB_positive_diary"
+    ## 사용자별 최근 답변 조회(diary_date desc)용 복합 인덱스 + 사용자별 하루 한 개 제약
+    __table_args__ = (
+        Index("ix_positive_diary_user_date", "user_id", "diary_date", unique=True),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     
@@ -16,7 +20,7 @@ class PositiveDiary(Base):
     
     answer = Column(Text, nullable=False)
     
-    diary_date = Column(Date, unique=True, nullable=False)
+    diary_date = Column(Date, nullable=False)
     
     user = relationship("User", back_populates="positive_diaries")
     question = relationship("PositiveQuestion", back_populates="positive_diary_entries")
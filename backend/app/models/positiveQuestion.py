@@ -1,6 +1,6 @@
 #backend/app/models/positiveQuestion.py
 
-from sqlalchemy import Column, Integer, Text, Identity
+from sqlalchemy import Column, Integer, Text, Identity, Index
 from sqlalchemy.dialects.mysql import CHAR
 from ..database import Base
 from sqlalchemy.orm import relationship
@@ -8,6 +8,10 @@ import uuid
 
 class PositiveQuestion(Base):
     __tablename__="TB_positive_question"
+    ## 다음 질문 조회 (question_number 로 검색)
+    __table_args__ = (
+        Index("ix_positive_question_number", "question_number", unique=True),
+    )
     
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     
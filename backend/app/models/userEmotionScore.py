@@ -0,0 +1,25 @@
+#backend/app/models/userEmotionScore.py
+
+from datetime import datetime, timezone
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey
+from sqlalchemy.dialects.mysql import CHAR
+from ..database import Base
+
+class UserEmotionScore(Base):
+    __tablename__="TB_user_emotion_score"
+    
+    ## 사용자당 한 행 (최근 14일 일기로 계산한 심리 건강 점수)
+    user_id = Column(CHAR(36), ForeignKey("TB_user.id"), primary_key=True)
+    
+    score = Column(Float, nullable=False, comment="0~100 감정 점수")
+    score_date = Column(Date, nullable=False, comment="점수 계산 기준일 (날짜가 바뀌면 시간 가중치가 달라지므로 다시 계산)")
+    
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    
+    def __repr__(self):
+        return f"<UserEmotionScore(user_id='{self.user_id}', score={self.score}, date='{self.score_date}')>"
@@ -0,0 +1,53 @@
+# backend/app/pagination.py
+"""
+diary_date 기준 keyset(cursor) 페이지네이션
+(user_id, diary_date) 가 unique 인덱스이므로 마지막 행의 날짜만으로 다음 페이지 위치가 정해짐
+OFFSET 대신 'diary_date < 커서 날짜' 범위 조건으로 인덱스를 타고 필요한 행만 읽음
+"""
+import os
+import base64
+import binascii
+from datetime import date
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+
+PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", 20))
+PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 100))
+
+## 커서 형식이 바뀌면 버전을 올려서 이전 커서를 거절
+_CURSOR_VERSION = "v1"
+
+Row = TypeVar("Row")
+
+
+def page_limit(limit: Optional[int]) -> int:
+    return min(limit or PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX)
+
+
+def encode_cursor(diary_date: date) -> str:
+    raw = f"{_CURSOR_VERSION}:{diary_date.isoformat()}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[date]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        version, value = raw.split(":", 1)
+        if version != _CURSOR_VERSION:
+            raise ValueError(version)
+        return date.fromisoformat(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 cursor 입니다.")
+
+
+def split_page(rows: Sequence[Row], limit: int,
+               key: Callable[[Row], date] = lambda row: row.diary_date) -> Tuple[List[Row], Optional[str]]:
+    """
+    limit + 1 개를 조회한 결과 -> (이번 페이지, 다음 페이지 cursor 또는 None)
+    """
+    page = list(rows[:limit])
+    next_cursor = encode_cursor(key(page[-1])) if len(rows) > limit else None
+    return page, next_cursor
@@ -0,0 +1,130 @@
+# backend/app/repositories/diary_repository.py
+"""
+일기 조회용 data-access 함수
+필요한 컬럼만 select 해서 NamedTuple 로 반환 (ORM 객체 / identity map 을 만들지 않음)
+*_query 함수는 실행하지 않은 select 문을 반환 (query_plan_check / 테스트가 같은 문장으로 EXPLAIN)
+"""
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.diary import Diary
+
+
+class CalendarRow(NamedTuple):
+    ## 달력 표시용
+    id: str
+    diary_date: date
+    emotion_label: str
+
+
+class TimelineRow(NamedTuple):
+    ## 일기 목록(타임라인)용, 본문은 앞부분만
+    id: str
+    diary_date: date
+    emotion_label: str
+    emotion_emoji: str
+    image_url: Optional[str]
+    image_variants: Optional[Dict[str, str]]
+    preview: str
+
+
+class ScoreRow(NamedTuple):
+    ## 감정 점수 계산용
+    diary_date: date
+    emotion_label: str
+    emotion_score: float
+
+
+class EmotionRow(NamedTuple):
+    ## 감정 그래프 / 기간별 추이용
+    diary_date: date
+    emotion_label: str
+    overall_emotion_score: Dict[str, Any]
+
+
+def calendar_query(user_pk: str, start_date: date, end_date: date) -> Select:
+    return select(Diary.id, Diary.diary_date, Diary.emotion_label).where(
+        Diary.user_id == user_pk,
+        Diary.diary_date >= start_date,
+        Diary.diary_date <= end_date
+    ).order_by(Diary.diary_date.asc())
+
+
+def scores_since_query(user_pk: str, since: date) -> Select:
+    ## 최신순
+    return select(Diary.diary_date, Diary.emotion_label, Diary.emotion_score).where(
+        Diary.user_id == user_pk,
+        Diary.diary_date >= since
+    ).order_by(Diary.diary_date.desc())
+
+
+def emotions_query(user_pk: str, start_date: date, end_date: date) -> Select:
+    return select(Diary.diary_date, Diary.emotion_label, Diary.overall_emotion_score).where(
+        Diary.user_id == user_pk,
+        Diary.diary_date >= start_date,
+        Diary.diary_date <= end_date
+    )
+
+
+def timeline_query(user_pk: str, before: Optional[date], limit: int, preview_chars: int) -> Select:
+    ## 최신순, before 가 있으면 그 날짜보다 이전 일기만 (cursor 페이지네이션)
+    query = (
+        select(Diary.id, Diary.diary_date, Diary.emotion_label, Diary.emotion_emoji, Diary.image_url,
+               Diary.image_variants, func.substr(Diary.content, 1, preview_chars))
+            .where(Diary.user_id == user_pk)
+            .order_by(Diary.diary_date.desc())
+            .limit(limit)
+    )
+    if before is not None:
+        query = query.where(Diary.diary_date < before)
+    return query
+
+
+def detail_query(user_pk: str, diary_id: str) -> Select:
+    ## 상세 조회 / 수정 대상 (ORM 엔티티)
+    return select(Diary).where(Diary.user_id == user_pk, Diary.id == diary_id)
+
+
+def comment_status_query(user_pk: str, diary_id: str) -> Select:
+    return select(Diary.id, Diary.ai_comment, Diary.comment_status, Diary.comment_profile).where(
+        Diary.user_id == user_pk,
+        Diary.id == diary_id
+    )
+
+
+def delete_target_query(user_pk: str, diary_id: str) -> Select:
+    ## 삭제 전 월간 집계 / 이미지 정리 대상 확인
+    return select(Diary.diary_date, Diary.image_url).where(Diary.user_id == user_pk, Diary.id == diary_id)
+
+
+def image_ref_count_query(user_pk: str, image_url: str) -> Select:
+    return select(func.count()).select_from(Diary).where(Diary.user_id == user_pk, Diary.image_url == image_url)
+
+
+def image_refs_query(user_pk: str) -> Select:
+    return select(Diary.image_url, Diary.image_variants).where(Diary.user_id == user_pk, Diary.image_url.isnot(None))
+
+
+async def list_calendar(db: AsyncSession, user_pk: str, start_date: date, end_date: date) -> List[CalendarRow]:
+    result = await db.execute(calendar_query(user_pk, start_date, end_date))
+    return list(map(CalendarRow._make, result))
+
+
+async def list_scores_since(db: AsyncSession, user_pk: str, since: date) -> List[ScoreRow]:
+    ## 최신순
+    result = await db.execute(scores_since_query(user_pk, since))
+    return list(map(ScoreRow._make, result))
+
+
+async def list_emotions(db: AsyncSession, user_pk: str, start_date: date, end_date: date) -> List[EmotionRow]:
+    result = await db.execute(emotions_query(user_pk, start_date, end_date))
+    return list(map(EmotionRow._make, result))
+
+
+async def list_timeline(db: AsyncSession, user_pk: str, before: Optional[date], limit: int,
+                        preview_chars: int) -> List[TimelineRow]:
+    result = await db.execute(timeline_query(user_pk, before, limit, preview_chars))
+    return list(map(TimelineRow._make, result))
@@ -0,0 +1,107 @@
+# backend/app/repositories/positive_repository.py
+"""
+긍정 일기 조회용 data-access 함수 (필요한 컬럼만 select -> NamedTuple)
+*_query 함수는 실행하지 않은 select 문을 반환 (query_plan_check / 테스트가 같은 문장으로 EXPLAIN)
+"""
+from datetime import date
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.positiveDiary import PositiveDiary
+from ..models.positiveQuestion import PositiveQuestion
+
+
+class LastAnswerRow(NamedTuple):
+    diary_date: date
+    question_id: str
+
+
+class UserAnswerRow(NamedTuple):
+    id: str
+    question_id: str
+    diary_date: date
+
+
+class PastAnswerRow(NamedTuple):
+    id: str
+    question_number: int
+    text: str
+
+
+class AnswerDetailRow(NamedTuple):
+    id: str
+    question_number: int
+    text: str
+    answer: str
+
+
+def last_answer_query(user_pk: str) -> Select:
+    return (
+        select(PositiveDiary.diary_date, PositiveDiary.question_id)
+            .where(PositiveDiary.user_id == user_pk)
+            .order_by(PositiveDiary.diary_date.desc())
+            .limit(1)
+    )
+
+
+def user_answers_query(user_pk: str, before: Optional[date] = None, limit: Optional[int] = None) -> Select:
+    ## 최신순 (첫 행이 마지막 답변, 질문 내용은 question_catalog 에서 채움)
+    # before: 이 날짜보다 이전 답변만 (cursor 페이지네이션)
+    query = (
+        select(PositiveDiary.id, PositiveDiary.question_id, PositiveDiary.diary_date)
+            .where(PositiveDiary.user_id == user_pk)
+            .order_by(PositiveDiary.diary_date.desc())
+    )
+    if before is not None:
+        query = query.where(PositiveDiary.diary_date < before)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def past_answers_query(user_pk: str) -> Select:
+    ## 최신순
+    return (
+        select(PositiveDiary.id, PositiveQuestion.question_number, PositiveQuestion.text)
+            .where(PositiveDiary.user_id == user_pk)
+            .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id)
+            .order_by(PositiveDiary.diary_date.desc())
+    )
+
+
+def answer_detail_query(user_pk: str, answer_id: str) -> Select:
+    return (
+        select(PositiveDiary.id, PositiveQuestion.question_number, PositiveQuestion.text, PositiveDiary.answer)
+            .where(PositiveDiary.id == answer_id, PositiveDiary.user_id == user_pk)
+            .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id)
+    )
+
+
+def answer_entry_query(user_pk: str, answer_id: str) -> Select:
+    ## 수정할 답변 + 질문 (ORM 엔티티)
+    return (
+        select(PositiveDiary, PositiveQuestion)
+            .where(PositiveDiary.id == answer_id, PositiveDiary.user_id == user_pk)
+            .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id)
+    )
+
+
+async def get_last_answer(db: AsyncSession, user_pk: str) -> Optional[LastAnswerRow]:
+    row = (await db.execute(last_answer_query(user_pk))).first()
+    return LastAnswerRow._make(row) if row else None
+
+
+async def list_user_answers(db: AsyncSession, user_pk: str, before: Optional[date] = None,
+                            limit: Optional[int] = None) -> List[UserAnswerRow]:
+    return list(map(UserAnswerRow._make, await db.execute(user_answers_query(user_pk, before, limit))))
+
+
+async def list_past_answers(db: AsyncSession, user_pk: str) -> List[PastAnswerRow]:
+    return list(map(PastAnswerRow._make, await db.execute(past_answers_query(user_pk))))
+
+
+async def get_answer_detail(db: AsyncSession, user_pk: str, answer_id: str) -> Optional[AnswerDetailRow]:
+    row = (await db.execute(answer_detail_query(user_pk, answer_id))).first()
+    return AnswerDetailRow._make(row) if row else None
@@ -0,0 +1,17 @@
+# backend/app/repositories/user_repository.py
+"""
+사용자 조회 select 문 (query_plan_check / 테스트가 같은 문장으로 EXPLAIN)
+"""
+from sqlalchemy import Select, select
+
+from ..models.user import User
+
+
+def principal_query(user_pk: str) -> Select:
+    ## JWT 검증 후 사용자 스냅샷 (principal_cache 에 없을 때)
+    return select(User.id, User.user_name, User.user_id, User.created_at).where(User.id == user_pk)
+
+
+def login_id_query(login_id: str) -> Select:
+    ## 아이디 중복 확인 / 회원가입 / 로그인
+    return select(User).where(User.user_id == login_id)
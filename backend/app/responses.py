@@ -0,0 +1,77 @@
+# backend/app/responses.py
+"""
+빠른 JSON 응답 모드 (FAST_JSON_RESPONSES=1, 기본은 꺼짐)
+FastAPI 는 핸들러가 pydantic 객체 / dict 를 반환하면 response_model 로 한 번 더 검증하고
+jsonable_encoder 를 거쳐 json.dumps 로 직렬화하므로, 서버가 직접 만든 데이터는 같은 검사를 두 번 하게 됨
+    - 기본 응답 클래스를 orjson 기반 FastJSONResponse 로 교체 (orjson 이 없으면 표준 json 으로 대체)
+    - trusted_response(): DB / 집계에서 만든 dict 를 검증 없이 바로 응답 (response_model 은 문서용으로만 사용)
+모드를 끄면 trusted_response() 는 예전처럼 pydantic 객체를 반환하고 응답 클래스도 JSONResponse 그대로
+"""
+import os
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Mapping, Optional, Type
+
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "0") == "1"
+
+_orjson = None
+_orjson_checked = False
+
+
+def _load_orjson():
+    ## orjson 은 선택 의존성 (requirements.txt 8번), 처음 직렬화할 때 한 번만 import
+    global _orjson, _orjson_checked
+    if not _orjson_checked:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            print("WARNING: orjson is not installed. FastJSONResponse falls back to the standard json module.")
+        _orjson_checked = True
+    return _orjson
+
+
+def _json_default(value: Any) -> Any:
+    ## orjson / pydantic 과 같은 형식 (YYYY-MM-DD, ISO 8601)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 으로 직렬화 (date / datetime 도 바로 처리, 한글은 escape 하지 않음)
+    """
+
+    def render(self, content: Any) -> bytes:
+        orjson = _load_orjson()
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
+
+
+def default_response_class() -> Type[JSONResponse]:
+    return FastJSONResponse if FAST_JSON_RESPONSES else JSONResponse
+
+
+def json_response(content: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> JSONResponse:
+    ## 이미 JSON 형태로 만든 dict 응답 (모드에 따라 응답 클래스만 바뀜)
+    return default_response_class()(content, status_code=status_code, headers=headers)
+
+
+def trusted_response(model: Type[BaseModel], content: Dict[str, Any], status_code: int = 200) -> Any:
+    """
+    서버가 만든 dict 를 model 형태로 응답
+    빠른 모드에서는 model 에 있는 key 만 골라 검증 없이 바로 직렬화 (중첩 항목도 dict 로 넘길 것),
+    꺼져 있으면 예전처럼 model 객체를 반환해서 FastAPI 가 response_model 로 검증
+    """
+    if not FAST_JSON_RESPONSES:
+        return model.model_validate(content)
+    return FastJSONResponse(
+        {name: content[name] for name in model.model_fields if name in content}, status_code=status_code
+    )
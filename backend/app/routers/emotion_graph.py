@@ -1,32 +1,76 @@
 # backend/app/router/emotion_graph.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Header
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional
 import calendar
+import os
 
-from ..models.user import User 
-from ..models.diary import Diary 
 from .. import auth
 from ..schemas import graphSchema
-from ..database import get_db
+from ..database import get_async_db
+from ..http_cache import etag_matches
+from ..responses import json_response
+from ..service.principal_cache import UserPrincipal
+from ..service import monthly_emotion_service, emotion_trend_service
+from ..service.monthly_emotion_service import EMOTION_LABEL_CHART, EMOTION_LABEL
 from ..routers.main_diary import get_current_active_user
 
+## 지난 달 그래프의 브라우저 캐시 시간 (초)
+# 지난 날짜 일기도 작성/수정할 수 있으므로 기본은 매번 ETag 로 재검증 (변경 없으면 304)
+GRAPH_PAST_MONTH_MAX_AGE = int(os.getenv("GRAPH_PAST_MONTH_MAX_AGE", 0))
+## 기간별 추이 API 의 최대 조회 기간 (일)
+GRAPH_RANGE_MAX_DAYS = int(os.getenv("GRAPH_RANGE_MAX_DAYS", 3660))
+
 router = APIRouter(
     prefix="/api/graphs", 
     tags=["Graph"],
     responses={404:{"description": "Not found"}}
 )
 
-EMOTION_LABEL_CHART = ["Angry", "Fear", "Happy", "Tender", "Sad"]
-EMOTION_LABEL = EMOTION_LABEL_CHART + ["Neutral"]
+## 월간 집계 -> 응답 JSON (pydantic 객체를 만들지 않고 dict 로 바로 구성)
+def render_monthly_state(aggregate, monthly_year: str, start_date: date, end_date: date) -> Dict[str, Any]:
+    total_diary_cnt = aggregate.diary_cnt
+    
+    ## 파이 차트 데이터
+    emotion_state = []
+    if total_diary_cnt > 0:
+        for label in EMOTION_LABEL:
+            cnt = aggregate.emotion_cnt.get(label, 0)
+            emoji = "default" if label == "Neutral" else label.lower()
+            emotion_state.append({
+                "emotion_label": label,
+                "emotion_emoji": f"/static/emoji/{emoji}.png",
+                "emotion_cnt": cnt,
+                "emotion_percent": round((cnt / total_diary_cnt) * 100, 1),
+            })
+    emotion_state.sort(key=lambda item: item["emotion_cnt"], reverse=True)
+    
+    ## 일별 추이 그래프 데이터 (일기가 없는 날 => 기본 점수: 0.0)
+    zero_scores = [0.0] * len(EMOTION_LABEL_CHART)
+    daily_emotion_scores = []
+    current_date = start_date
+    while current_date <= end_date:
+        day = current_date.strftime("%Y-%m-%d")
+        scores = aggregate.daily_scores.get(day, zero_scores)
+        daily_emotion_scores.append({"date": day, **dict(zip(EMOTION_LABEL_CHART, scores))})
+        current_date += timedelta(days=1)
+    
+    return {
+        "monthly_year": monthly_year,
+        "diary_cnt": total_diary_cnt,
+        "emotion_state": emotion_state,
+        "daily_emotion_scores": daily_emotion_scores
+    }
 
 @router.get("/monthly/{monthly_year}", response_model=graphSchema.MonthlyStateResponse)
-def get_monthly_emotion(
+async def get_monthly_emotion(
     monthly_year: str = Path(..., description="조회 날짜(YYYY-MM)", examples=["2025-11"]),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_id = current_user.id
     
@@ -38,77 +82,36 @@ def get_monthly_emotion(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="날짜 형식이 유효하지 않습니다.(YYYY-MM)")
 
-    diaries_in_month = db.query(Diary)\
-        .filter(
-            Diary.user_id == user_id,
-            Diary.diary_date >= start_date,
-            Diary.diary_date <= end_date
-        ).all()
-    
-    diary_map: Dict[date, Diary] = {diary.diary_date: diary for diary in diaries_in_month}
-    
-    ## 파이 차트 데이터
-    total_diary_cnt = len(diaries_in_month)
+    aggregate = await monthly_emotion_service.get_month(db, user_id, start_date)
     
-    emotion_cnt = {label: 0 for label in EMOTION_LABEL}
+    etag = f'"{aggregate.etag}"'
+    if end_date < date.today() and GRAPH_PAST_MONTH_MAX_AGE > 0:
+        cache_control = f"private, max-age={GRAPH_PAST_MONTH_MAX_AGE}"
+    else:
+        cache_control = "private, no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
     
-    for diary in diaries_in_month:
-        label = diary.emotion_label
-        emotion_cnt[label] += 1
-        
-    emotion_state = []
-    if total_diary_cnt > 0:
-        for label in EMOTION_LABEL:
-            cnt = emotion_cnt[label]
-            
-            percent = round((cnt / total_diary_cnt) * 100, 1)
-            
-            if (label == "Neutral"):
-                emotion_state.append(graphSchema.EmotionStateItem(
-                emotion_label=label,
-                emotion_emoji=f"/static/emoji/default.png",
-                emotion_cnt=cnt,
-                emotion_percent=percent
-            ))
-            else:
-                emotion_state.append(graphSchema.EmotionStateItem(
-                    emotion_label=label,
-                    emotion_emoji=f"/static/emoji/{label.lower()}.png",
-                    emotion_cnt=cnt,
-                    emotion_percent=percent
-                ))
-    emotion_state.sort(key=lambda item: item.emotion_cnt, reverse=True)
-    
-    ## 일별 추이 그래프 데이터
-    daily_emotion_scores: List[graphSchema.DailyEmotionScore] = []
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
-    current_date = start_date
-    
-    while current_date <= end_date:
-        ## 일기가 없는 날 => 기본 점수: 0.0
-        scores = {label: 0.0 for label in EMOTION_LABEL_CHART}
-        
-        ## 해당 날짜 일기 유무 확인
-        if current_date in diary_map:
-            diary = diary_map[current_date]
-            db_scores: Dict[str, float] = diary.overall_emotion_score
-            
-            for label in EMOTION_LABEL_CHART:
-                scores[label] = round(db_scores.get(label, 0.0), 4)
+    return json_response(render_monthly_state(aggregate, monthly_year, start_date, end_date), headers=headers)
 
-        daily_emotion_scores.append(graphSchema.DailyEmotionScore(
-            date=current_date.strftime("%Y-%m-%d"),
-            **scores
-        ))
-        
-        current_date += timedelta(days=1)
-    
-    return {
-        "monthly_year": monthly_year,
-        "diary_cnt": total_diary_cnt,
-        "emotion_state": emotion_state,
-        "daily_emotion_scores": daily_emotion_scores
-    }
-    
+## 기간별 감정 추이 (연간 리뷰 등, 한 번의 조회로 일/주/월 구간 집계)
+@router.get("/range", response_model=graphSchema.RangeTrendResponse)
+async def get_range_emotion(
+    from_date: date = Query(..., alias="from", description="조회 시작 날짜(YYYY-MM-DD)", examples=["2025-01-01"]),
+    to_date: date = Query(..., alias="to", description="조회 끝 날짜(YYYY-MM-DD)", examples=["2025-12-31"]),
+    bucket: str = Query("day", pattern="^(day|week|month)$", description="집계 단위 (day/week/month)"),
+    window: Optional[int] = Query(None, ge=1, le=366, description="이동 평균 구간 수 (기본: day 7, week 4, month 3)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
+):
+    if from_date > to_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="시작 날짜가 끝 날짜보다 늦습니다.")
+    if (to_date - from_date).days >= GRAPH_RANGE_MAX_DAYS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"조회 기간은 최대 {GRAPH_RANGE_MAX_DAYS}일입니다.")
     
-    
\ No newline at end of file
+    result = await emotion_trend_service.get_range(
+        db, current_user.id, from_date, to_date, bucket, window or emotion_trend_service.DEFAULT_WINDOW[bucket]
+    )
+    return json_response(result)
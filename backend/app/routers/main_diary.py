@@ -1,71 +1,72 @@
 # backend/app/router/main_diary.py
-from fastapi import APIRouter, Depends, HTTPException, status, Path, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from PIL import Image
 
 import os
-import uuid
-import shutil
 import locale
 import io
 import base64
-import random
-import re
+import time
+import json
+import asyncio
 
 from ..models.user import User 
 from ..models.diary import Diary 
 from .. import auth
 from ..schemas import diarySchema, userSchema
-from ..database import get_db
-from ..service import nlp_service, chatbot_service
+from ..database import get_async_db
+from ..service import nlp_service, chatbot_service, comment_jobs, inference_client, emotion_score_service, monthly_emotion_service, image_store
+from ..service.principal_cache import UserPrincipal, principal_cache
+from ..repositories import diary_repository, user_repository
+from ..pagination import PAGE_SIZE_MAX, page_limit, decode_cursor, split_page
+from ..responses import trusted_response
 import calendar
 
-from ..config.templates import (
-    INTRO_TEMPLATES, 
-    WARMTH_TEMPLATES,
-)
-
-UPLOAD_DIR = os.getenv("UPLOAD_DIR", "app/images")
+## 타임라인에 보여줄 일기 내용 길이
+TIMELINE_PREVIEW_CHARS = int(os.getenv("TIMELINE_PREVIEW_CHARS", 50))
 EMOJI_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "emoji")
 
-try:
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-except FileExistsError:
-    pass
-
 router = APIRouter(
     prefix="/api/diaries", 
     tags=["Diaries"],
     responses={404:{"description": "Not found"}}
 )
 
-## JWT 토큰 검증 후 DB에서 User 객체 가져옴
-def get_current_active_user(user_id: str = Depends(auth.get_current_user), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+## JWT 토큰 검증 후 사용자 스냅샷 반환 (캐시에 없을 때만 DB 조회)
+async def get_current_active_user(user_id: str = Depends(auth.get_current_user), db: AsyncSession = Depends(get_async_db)) -> UserPrincipal:
+    principal = await principal_cache.get_async(user_id)
+    if principal is not None:
+        return principal
+
+    row = (await db.execute(user_repository.principal_query(user_id))).first()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다.")
-    return user
 
-## 감정 중요도 가중치 
-EMOTION_WEIGHTS = {
-    "Angry": -3.0, # 가장 부정
-    "Fear": -4.0,
-    "Sad": -5.0,
-    "Happy": 5.0,  # 가장 긍정
-    "Tender": 3.0,
-    "Neutral": 1.0, # 중립
-}
+    principal = UserPrincipal(*row)
+    await principal_cache.put_async(principal)
+    return principal
 
 ## helper function
 def create_diary_response(diary: Diary, user_name: str) -> dict:
     
-    if diary.image_url: ## 사용자가 이미지를 첨부했을 경우
-        primary_url = diary.image_url
+    ## 첨부 이미지 URL (s3 저장소면 presigned / CDN 주소)
+    image_url = image_store.public_url(diary.image_url)
+    if image_url: ## 사용자가 이미지를 첨부했을 경우
+        primary_url = image_url
     else: ## 이미지를 첨부하지 않았을 경우
         primary_url = f"/static/emoji/{diary.emotion_emoji}"
     
+    ## WebP 파생본 (파생본이 없는 예전 일기 / 이모지는 최종 이미지 그대로)
+    image_variants = diary.image_variants or {}
+    thumbnail_url = image_store.public_url(image_variants.get("thumb")) or primary_url
+    display_url = image_store.public_url(image_variants.get("display")) or primary_url
+    
     ## 감정 점수 (0~100) 변환
     emotion_score_100 = round(diary.emotion_score * 100, 1)
     
@@ -75,114 +76,49 @@ def create_diary_response(diary: Diary, user_name: str) -> dict:
         "user_name": user_name,
         "diary_date": diary.diary_date,
         "content": diary.content,
-        "image_url": diary.image_url,
+        "image_url": image_url,
         
         "primary_image_url": primary_url, ## 최종 이미지
+        "thumbnail_image_url": thumbnail_url, ## 목록용 작은 이미지
+        "display_image_url": display_url, ## 상세 화면용 이미지
         "emotion_score": emotion_score_100, ## 최대 100점으로 변환한 감정 점수
         "emotion_emoji": diary.emotion_emoji,
         "emotion_label": diary.emotion_label,
         "overall_emotion_score": diary.overall_emotion_score,
         "ai_comment": diary.ai_comment,
+        "comment_status": diary.comment_status,
+        "comment_profile": diary.comment_profile,
         
         "created_at": diary.created_at,
     }
     
-## ai봇 코멘트 생성
-def create_ai_response(content: str, user_name: str, emotion_label: str) -> str:
-    ai_comment_raw = f"오늘 {user_name}님은 여러가지 감정이 섞인 하루를 보냈군요"
+## ai봇 코멘트 생성 (COMMENT_JOBS_ENABLED=0 일 때 호출, 모델 추론이므로 run_in_threadpool 로 호출)
+# (최종 코멘트, 본문을 실제로 만든 프로파일) 반환
+def create_ai_response(content: str, user_name: str, emotion_label: str) -> Tuple[str, Optional[str]]:
+    ai_comment_raw = comment_jobs.default_comment(user_name)
     
     try:
-        cleaned_content = re.sub(r'[^\w\s\.\,\!\?]', '', content)
-        cleaned_content = ' '.join(cleaned_content.split()).strip()
-        
-        ai_comment_raw = chatbot_service.generate_comment(cleaned_content)
+        ai_comment_raw, profile = comment_jobs.generate_now(content)
         
-        intro_template_list = list(INTRO_TEMPLATES)
-        selected_intro_template = random.choice(intro_template_list)
-        intro_phrase = f"{user_name}{selected_intro_template}"
+        final_comment = comment_jobs.compose_comment(ai_comment_raw, user_name, emotion_label)
         
-        emotion_key = emotion_label
-        warmth_templates = WARMTH_TEMPLATES.get(emotion_key, WARMTH_TEMPLATES["Natural"])
-        warmth_phrase = random.choice(warmth_templates)
-        
-        final_comment = (
-            f"{intro_phrase} {ai_comment_raw} {warmth_phrase}"
-        )
-        
-        return final_comment
+        return final_comment, profile
         
     except Exception as e:
         # AI 챗봇 서비스 실패 시 기본 코멘트 반환
         print(f"Chatbot Service Failed: {e}")
-        return ai_comment_raw
+        return ai_comment_raw, None
     
 
 ## 사용자 감정 점수 계산 helper function (시간 가중치 적용)
-def calculate_emotion_score(diaries: List[Any], weights: Dict[str, float]) -> float:
-
-    current_score = 100.0  # 심리 건강 기준점 
-    
-    if not diaries:
-        return current_score 
-    
-    DAYS_WINDOW = 14 
-    # 일기가 최신순으로 정렬되어 있다고 가정
-    today = date.today()
-    
-    # 2. 총 일기 수 
-    total_cnt = len(diaries)
-    
-    # 3. 최대/최소 변동 폭 설정
-    MAX_SCORE_CHANGE_PER_DIARY = 5.0 
-    MAX_TOTAL_CHANGE = total_cnt * MAX_SCORE_CHANGE_PER_DIARY 
-    
-    # 4. 점수 조정 누적
-    total_adjustment = 0.0
-    
-    for diary in diaries:
-        label = diary.emotion_label
-        
-        weight = weights.get(label) 
-        
-        if weight is not None:
-            
-            days_ago = (today - diary.diary_date).days
-            
-            # 최근일수록 1.0에 가깝고, 14일 전일수록 0.1(최소값)에 가까워짐
-            decay_factor = max(0.1, (DAYS_WINDOW - days_ago) / DAYS_WINDOW)
-            
-            # 4-2. 조정 값 계산: 시간 가중치 적용
-            # 조정 값: (가중치 * 감정 확률) * 시간 가중치
-            adjustment_value = (weight * diary.emotion_score) * decay_factor
-            total_adjustment += adjustment_value
-            
-    # 5. 최대/최소 변동 폭 적용하여 최종 점수 계산 
-    if abs(total_adjustment) > MAX_TOTAL_CHANGE:
-        if total_adjustment > 0:
-            final_adjustment = MAX_TOTAL_CHANGE
-        else:
-            final_adjustment = -MAX_TOTAL_CHANGE
-    else:
-        final_adjustment = total_adjustment
-        
-    # 시작 점수에 최종 조정 값 반영
-    final_score = current_score + final_adjustment
-    
-    # 6. 최종 점수를 0점에서 100점 사이로 제한 및 반올림
-    user_emotion_score = round(max(0.0, min(100.0, final_score)), 1)
-    
-    return user_emotion_score
-    
 # 전체 일기 조회
 @router.get("/main/{monthly_year}", response_model=diarySchema.MainPageResponse)
-def get_all_diaries(
+async def get_all_diaries(
     monthly_year: str = Path(..., description="조회 날짜(YYYY-MM)", examples=["2025-11"]),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_id = current_user.id
-    today = date.today()
-    two_weeks = today - timedelta(days=14)
     
     try:
         current_year = int(monthly_year.split('-')[0])
@@ -197,65 +133,77 @@ def get_all_diaries(
     target_date = date(current_year, current_month, 1)
     monthly_name_en = target_date.strftime("%B")
    
-    ## 감정 점수 계산 용 일기 데이터 조회 (최근 이주 이내 데이터)
-    recent_diaries = db.query(Diary).filter(Diary.user_id == user_id, Diary.diary_date >= two_weeks)\
-        .order_by(Diary.diary_date.desc()).all()
-       
-    user_emotion_score = calculate_emotion_score(diaries=recent_diaries, weights=EMOTION_WEIGHTS)
+    ## 감정 점수 (최근 이주 일기로 미리 계산해 둔 값)
+    user_emotion_score = await emotion_score_service.get_user_score(db, user_id)
 
     ## 달력 표시용 데이터
-    all_diaries = db.query(Diary).filter(Diary.user_id == user_id,
-                                         Diary.diary_date >= start_of_month,
-                                         Diary.diary_date <= end_of_month).order_by(Diary.diary_date.asc()).all()
+    all_diaries = await diary_repository.list_calendar(db, user_id, start_of_month, end_of_month)
 
     calendar_diaries = []
 
     for entry in all_diaries:
         web_name = entry.emotion_label.lower()
         
-        calendar_diaries.append(diarySchema.CalendarResponse(
-            id=entry.id,
-            diary_date=entry.diary_date,
-            emotion_emoji=f"/static/emoji/{web_name}.webp"
-        ))
+        calendar_diaries.append({
+            "id": entry.id,
+            "diary_date": entry.diary_date,
+            "emotion_emoji": f"/static/emoji/{web_name}.webp"
+        })
         
-    return {
+    return trusted_response(diarySchema.MainPageResponse, {
         "monthly_year": monthly_year,
         "monthly_name_en": monthly_name_en,
         "user_emotion_score": user_emotion_score,
         "diaries": calendar_diaries
-    }
-    
-# 일기 Create
-@router.post("/new", response_model=diarySchema.DiaryResponse, status_code=status.HTTP_201_CREATED)
-def create_diary(
-    diary_date: date = Form(..., description="일기 작성 날짜(YYYY-MM-DD)", example="2025-11-13"),
-    content: str = Form(..., max_length=100, description="일기 내용(최대 100자)"),
-    image_file: Optional[UploadFile] = File(None, description="첨부 이미지 파일"), 
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user) ## JWT 인증 적용
+    })
+    
+## 일기 타임라인 (최신순, cursor 페이지네이션)
+@router.get("/timeline", response_model=diarySchema.TimelineResponse)
+async def get_diary_timeline(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 첫 페이지)"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX, description="페이지 크기"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
+    limit = page_limit(limit)
+    rows = await diary_repository.list_timeline(
+        db, current_user.id, decode_cursor(cursor), limit + 1, TIMELINE_PREVIEW_CHARS
+    )
+    rows, next_cursor = split_page(rows, limit)
+    
+    return trusted_response(diarySchema.TimelineResponse, {
+        "diaries": [
+            {
+                "id": row.id,
+                "diary_date": row.diary_date,
+                "primary_image_url": image_store.public_url((row.image_variants or {}).get("thumb") or row.image_url)
+                    or f"/static/emoji/{row.emotion_emoji}",
+                "emotion_label": row.emotion_label,
+                "preview": row.preview
+            }
+            for row in rows
+        ],
+        "next_cursor": next_cursor
+    })
+    
+## 일기 저장 helper function (defer_comment=True 이면 AI 코멘트는 pending 상태로 저장하고 나중에 채움)
+async def save_new_diary(db: AsyncSession, current_user: UserPrincipal, diary_date: date, content: str,
+                   image_file: Optional[UploadFile], defer_comment: bool) -> Diary:
     user_name = current_user.user_name
     ## 이미지 파일 처리
     uploaded_image_url: Optional[str] = None
+    uploaded_image_variants: Optional[Dict[str, str]] = None
     if image_file and image_file.filename:
         try:
-            # 사용자별 directory 생성
-            user_upload_dir = os.path.join(UPLOAD_DIR, current_user.id)
-            os.makedirs(user_upload_dir, exist_ok=True)
-            
-            # 파일 확장자 확인 및 새 파일 이름 생성 (UUID 사용)
-            file_extension = os.path.splitext(image_file.filename)[1]
-            new_filename = str(uuid.uuid4()) + file_extension
-            file_path = os.path.join(user_upload_dir, new_filename)
-            
-            # 파일 저장
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(image_file.file, buffer)
+            # 사용자별 directory 에 내용 해시 이름으로 저장 (같은 사진은 파일 하나 공유) + WebP 파생본 생성
+            stored = await image_store.store_upload(current_user.id, image_file)
             
-            # 프론트에서 접근 가능한 URL 생성
-            uploaded_image_url = f"/static/images/{current_user.id}/{new_filename}"
+            # 프론트에서 접근 가능한 URL
+            uploaded_image_url = stored.url
+            uploaded_image_variants = stored.variants
             
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"ERROR: Image file saving failed: {e}")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="이미지 저장 실패")
@@ -275,21 +223,30 @@ def create_diary(
     }
     
     ai_comment_text = "오늘 너는 여러가지 감정이 섞인 하루를 보냈구나"
+    comment_status = comment_jobs.COMMENT_STATUS_DONE
+    comment_profile: Optional[str] = None
     
     # FIX: NLP 서비스 예외 처리 및 감정 점수 임계값 적용
     try:
-        raw_analysis = nlp_service.get_emotion_analysis(content)
+        raw_analysis = await run_in_threadpool(inference_client.get_emotion_analysis, content)
         
-        ## DB 저장용 전체 감정 점수
-        analysis_result['overall_emotion_score'] = raw_analysis['overall_emotion_score']
-            
-        ## AI 코멘트 생성
-        ai_comment_text = create_ai_response(content, user_name, raw_analysis['emotion_label'])
+        ## DB 저장용 감정 분석 결과
+        analysis_result.update(raw_analysis)
         
     except Exception as e:
-        print(f"NLP/Chatbot Service Failed: {e}")
+        print(f"NLP Service Failed: {e}")
         pass
-        ## 실패 시 ai_comment_text와 analysis_result는 기본값 유지
+        ## 실패 시 analysis_result는 기본값 유지
+    
+    if defer_comment:
+        ## AI 코멘트는 저장 후 백그라운드 작업(또는 스트리밍)에서 채움
+        ai_comment_text = comment_jobs.COMMENT_PLACEHOLDER
+        comment_status = comment_jobs.COMMENT_STATUS_PENDING
+    else:
+        ## AI 코멘트 생성
+        ai_comment_text, comment_profile = await run_in_threadpool(
+            create_ai_response, content, user_name, analysis_result['emotion_label']
+        )
     
     ## DB 객체 생성 및 저장
     new_diary = Diary(
@@ -298,81 +255,195 @@ def create_diary(
         diary_date=diary_date,
         content=content,
         image_url=uploaded_image_url,
+        image_variants=uploaded_image_variants,
         
         ## 감정분석결과 저장
-        emotion_score=raw_analysis['emotion_score'],
-        emotion_emoji=raw_analysis['emotion_emoji'],
-        emotion_label=raw_analysis['emotion_label'],
-        overall_emotion_score=raw_analysis['overall_emotion_score'],
+        emotion_score=analysis_result['emotion_score'],
+        emotion_emoji=analysis_result['emotion_emoji'],
+        emotion_label=analysis_result['emotion_label'],
+        overall_emotion_score=analysis_result['overall_emotion_score'],
         
         ## AI봇 코멘트 결과
-        ai_comment=ai_comment_text
+        ai_comment=ai_comment_text,
+        comment_status=comment_status,
+        comment_profile=comment_profile,
+        ## pending 이면 이 프로세스가 작업을 맡음 (다른 worker 의 resume_pending_jobs 가 다시 등록하지 않도록)
+        **comment_jobs.claim_values(comment_status == comment_jobs.COMMENT_STATUS_PENDING),
     )
     
     db.add(new_diary)
-    db.commit()
-    db.refresh(new_diary)
+    await emotion_score_service.refresh_user_score(db, current_user.id)
+    await monthly_emotion_service.refresh_month(db, current_user.id, diary_date)
+    await db.commit()
+    await db.refresh(new_diary)
+    return new_diary
+
+## SSE 이벤트 한 건
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+# 일기 Create
+@router.post("/new", response_model=diarySchema.DiaryResponse, status_code=status.HTTP_201_CREATED)
+async def create_diary(
+    diary_date: date = Form(..., description="일기 작성 날짜(YYYY-MM-DD)", example="2025-11-13"),
+    content: str = Form(..., max_length=100, description="일기 내용(최대 100자)"),
+    image_file: Optional[UploadFile] = File(None, description="첨부 이미지 파일"), 
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user) ## JWT 인증 적용
+):
+    user_name = current_user.user_name
+    new_diary = await save_new_diary(db, current_user, diary_date, content, image_file,
+                                     defer_comment=comment_jobs.COMMENT_JOBS_ENABLED)
+    
+    if new_diary.comment_status == comment_jobs.COMMENT_STATUS_PENDING:
+        ## 캐시 hit 이면 동기 세션으로 바로 저장하므로 스레드에서 호출
+        if await run_in_threadpool(comment_jobs.submit_comment_job, new_diary.id, content, user_name, new_diary.emotion_label):
+            await db.refresh(new_diary)
     
     full_data = create_diary_response(new_diary, user_name=current_user.user_name) 
     del full_data['user_name'] 
-    return diarySchema.DiaryResponse(**full_data)
+    return trusted_response(diarySchema.DiaryResponse, full_data, status_code=status.HTTP_201_CREATED)
+
+# 일기 Create + AI 코멘트 스트리밍 (Server-Sent Events)
+# event: diary  -> 저장된 일기 (DiaryResponse, 코멘트는 pending)
+# event: intro  -> 인사말 문구
+# event: warmth -> 감정별 덧붙임 문구 (본문 뒤에 붙일 것)
+# event: token  -> 생성되는 코멘트 본문 조각
+# event: done   -> 최종 저장된 코멘트 (CommentStatusResponse)
+@router.post("/new/stream", status_code=status.HTTP_201_CREATED)
+async def create_diary_stream(
+    diary_date: date = Form(..., description="일기 작성 날짜(YYYY-MM-DD)", example="2025-11-13"),
+    content: str = Form(..., max_length=100, description="일기 내용(최대 100자)"),
+    image_file: Optional[UploadFile] = File(None, description="첨부 이미지 파일"), 
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user) ## JWT 인증 적용
+):
+    user_name = current_user.user_name
+    new_diary = await save_new_diary(db, current_user, diary_date, content, image_file, defer_comment=True)
+    
+    full_data = create_diary_response(new_diary, user_name=user_name)
+    del full_data['user_name']
+    diary_data = diarySchema.DiaryResponse(**full_data).model_dump(mode="json")
+    
+    ## 스트리밍 동안 DB 커넥션을 붙잡고 있지 않도록 미리 반환
+    await db.close()
+    
+    stream = comment_jobs.CommentStream(new_diary.id, content, user_name, new_diary.emotion_label)
+    await run_in_threadpool(stream.start)
+    
+    ## 큐에서 조각을 기다리는 동안 blocking 되므로 동기 generator 로 두고 Starlette 가 스레드에서 순회
+    def event_stream():
+        yield sse_event("diary", diary_data)
+        yield sse_event("intro", {"text": stream.intro})
+        yield sse_event("warmth", {"text": stream.warmth})
+        
+        for chunk in stream:
+            yield sse_event("token", {"text": chunk})
+        
+        ## 최종 코멘트는 작업 완료 콜백에서 저장됨
+        stream.wait(chatbot_service.STREAM_TOKEN_TIMEOUT_SEC)
+        yield sse_event("done", {
+            "id": new_diary.id,
+            "comment_status": stream.status or comment_jobs.COMMENT_STATUS_PENDING,
+            "ai_comment": stream.ai_comment or comment_jobs.COMMENT_PLACEHOLDER,
+            "comment_profile": stream.comment_profile,
+        })
+    
+    return StreamingResponse(
+        event_stream(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 ## 특정 일기 상세 조회 
 @router.get("/detail/{id}", response_model=diarySchema.DiaryDetailResponse)
-def get_diary_detail(
+async def get_diary_detail(
     id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     ## user_id와 id를 통해 일기 조회
-    diary = db.query(Diary).filter(
-        Diary.user_id == current_user.id,
-        Diary.id == id
-    ).first()
+    diary = await db.scalar(diary_repository.detail_query(current_user.id, id))
     
     if not diary:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID {id}에 해당하는 일기를 찾을 수 없습니다.")
 
     full_data = create_diary_response(diary, user_name=current_user.user_name)
-    return diarySchema.DiaryDetailResponse(**full_data)
+    return trusted_response(diarySchema.DiaryDetailResponse, full_data)
+
+## AI 코멘트 생성 상태 조회 (wait > 0 이면 완료될 때까지 최대 wait초 long-poll)
+@router.get("/comment/{id}", response_model=diarySchema.CommentStatusResponse)
+async def get_diary_comment(
+    id: str,
+    wait: float = Query(0, ge=0, le=30, description="코멘트 완성까지 대기할 최대 시간(초)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
+):
+    ## rollback 하면 current_user 속성이 만료되므로 미리 꺼내 둠
+    user_pk = current_user.id
+    
+    async def load_comment():
+        return (await db.execute(diary_repository.comment_status_query(user_pk, id))).first()
+    
+    row = await load_comment()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID {id}에 해당하는 일기를 찾을 수 없습니다.")
+    
+    deadline = time.monotonic() + wait
+    while row.comment_status == comment_jobs.COMMENT_STATUS_PENDING:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        ## 대기하는 동안 DB 커넥션을 풀에 돌려줌
+        await db.rollback()
+        ## 다른 워커에서 진행 중인 작업이면 DB를 주기적으로 다시 확인
+        if not await comment_jobs.wait_for_local_job_async(id, remaining):
+            await asyncio.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+        row = await load_comment()
+        if not row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID {id}에 해당하는 일기를 찾을 수 없습니다.")
+    
+    return {
+        "id": row.id,
+        "comment_status": row.comment_status,
+        "ai_comment": row.ai_comment,
+        "comment_profile": row.comment_profile,
+    }
 
 ## 특정 일기 수정
 @router.put("/modify/{id}", response_model=diarySchema.DiaryDetailResponse)
-def update_diary(
+async def update_diary(
     id: str,
     content: Optional[str] = Form(None, max_length=100, description="일기 내용 수정"),
     image_file: Optional[UploadFile] = File(None, description="첨부 이미지 파일"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_name = current_user.user_name
-    diary_query = db.query(Diary).filter(
+    diary_filter = (
         Diary.user_id == current_user.id,
         Diary.id == id
     )
-    diary = diary_query.first()
+    diary = await db.scalar(diary_repository.detail_query(current_user.id, id))
     
     if not diary:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"ID {id}에 해당하는 일기를 찾을 수 없습니다.")
     
     ## 이미지 파일 처리
+    previous_image_url: Optional[str] = diary.image_url
     uploaded_image_url: Optional[str] = diary.image_url
+    uploaded_image_variants: Optional[Dict[str, str]] = diary.image_variants
     
     if image_file and image_file.filename:
         ## 새 이미지가 업로드된 경우: 새 파일 저장 및 URL 업데이트
         try:
-            user_upload_dir = os.path.join(UPLOAD_DIR, current_user.id)
-            os.makedirs(user_upload_dir, exist_ok=True)
-            
-            file_extension = os.path.splitext(image_file.filename)[1]
-            new_filename = str(uuid.uuid4()) + file_extension
-            file_path = os.path.join(user_upload_dir, new_filename)
-            
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(image_file.file, buffer)
-            
-            uploaded_image_url = f"/static/images/{current_user.id}/{new_filename}"
+            stored = await image_store.store_upload(current_user.id, image_file)
+            uploaded_image_url = stored.url
+            uploaded_image_variants = stored.variants
             
+        except HTTPException:
+            raise
         except Exception as e:
             print(f"ERROR: Image file saving failed during update: {e}")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="이미지 수정 저장 실패")
@@ -395,64 +466,96 @@ def update_diary(
         'emotion_label': diary.emotion_label or "Neutral",
         'overall_emotion_score': diary.overall_emotion_score or default_overall_emotion_score,
     }
-    ai_comment_text = diary.ai_comment or f"오늘 {user_name}님은 여러가지 감정이 섞인 하루를 보냈군요"
+    ai_comment_text = diary.ai_comment or comment_jobs.default_comment(user_name)
+    comment_status = diary.comment_status
+    comment_profile = diary.comment_profile
     
     if content_changed:
         try:
-            raw_analysis = nlp_service.get_emotion_analysis(updated_content)
+            raw_analysis = await run_in_threadpool(inference_client.get_emotion_analysis, updated_content)
             
             analysis_result['overall_emotion_score'] = raw_analysis['overall_emotion_score']
             analysis_result['emotion_score'] = raw_analysis['emotion_score']
             analysis_result['emotion_emoji'] = raw_analysis['emotion_emoji']
             analysis_result['emotion_label'] = raw_analysis['emotion_label']
             
-            ## AI 코멘트 재생성
-            ai_comment_text = create_ai_response(updated_content, user_name, analysis_result['emotion_label'])
-
         except Exception as e:
-            print(f"NLP/Chatbot Service Failed: {e}")
+            print(f"NLP Service Failed: {e}")
             pass
+        
+        ## AI 코멘트 재생성
+        if comment_jobs.COMMENT_JOBS_ENABLED:
+            ai_comment_text = comment_jobs.COMMENT_PLACEHOLDER
+            comment_status = comment_jobs.COMMENT_STATUS_PENDING
+            comment_profile = None
+        else:
+            ai_comment_text, comment_profile = await run_in_threadpool(
+                create_ai_response, updated_content, user_name, analysis_result['emotion_label']
+            )
+            comment_status = comment_jobs.COMMENT_STATUS_DONE
     
     update_payload = {
         ## content가 제공되었을 때만 업데이트
         "content": updated_content if content is not None else diary.content,
         ## 이미지 URL은 항상 업데이트 (새 파일이 없으면 기존 URL로 유지됨)
         "image_url": uploaded_image_url,
+        "image_variants": uploaded_image_variants,
         "emotion_score": analysis_result['emotion_score'],
         "emotion_emoji": analysis_result['emotion_emoji'],
         "emotion_label": analysis_result['emotion_label'],
         "overall_emotion_score": analysis_result['overall_emotion_score'],
         "ai_comment": ai_comment_text,
+        "comment_status": comment_status,
+        "comment_profile": comment_profile,
     }
-    diary_query.update(update_payload, synchronize_session=False)
-    db.commit()
-    db.refresh(diary)
+    if content_changed:
+        ## 코멘트를 새로 만들면 이 프로세스가 작업을 맡음 (내용이 그대로면 기존 작업 / claim 유지)
+        update_payload.update(comment_jobs.claim_values(comment_status == comment_jobs.COMMENT_STATUS_PENDING))
+    await db.execute(
+        update(Diary).where(*diary_filter).values(**update_payload).execution_options(synchronize_session=False)
+    )
+    await emotion_score_service.refresh_user_score(db, current_user.id)
+    await monthly_emotion_service.refresh_month(db, current_user.id, diary.diary_date)
+    await db.commit()
+    await db.refresh(diary)
+    
+    ## 이미지를 교체했으면 다른 일기가 쓰지 않는 이전 이미지 파일 삭제
+    if uploaded_image_url != previous_image_url:
+        await image_store.release(db, current_user.id, previous_image_url)
+    
+    if content_changed and comment_status == comment_jobs.COMMENT_STATUS_PENDING:
+        if await run_in_threadpool(comment_jobs.submit_comment_job, diary.id, updated_content, user_name, analysis_result['emotion_label']):
+            await db.refresh(diary)
     
     full_data = create_diary_response(diary, user_name=current_user.user_name)
-    return diarySchema.DiaryDetailResponse(**full_data)
+    return trusted_response(diarySchema.DiaryDetailResponse, full_data)
 
 ## 일기 삭제
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_diary(
+async def delete_diary(
     id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
-    diary = db.query(Diary).filter(
+    ## 월간 집계를 다시 만들 달 / 정리할 이미지를 알기 위해 먼저 조회
+    target = (await db.execute(diary_repository.delete_target_query(current_user.id, id))).first()
+    diary_date, image_url = target if target else (None, None)
+    result = await db.execute(delete(Diary).where(
         Diary.user_id == current_user.id,
         Diary.id == id
-    )
-    delete_count = db.query(Diary).filter(
-        Diary.user_id == current_user.id,
-        Diary.id == id
-    ).delete(synchronize_session=False) 
+    ).execution_options(synchronize_session=False))
+    delete_count = result.rowcount
     
-    if delete_count == 0:
+    if delete_count == 0 or diary_date is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail=f"ID {id}에 해당하는 일기를 찾을 수 없거나 삭제 권한이 없습니다."
         )
 
-    db.commit()
+    await emotion_score_service.refresh_user_score(db, current_user.id)
+    await monthly_emotion_service.refresh_month(db, current_user.id, diary_date)
+    await db.commit()
+    
+    await image_store.release(db, current_user.id, image_url)
     
     return
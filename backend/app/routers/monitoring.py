@@ -0,0 +1,63 @@
+# backend/app/router/monitoring.py
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+from typing import Dict, Any
+
+from ..service import nlp_service, chatbot_service, comment_jobs
+from ..service.model_registry import registry
+from ..service.principal_cache import principal_cache
+from ..database import get_pool_metrics
+from ..middleware import request_metrics
+
+router = APIRouter(
+    tags=["Monitoring"]
+)
+
+## 감정 분석 배치 크기 / 큐 대기 시간 히스토그램
+@router.get("/metrics/nlp")
+async def get_nlp_metrics() -> Dict[str, Any]:
+    return nlp_service.get_batch_metrics()
+
+## 감정 분석 / AI 코멘트 결과 캐시 hit, miss 통계
+@router.get("/metrics/cache")
+async def get_cache_metrics() -> Dict[str, Any]:
+    return {
+        "emotion_analysis": nlp_service.emotion_cache.stats(),
+        "chatbot_comment": chatbot_service.comment_cache.stats(),
+        "principal": principal_cache.stats(),
+    }
+
+## AI 코멘트 작업 큐 깊이 / 디코딩 프로파일별 선택 횟수, 소요 시간
+@router.get("/metrics/comments")
+async def get_comment_metrics() -> Dict[str, Any]:
+    return comment_jobs.get_job_metrics()
+
+## DB 커넥션 풀 (checked-out, overflow, checkout 대기 시간, invalidate 횟수)
+@router.get("/metrics/db")
+async def get_db_metrics() -> Dict[str, Any]:
+    return get_pool_metrics()
+
+## route 별 응답 상태 / 처리 시간 히스토그램
+@router.get("/metrics/http")
+async def get_http_metrics() -> Dict[str, Any]:
+    return request_metrics.snapshot()
+
+## 프로세스 생존 여부
+@router.get("/health/live")
+async def health_live() -> Dict[str, Any]:
+    return {"status": "alive"}
+
+## 모델 warm-up 이 끝난 뒤에만 ready (로드밸런서가 cold 워커로 트래픽을 보내지 않도록)
+# 로드 / warm-up 에 실패한 모델이 있으면 failed (503)
+@router.get("/health/ready")
+async def health_ready(request: Request):
+    failed = registry.any_failed()
+    ready = getattr(request.app.state, "models_ready", False) and not failed
+    body = {
+        "status": "ready" if ready else ("failed" if failed else "warming_up"),
+        "models": registry.status(),
+        "comment_workers": comment_jobs.workers_state if comment_jobs.COMMENT_JOBS_ENABLED else None,
+    }
+    if not ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=body)
+    return body
@@ -1,12 +1,12 @@
 # backend/app/router/mypage.py
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from datetime import date, datetime, timedelta
-from ..models.user import User
-from ..models.diary import Diary
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
 from ..schemas import mypageSchema
-from ..database import get_db
-from ..routers.main_diary import get_current_active_user, calculate_emotion_score
+from ..database import get_async_db
+from ..service.principal_cache import UserPrincipal
+from ..routers.main_diary import get_current_active_user
+from ..service import emotion_score_service
 import calendar
 
 router = APIRouter(
@@ -14,20 +14,10 @@ router = APIRouter(
     tags=["My Page"]
 )
 
-## 감정 중요도 가중치
-EMOTION_WEIGHTS = {
-    "Angry": -3.0, # 가장 부정
-    "Fear": -4.0,
-    "Sad": -5.0,
-    "Happy": 5.0,  # 가장 긍정
-    "Tender": 3.0,
-    "Neutral": 1.0, # 중립
-}
-
 @router.get("", response_model=mypageSchema.mypageResponse)
-def my_page(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+async def my_page(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_pk = current_user.id
     user_id = current_user.user_id
@@ -36,13 +26,9 @@ def my_page(
     
     today = date.today()
     start_date = (today - created_at).days
-    thirty_days = today - timedelta(days=14)
     
-    ## 감정 점수 계산 용 일기 데이터 조회 (최근 14일 이내 데이터)
-    recent_diaries = db.query(Diary).filter(Diary.user_id == user_pk, Diary.diary_date >= thirty_days)\
-        .order_by(Diary.diary_date.desc()).all()
-       
-    user_emotion_score = calculate_emotion_score(diaries=recent_diaries, weights=EMOTION_WEIGHTS)
+    ## 감정 점수 (최근 14일 일기로 미리 계산해 둔 값)
+    user_emotion_score = await emotion_score_service.get_user_score(db, user_pk)
     
     return {
         "user_name": user_name,
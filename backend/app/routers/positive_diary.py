@@ -1,16 +1,21 @@
 # backend/app/router/positive_diary.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from ..models.user import User
 from ..models.positiveQuestion import PositiveQuestion
 from ..models.positiveDiary import PositiveDiary
 from .. import auth
 from ..schemas import positiveSchema
-from ..database import get_db
+from ..database import get_async_db
+from ..service.principal_cache import UserPrincipal
+from ..repositories import positive_repository
+from ..pagination import PAGE_SIZE_MAX, page_limit, decode_cursor, split_page
+from ..service.question_catalog import QuestionEntry, question_catalog
 from ..routers.main_diary import get_current_active_user
 
 router = APIRouter(
@@ -25,136 +30,113 @@ router = APIRouter(
 #         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="사용자를 찾을 수 없습니다.")
 #     return user
 
-## 긍정 일기 메인 페이지
-@router.get("/main", response_model=positiveSchema.PositivePageResponse)
-def get_positive_page_data(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
-):
-    user_id = current_user.id
-    today = date.today()
-    
-    ## 마지막 답변 기록 조회
-    last_entry = db.query(PositiveDiary)\
-        .filter(PositiveDiary.user_id == user_id)\
-            .order_by(PositiveDiary.diary_date.desc())\
-                .first()
-    last_answered_date = None
+## 다음에 제공할 질문 (마지막 답변 질문의 다음 번호, 답변일 다음 날부터 제공)
+async def find_next_question(db: AsyncSession, last_entry, today: date) -> Optional[QuestionEntry]:
     last_question_number = 0
-    
     if last_entry:
-        last_answered_date = last_entry.diary_date
-        ## 마지막 답변 질문 객체 찾기
-        last_question = db.query(PositiveQuestion).filter(PositiveQuestion.id == last_entry.question_id).first()
+        ## 마지막 답변 질문 번호 찾기
+        last_question = await question_catalog.get_by_id(db, last_entry.question_id)
         if last_question:
             last_question_number = last_question.question_number
+        
+        ## 시간 제약 : 오늘 날짜가 마지막 답변 날짜보다 커야 새로운 질문이 제공됨
+        if today <= last_entry.diary_date:
+            return None
     
-    ## 다음 질문 번호 결정
-    next_question_number = last_question_number + 1
-    
-    ## 시간 제약 : 다음 질문은 답변일 기준 다음 날에 제공되도록
-    can_get_new_question = True
-    if last_answered_date:
-        if today <= last_answered_date: ## 오늘 날짜가 마지막 답변 날짜보다 커야 새로운 질문이 제공됨
-            can_get_new_question = False
+    return await question_catalog.get_by_number(db, last_question_number + 1)
+
+## 답변 행 -> 과거 긍정일기 항목 (질문 번호 / 내용은 question_catalog 에서)
+async def to_past_answer_items(db: AsyncSession, answers) -> List[positiveSchema.PastAnswerItem]:
+    past_answer_list = []
+    for entry in answers:
+        question = await question_catalog.get_by_id(db, entry.question_id)
+        if question:
+            past_answer_list.append(positiveSchema.PastAnswerItem(
+                id=entry.id,
+                question_number=question.question_number,
+                text=question.text
+            ))
+    return past_answer_list
+
+## 긍정 일기 메인 페이지 (사용자 답변 조회 한 번 + 메모리의 질문 목록)
+@router.get("/main", response_model=positiveSchema.PositivePageResponse)
+async def get_positive_page_data(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
+):
+    user_id = current_user.id
+    today = date.today()
     
-    ## 다음 질문 조회
-    next_question = db.query(PositiveQuestion)\
-        .filter(PositiveQuestion.question_number == next_question_number).first()
-        
-    question_to_return = None
+    ## 답변 기록 첫 페이지 (최신순, 첫 번째가 마지막 답변)
+    limit = page_limit(None)
+    answers = await positive_repository.list_user_answers(db, user_id, limit=limit + 1)
+    last_entry = answers[0] if answers else None
+    answers, next_cursor = split_page(answers, limit)
     
-    if next_question and can_get_new_question:
-        question_to_return = next_question
     ## 현재 긍정 질문
-    current_question_data = positiveSchema.CurrentQuestionResponse(question=question_to_return)
+    next_question = await find_next_question(db, last_entry, today)
+    current_question_data = {"question": next_question._asdict() if next_question else None}
     
-    ## 과거 긍정 질문들
-    past_answers_query = db.query(PositiveDiary, PositiveQuestion)\
-        .filter(PositiveDiary.user_id == user_id)\
-            .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id)\
-                .order_by(PositiveDiary.diary_date.desc()).all()
+    ## 과거 긍정 질문들 (다음 페이지는 /answers?cursor=)
+    return {
+        "current_question": current_question_data,
+        "past_answers": await to_past_answer_items(db, answers),
+        "past_answers_next_cursor": next_cursor
+    }
     
-    past_answer_list = []
-    for entry, question in past_answers_query:
-        past_answer_list.append(positiveSchema.PastAnswerItem(
-            id=entry.id,
-            question_number=question.question_number,
-            text=question.text
-        ))
+## 과거 긍정일기 목록 (최신순, cursor 페이지네이션)
+@router.get("/answers", response_model=positiveSchema.PastAnswerPage)
+async def get_past_answers(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 첫 페이지)"),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_SIZE_MAX, description="페이지 크기"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
+):
+    limit = page_limit(limit)
+    answers = await positive_repository.list_user_answers(
+        db, current_user.id, before=decode_cursor(cursor), limit=limit + 1
+    )
+    answers, next_cursor = split_page(answers, limit)
     
     return {
-        "current_question": current_question_data,
-        "past_answers": past_answer_list
+        "past_answers": await to_past_answer_items(db, answers),
+        "next_cursor": next_cursor
     }
     
 ## 새로 생긴 긍정 질문 가져오기
 @router.get("/question", response_model=positiveSchema.CurrentQuestionResponse)
-def get_current_question(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+async def get_current_question(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
-    user_id = current_user.id
-    today = date.today()
-    
     ## 마지막 답변 기록 조회
-    last_entry = db.query(PositiveDiary)\
-        .filter(PositiveDiary.user_id == user_id)\
-            .order_by(PositiveDiary.diary_date.desc())\
-                .first()
-    last_answered_date = None
-    last_question_number = 0
-    
-    if last_entry:
-        last_answered_date = last_entry.diary_date
-        ## 마지막 답변 질문 객체 찾기
-        last_question = db.query(PositiveQuestion).filter(PositiveQuestion.id == last_entry.question_id).first()
-        if last_question:
-            last_question_number = last_question.question_number
-    
-    ## 다음 질문 번호 결정
-    next_question_number = last_question_number + 1
-    
-    ## 시간 제약 : 다음 질문은 답변일 기준 다음 날에 제공되도록
-    can_get_new_question = True
-    if last_answered_date:
-        if today <= last_answered_date: ## 오늘 날짜가 마지막 답변 날짜보다 커야 새로운 질문이 제공됨
-            can_get_new_question = False
-    
-    ## 다음 질문 조회
-    next_question = db.query(PositiveQuestion)\
-        .filter(PositiveQuestion.question_number == next_question_number).first()
-        
-    question_to_return = None
-    
-    if next_question and can_get_new_question:
-        question_to_return = next_question
+    last_entry = await positive_repository.get_last_answer(db, current_user.id)
+    next_question = await find_next_question(db, last_entry, date.today())
         
     return {
-        "question": question_to_return
+        "question": next_question._asdict() if next_question else None
     }
     
 ## 새로 생긴 긍정 질문 작성 : CREATE
 @router.post("/answer", response_model=positiveSchema.AnswerResponse, status_code=status.HTTP_201_CREATED)
-def post_answer(
+async def post_answer(
     answer_data: positiveSchema.AnswerCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_id = current_user.id
     today = date.today()
     
     ## 질문 ID 유효성 및 존재 여부
-    question = db.query(PositiveQuestion).filter(PositiveQuestion.id == answer_data.question_id).first()
+    question = await question_catalog.get_by_id(db, answer_data.question_id)
     if not question:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="유효하지 않는 질문ID")
     
     ## 이전 질문 답변 완료 여부 및 순서 확인
-    last_entry = db.query(PositiveDiary).filter(PositiveDiary.user_id== user_id)\
-        .order_by(PositiveDiary.diary_date.desc()).first()
+    last_entry = await positive_repository.get_last_answer(db, user_id)
     last_q_num = 0
     if last_entry:
-        last_q = db.query(PositiveQuestion).filter(PositiveQuestion.id == last_entry.question_id).first()
+        last_q = await question_catalog.get_by_id(db, last_entry.question_id)
         if last_q:
             last_q_num = last_q.question_number
     
@@ -164,10 +146,8 @@ def post_answer(
     ## 규칙 : 다음 순서의 질문이거나 첫 질문이어야만 답변 가능
     if current_q_num != last_q_num + 1 and current_q_num != 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="이전 질문에 순서대로 답변해야 합니다.")
-    ## 중복 답변 방지
-    today_entry = db.query(PositiveDiary).filter(PositiveDiary.user_id == user_id,
-                                                 PositiveDiary.diary_date == today).first()
-    if today_entry:
+    ## 중복 답변 방지 (마지막 답변이 가장 최근 날짜이므로 따로 조회하지 않음)
+    if last_entry and last_entry.diary_date == today:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="오늘은 이미 긍정 질문에 답변했습니다.")
     
     new_answer = PositiveDiary(
@@ -178,47 +158,34 @@ def post_answer(
     )
     
     db.add(new_answer)
-    db.commit()
-    db.refresh(new_answer)
+    await db.commit()
+    await db.refresh(new_answer)
     
     return new_answer
 
 ## 특정 긍정일기 조회
 @router.get("/answers/{id}", response_model=positiveSchema.AnswerDetailResponse)
-def get_answer_detail(
+async def get_answer_detail(
     id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
-    result = db.query(PositiveDiary, PositiveQuestion)\
-        .filter(PositiveDiary.id == id)\
-            .filter(PositiveDiary.user_id == current_user.id)\
-                .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id).first()
+    result = await positive_repository.get_answer_detail(db, current_user.id, id)
     
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해답 답변을 찾을 수 없거나 접근 권한이 없습니다.")
     
-    answer_entry, question = result
-    
-    return positiveSchema.AnswerDetailResponse(
-        id=answer_entry.id,
-        question_number=question.question_number,
-        text=question.text,
-        answer=answer_entry.answer,
-    )
+    return positiveSchema.AnswerDetailResponse(**result._asdict())
 
 ## 특정 긍정일기 수정
 @router.put("/modify/{id}", response_model=positiveSchema.AnswerDetailResponse)
-def update_answer(
+async def update_answer(
     id: str,
     update_data: positiveSchema.UpdateAnswerCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
-    result = db.query(PositiveDiary, PositiveQuestion)\
-        .filter(PositiveDiary.id == id)\
-            .filter(PositiveDiary.user_id == current_user.id)\
-                .join(PositiveQuestion, PositiveDiary.question_id == PositiveQuestion.id).first()
+    result = (await db.execute(positive_repository.answer_entry_query(current_user.id, id))).first()
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="해답 답변을 찾을 수 없거나 접근 권한이 없습니다.")
     
@@ -226,8 +193,8 @@ def update_answer(
     
     answer_entry.answer = update_data.answer
     
-    db.commit()
-    db.refresh(answer_entry)
+    await db.commit()
+    await db.refresh(answer_entry)
     
     return positiveSchema.AnswerDetailResponse(
         id=answer_entry.id,
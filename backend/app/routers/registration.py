@@ -1,13 +1,19 @@
 # backend/app/router/registration.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from ..models.user import User 
 from ..models.diary import Diary 
 from ..models.positiveDiary import PositiveDiary
+from ..models.userEmotionScore import UserEmotionScore
 from .. import auth
 from ..schemas import userSchema 
-from ..database import get_db
+from ..database import get_async_db
+from ..repositories import user_repository
 # from fastapi.security import OAuth2PasswordBearer
+from ..service.principal_cache import UserPrincipal, principal_cache
+from ..service import monthly_emotion_service, image_store
 from ..routers.main_diary import get_current_active_user
 
 router = APIRouter(
@@ -18,11 +24,11 @@ router = APIRouter(
 
 ## 아이디 중복 확인
 @router.get("/check_id", response_model=userSchema.IDCheckResponse)
-def check_user_id(
+async def check_user_id(
     user_id: str = Query(..., description="확인할 사용자 로그인 아이디"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    db_user = db.query(User).filter(User.user_id == user_id).first()
+    db_user = await db.scalar(user_repository.login_id_query(user_id))
     if db_user:
         return {
             "is_available": False,
@@ -36,16 +42,16 @@ def check_user_id(
 
 ## 회원가입 API
 @router.post("/register", response_model=userSchema.UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: userSchema.UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: userSchema.UserCreate, db: AsyncSession = Depends(get_async_db)):
     # 1. 사용자 ID 중복 확인
-    db_user = db.query(User).filter(User.user_id == user_data.user_id).first()
+    db_user = await db.scalar(user_repository.login_id_query(user_data.user_id))
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 존재하는 사용자 ID입니다."
         )   
-    # 2.  비밀번호 해싱
-    hashed_password = auth.hash_password(user_data.user_pwd)
+    # 2.  비밀번호 해싱 (CPU 연산이므로 이벤트 루프 밖에서)
+    hashed_password = await run_in_threadpool(auth.hash_password, user_data.user_pwd)
     
     new_user = User(
         user_name=user_data.user_name,
@@ -56,19 +62,19 @@ def register(user_data: userSchema.UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
 ## 로그인 API
 @router.post("/login", response_model=userSchema.LoginSuccess)
-def login(user_credentials: userSchema.UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: userSchema.UserLogin, db: AsyncSession = Depends(get_async_db)):
     
-    user = db.query(User).filter(User.user_id == user_credentials.user_id).first()
+    user = await db.scalar(user_repository.login_id_query(user_credentials.user_id))
 
 
-    if not user or not auth.verify_password(user_credentials.user_pwd, user.user_pwd):
+    if not user or not await run_in_threadpool(auth.verify_password, user_credentials.user_pwd, user.user_pwd):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="아이디 또는 비밀번호가 일치하지 않습니다.",
@@ -90,32 +96,38 @@ def login(user_credentials: userSchema.UserLogin, db: Session = Depends(get_db))
     
 ## 로그아웃 API
 @router.get("/logout", response_model=userSchema.LogoutSuccess)
-def logout():
+async def logout():
     return {"message": "로그아웃 성공"}
 
 ## 회원탈퇴 
 @router.delete("/unsubscribe", status_code=status.HTTP_204_NO_CONTENT)
-def withdrawal_of_membership(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+async def withdrawal_of_membership(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserPrincipal = Depends(get_current_active_user)
 ):
     user_id = current_user.user_id
     
     try:
-        db.query(Diary).filter(Diary.user_id == user_id).delete(synchronize_session=False)
-        db.query(PositiveDiary).filter(PositiveDiary.user_id == user_id).delete(synchronize_session=False)
+        ## 일기 테이블의 user_id 는 TB_user.id (로그인 아이디가 아님)
+        await db.execute(delete(Diary).where(Diary.user_id == current_user.id).execution_options(synchronize_session=False))
+        await db.execute(delete(PositiveDiary).where(PositiveDiary.user_id == current_user.id).execution_options(synchronize_session=False))
+        await db.execute(delete(UserEmotionScore).where(UserEmotionScore.user_id == current_user.id).execution_options(synchronize_session=False))
+        await monthly_emotion_service.delete_user_months(db, current_user.id)
         
-        user_delete = db.query(User).filter(User.user_id == user_id)
+        user_delete = await db.execute(delete(User).where(User.user_id == user_id).execution_options(synchronize_session=False))
         
-        if not user_delete.first():
+        if user_delete.rowcount == 0:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
         
-        user_delete.delete(synchronize_session=False)
-        
-        db.commit()
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"회원 탈퇴 중 데이터베이스 오류 발생: {e}")
 
+    ## 캐시된 사용자 스냅샷 제거 (남은 토큰으로는 더 이상 인증되지 않도록)
+    await principal_cache.invalidate_async(current_user.id)
+    ## 업로드 이미지 폴더 삭제
+    await image_store.delete_user_images(current_user.id)
+
     return
     
@@ -25,6 +25,8 @@ class DiaryResponse(BaseModel):
     
     image_url: Optional[str] = Field(None, description="첨부 이미지")
     primary_image_url: str = Field(..., description="달력에 표시할 최종 이미지 URL")
+    thumbnail_image_url: str = Field(..., description="목록용 작은 WebP 이미지 URL (파생본이 없으면 최종 이미지)")
+    display_image_url: str = Field(..., description="상세 화면용 WebP 이미지 URL (파생본이 없으면 최종 이미지)")
     
     emotion_score: float = Field(..., description="감정 점수")
     emotion_emoji: str = Field(..., max_length=255, description="감정 이모지")
@@ -32,6 +34,8 @@ class DiaryResponse(BaseModel):
     overall_emotion_score: Dict[str, float] = Field(..., description="전체 감정 분포")
     
     ai_comment: str = Field(..., description="AI 쳇봇 코멘트")
+    comment_status: str = Field("done", description="AI 코멘트 생성 상태 (pending/done/failed)")
+    comment_profile: Optional[str] = Field(None, description="AI 코멘트 생성에 사용한 디코딩 프로파일 (quality/balanced/fast)")
     
     created_at: datetime = Field(..., description="생성 시각")
     
@@ -45,11 +49,22 @@ class DiaryDetailResponse(BaseModel):
     user_name: str = Field(..., description="사용자 이름")
     diary_date: date = Field(..., description="일기 작성 날짜")
     primary_image_url: str = Field(..., description="달력에 표시할 최종 이미지 URL")
+    thumbnail_image_url: str = Field(..., description="목록용 작은 WebP 이미지 URL (파생본이 없으면 최종 이미지)")
+    display_image_url: str = Field(..., description="상세 화면용 WebP 이미지 URL (파생본이 없으면 최종 이미지)")
     content: str = Field(..., description="일기 내용")
     ai_comment: str = Field(..., description="AI 쳇봇 코멘트")
+    comment_status: str = Field("done", description="AI 코멘트 생성 상태 (pending/done/failed)")
+    comment_profile: Optional[str] = Field(None, description="AI 코멘트 생성에 사용한 디코딩 프로파일 (quality/balanced/fast)")
     
     class Config:
         from_attributes = True
+
+## AI 코멘트 생성 상태 RESPONSE (polling / long-poll)
+class CommentStatusResponse(BaseModel):
+    id: str = Field(..., description="일기 UUID")
+    comment_status: str = Field(..., description="AI 코멘트 생성 상태 (pending/done/failed)")
+    comment_profile: Optional[str] = Field(None, description="AI 코멘트 생성에 사용한 디코딩 프로파일 (quality/balanced/fast)")
+    ai_comment: str = Field(..., description="AI 쳇봇 코멘트 (pending 상태에서는 안내 문구)")
         
 ## 달력 main 데이터 RESPONSE
 class CalendarResponse(BaseModel):
@@ -69,4 +84,15 @@ class MainPageResponse(BaseModel):
         
     
     
-    
\ No newline at end of file
+        
+## 일기 타임라인 (cursor 페이지네이션)
+class TimelineItem(BaseModel):
+    id: str = Field(..., description="일기 UUID")
+    diary_date: date = Field(..., description="일기 작성 날짜")
+    primary_image_url: str = Field(..., description="표시할 이미지 URL (첨부 이미지는 썸네일 WebP)")
+    emotion_label: str = Field(..., description="감정 레이블")
+    preview: str = Field(..., description="일기 내용 앞부분")
+    
+class TimelineResponse(BaseModel):
+    diaries: List[TimelineItem] = Field(..., description="최신순 일기 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
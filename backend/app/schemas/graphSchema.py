@@ -1,7 +1,7 @@
 # backend/schemas/graphSchema.py
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Dict, List
 
 ## 월별 그래프 데이터 가져오기 (월별 감정, 감정 개수, 감정 모지 + 백분율)
 class EmotionStateItem(BaseModel):
@@ -25,3 +25,17 @@ class MonthlyStateResponse(BaseModel):
     diary_cnt: int = Field(..., description="일기 작성 횟수")
     emotion_state: List[EmotionStateItem] = Field(..., description="월별 감정 정보")
     daily_emotion_scores: List[DailyEmotionScore] = Field(..., description="월별 일일 감정 점수")
+
+## 기간별 감정 추이 (구간별 값은 buckets 와 같은 순서의 배열)
+class RangeTrendResponse(BaseModel):
+    start_date: str = Field(..., description="조회 시작 날짜 (YYYY-MM-DD)")
+    end_date: str = Field(..., description="조회 끝 날짜 (YYYY-MM-DD)")
+    bucket: str = Field(..., description="집계 단위 (day/week/month)")
+    window: int = Field(..., description="이동 평균 구간 수")
+    diary_cnt: int = Field(..., description="기간 내 일기 작성 횟수")
+    emotion_total: Dict[str, int] = Field(..., description="기간 전체 감정별 일기 개수")
+    buckets: List[str] = Field(..., description="구간 시작 날짜 목록 (주: 월요일, 월: 1일)")
+    diary_cnts: List[int] = Field(..., description="구간별 일기 개수")
+    emotion_cnts: Dict[str, List[int]] = Field(..., description="감정별 구간별 일기 개수")
+    mean_scores: Dict[str, List[float]] = Field(..., description="감정별 구간 평균 점수 (일기 없는 구간은 0.0)")
+    moving_avg: Dict[str, List[float]] = Field(..., description="감정별 이동 평균 점수 (최근 window 개 구간)")
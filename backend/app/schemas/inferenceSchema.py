@@ -0,0 +1,23 @@
+# backend/schemas/inferenceSchema.py
+
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+
+## 감정 분석 요청 / 결과
+class AnalyzeRequest(BaseModel):
+    text: str = Field(..., description="분석할 일기 내용")
+
+class AnalyzeResponse(BaseModel):
+    emotion_label: str = Field(..., description="감정 레이블")
+    emotion_emoji: str = Field(..., description="감정 이모지 파일명")
+    emotion_score: float = Field(..., description="가장 높은 감정 확률")
+    overall_emotion_score: Dict[str, float] = Field(..., description="전체 감정 분포")
+
+## AI 코멘트 생성 요청 / 결과
+class CommentRequest(BaseModel):
+    content: str = Field(..., description="전처리된 일기 내용")
+    profile: Optional[str] = Field(None, description="디코딩 프로파일 (quality/balanced/fast, 없으면 서버 기본값)")
+
+class CommentResponse(BaseModel):
+    comment: str = Field(..., description="모델이 생성한 코멘트 본문")
+    profile: Optional[str] = Field(None, description="본문을 실제로 만든 디코딩 프로파일 (캐시 hit 이면 캐시의 프로파일, 실패 문구면 null)")
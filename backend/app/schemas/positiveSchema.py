@@ -61,8 +61,14 @@ class PastAnswerResponse(BaseModel):
 ## 긍정일기 페이지 통합 응답
 class PositivePageResponse(BaseModel):
     current_question: CurrentQuestionResponse = Field(..., description="새로 생긴 긍정질문")
-    past_answers: List[PastAnswerItem] = Field(..., description="이전 긍정질문들")
+    past_answers: List[PastAnswerItem] = Field(..., description="이전 긍정질문들 (최신순 첫 페이지)")
+    past_answers_next_cursor: Optional[str] = Field(None, description="이전 긍정질문 다음 페이지 cursor (/api/positive/answers)")
 
     
     
 
+
+## 과거 긍정일기 목록 (cursor 페이지네이션)
+class PastAnswerPage(BaseModel):
+    past_answers: List[PastAnswerItem] = Field(..., description="이전 긍정질문들 (최신순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 cursor (마지막 페이지면 null)")
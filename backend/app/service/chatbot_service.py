@@ -1,9 +1,15 @@
 # backend/app/ai_model/chatbot_service.py
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from transformers import AutoTokenizer
 import torch
 import torch.nn.functional as F
 import os
-from typing import Dict, Any
+import threading
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+from .result_cache import create_cache, model_fingerprint
+from . import inference_backend
+from .model_registry import registry
 
 
 LOCAL_MODEL_PATH = os.getenv(
@@ -12,97 +18,285 @@ LOCAL_MODEL_PATH = os.getenv(
 )
 
 
-LOAD_SUCCESS = False
-try:
-    # 1. KoBART 토크나이저 로드 (학습된 모델 경로에서 로드)
-    tokenizer = AutoTokenizer.from_pretrained(LOCAL_MODEL_PATH)
+## 추론 백엔드 (eager / int8 / onnx)
+CHATBOT_BACKEND = inference_backend.resolve_backend("CHATBOT_BACKEND")
 
-    DEVICE = torch.device("cpu") # 배포 환경에 따라 "cuda" 또는 "cpu" 선택
-    
-    model = AutoModelForSeq2SeqLM.from_pretrained(LOCAL_MODEL_PATH).to(DEVICE)
-    model.eval()
-    
-    print(f"INFO: KoBART Diary Comment model loaded successfully from local path on {DEVICE}.")
-    LOAD_SUCCESS = True
+## 결과 캐시 키에 들어갈 모델 버전 (모델을 로드하지 않고도 계산할 수 있도록 설정값 기준)
+CHATBOT_MODEL_VERSION = os.getenv("CHATBOT_MODEL_VERSION") or model_fingerprint(LOCAL_MODEL_PATH)
+CHATBOT_MODEL_VERSION = f"{CHATBOT_MODEL_VERSION}:{CHATBOT_BACKEND}"
 
-except Exception as e:
-    print(f"ERROR: Failed to load KoBART model from {LOCAL_MODEL_PATH}. Error: {e}")
+## 실패 시 반환 문구 (캐시에 저장하지 않음)
+LOAD_FAILED_COMMENT = "현재 AI 챗봇 모델 로딩에 실패했습니다. 관리자에게 문의하세요."
+GENERATION_FAILED_COMMENT = "야, 미안! 지금 AI 친구가 잠깐 정신을 놨어. 다시 한번 시도해볼게."
+FAILED_COMMENTS = (LOAD_FAILED_COMMENT, GENERATION_FAILED_COMMENT)
 
-    def tokenizer(*args, **kwargs):
-        # 최소한의 더미 출력을 반환
-        return {'input_ids': torch.tensor([[1]]), 'attention_mask': torch.tensor([[1]])}
-    
-    class DummyModel:
-        def generate(self, input_ids, **kwargs):
-            # 더미 출력 
-            return torch.tensor([[1, 512, 512]])
+## 디코딩 프로파일 (비싼 순서)
+# quality : 기존 설정 (beam 7개, 후보 3개 중 가장 긴 문장 선택)
+# balanced: beam 3개, 후보 1개
+# fast    : greedy + 짧은 길이 제한 (EOS 에서 바로 종료)
+PROFILE_QUALITY = "quality"
+PROFILE_BALANCED = "balanced"
+PROFILE_FAST = "fast"
+PROFILE_ORDER = (PROFILE_QUALITY, PROFILE_BALANCED, PROFILE_FAST)
 
-        def to(self, device): return self
-        def eval(self): pass
+DECODING_PROFILES: Dict[str, Dict[str, Any]] = {
+    PROFILE_QUALITY: {
+        "max_new_tokens": 40,
+        "num_beams": 7,
+        "num_return_sequences": 3,
+        "length_penalty": 2.0,       # 답변 길이 유도
+        "diversity_penalty": 0.5,    # 후보군 간 다양성 확보
+    },
+    PROFILE_BALANCED: {
+        "max_new_tokens": 40,
+        "num_beams": 3,
+        "num_return_sequences": 1,
+        "length_penalty": 2.0,
+        "early_stopping": True,
+    },
+    PROFILE_FAST: {
+        "max_new_tokens": int(os.getenv("CHATBOT_FAST_MAX_NEW_TOKENS", 28)),
+        "num_beams": 1,
+        "num_return_sequences": 1,
+    },
+}
 
-    model = DummyModel()
-    DEVICE = "cpu"
-    LOAD_SUCCESS = False
 
+def resolve_profile(profile: Optional[str]) -> str:
+    profile = (profile or "").strip().lower()
+    return profile if profile in DECODING_PROFILES else PROFILE_QUALITY
 
-def generate_comment(content: str) -> str:
-    if not LOAD_SUCCESS:
-        return "현재 AI 챗봇 모델 로딩에 실패했습니다. 관리자에게 문의하세요."
-        
-    prompt = content.strip() 
-    
+
+DEFAULT_PROFILE = resolve_profile(os.getenv("CHATBOT_PROFILE", PROFILE_QUALITY))
+
+## 스트리밍 생성 시 다음 토큰을 기다릴 최대 시간(초)
+STREAM_TOKEN_TIMEOUT_SEC = float(os.getenv("CHATBOT_STREAM_TOKEN_TIMEOUT_SEC", 30))
+
+comment_cache = create_cache("chatbot_comment")
+
+def _load_models() -> SimpleNamespace:
+    ## 토크나이저 + 모델 로드 (model_registry 를 통해 처음 사용할 때 한 번만 호출됨)
     try:
-        inputs = tokenizer(prompt, return_tensors="pt").to(DEVICE)
-        
-        # KoBART 생성 파라미터 최적화
-        MAX_NEW_TOKENS = 40
-        # TEMPERATURE = 0.7  <-- 제거됨
-        # TOP_P = 0.9        <-- 제거됨
-        REPETITION_PENALTY = 1.8
-        NO_REPEAT_NGRAM_SIZE = 2
-        
+        # 1. KoBART 토크나이저 로드 (학습된 모델 경로에서 로드)
+        tokenizer = AutoTokenizer.from_pretrained(LOCAL_MODEL_PATH)
 
-        NUM_BEAMS = 7
-        NUM_RETURN_SEQUENCES = 3
-        
-        LENGTH_PENALTY = 2.0       # 답변 길이 유도
-        DIVERSITY_PENALTY = 0.5       # 후보군 간 다양성 확보
-        
-        with torch.no_grad():
-            outputs = model.generate(
-                inputs.input_ids,
-                attention_mask=inputs.attention_mask,
-                max_new_tokens=MAX_NEW_TOKENS,
-                do_sample=False,          
-                num_beams=NUM_BEAMS,     
-                num_return_sequences=NUM_RETURN_SEQUENCES,
-                length_penalty=LENGTH_PENALTY,            # 길이 보상
-                diversity_penalty=DIVERSITY_PENALTY,
-                repetition_penalty=REPETITION_PENALTY,
-                no_repeat_ngram_size=NO_REPEAT_NGRAM_SIZE,
-                pad_token_id=tokenizer.pad_token_id,
-                eos_token_id=tokenizer.eos_token_id,
-            )
+        device = torch.device("cpu") # 배포 환경에 따라 "cuda" 또는 "cpu" 선택
         
-        candidates = [tokenizer.decode(output, skip_special_tokens=True).strip() for output in outputs]
-        generated_text = max(candidates, key=len)
+        model, backend = inference_backend.load_seq2seq(LOCAL_MODEL_PATH, CHATBOT_BACKEND, device)
         
-        response = generated_text.strip()
-        
-        # 2. 불필요한 공백 및 문장 잔여물 제거
-        if "\n" in response:
-            response = response.split("\n")[0].strip()
-        
-        # 3. 마침표 추가 (깔끔한 코멘트를 위해)
-        if response and not response.endswith(('.', '!', '?')):
-            response += '.'
-            
-        # 4. 길이 제한
-        if len(response) > 197:
-            response = response[:197].strip() + "..."
-            
-        return response
+        print(f"INFO: KoBART Diary Comment model loaded successfully from local path on {device} ({backend}).")
+        return SimpleNamespace(tokenizer=tokenizer, model=model, device=device, backend=backend, load_success=True)
+
+    except Exception as e:
+        print(f"ERROR: Failed to load KoBART model from {LOCAL_MODEL_PATH}. Error: {e}")
+        return SimpleNamespace(tokenizer=None, model=None, device="cpu", backend=None, load_success=False)
+
+
+def _warm_up(models: SimpleNamespace) -> None:
+    ## 더미 문장으로 한 번 생성 (캐시를 거치지 않음)
+    if models.load_success:
+        run_generation(models.model, models.tokenizer, models.device, "오늘 하루는 정말 즐거웠다")
+
+
+registry.register("chatbot", _load_models, _warm_up)
+
+
+def get_models() -> SimpleNamespace:
+    return registry.get("chatbot")
+
+
+def worker_init() -> None:
+    ## 코멘트 워커 프로세스 시작 시 호출 (ProcessPoolExecutor initializer)
+    registry.warm_up("chatbot")
+
+
+def worker_ready() -> str:
+    ## 워커가 로드/warm-up 을 마쳤는지 확인하기 위한 작업
+    return registry.state("chatbot")
+
+
+def get_cached_comment(content: str, profile: str = DEFAULT_PROFILE) -> Optional[Tuple[str, str]]:
+    """
+    (코멘트, 생성에 사용된 프로파일) 반환
+    요청한 프로파일보다 비싼 프로파일로 만든 결과가 있으면 그것을 그대로 사용
+    """
+    for candidate in PROFILE_ORDER[:PROFILE_ORDER.index(resolve_profile(profile)) + 1]:
+        cached = comment_cache.get(_cache_key(content, candidate))
+        if cached is not None:
+            return cached, candidate
+    return None
+
+
+def cache_comment(content: str, comment: str, profile: str = DEFAULT_PROFILE) -> None:
+    if comment and comment not in FAILED_COMMENTS:
+        comment_cache.put(_cache_key(content, resolve_profile(profile)), comment)
+
+
+def _cache_key(content: str, profile: str) -> str:
+    return comment_cache.make_key(content, f"{CHATBOT_MODEL_VERSION}:{profile}")
+
+
+def generate_comment(content: str, profile: str = DEFAULT_PROFILE) -> Tuple[str, Optional[str]]:
+    """
+    (코멘트 본문, 실제로 본문을 만든 프로파일) 반환
+    캐시 hit 이면 캐시에 저장할 때의 프로파일, 실패 문구면 None
+    """
+    models = get_models()
+    if not models.load_success:
+        return LOAD_FAILED_COMMENT, None
+    
+    profile = resolve_profile(profile)
+
+    ## 같은 내용으로 생성한 적이 있으면 beam search 생략
+    cached = get_cached_comment(content, profile)
+    if cached is not None:
+        return cached
+    
+    response = _generate_comment(models, content, profile)
+    if response in FAILED_COMMENTS:
+        return response, None
+    cache_comment(content, response, profile)
+    return response, profile
+
+
+def _generate_comment(models: SimpleNamespace, content: str, profile: str = DEFAULT_PROFILE) -> str:
+    try:
+        return run_generation(models.model, models.tokenizer, models.device, content, profile)
 
     except Exception as e:
         print(f"ERROR during comment generation: {e}")
-        return "야, 미안! 지금 AI 친구가 잠깐 정신을 놨어. 다시 한번 시도해볼게."
\ No newline at end of file
+        return GENERATION_FAILED_COMMENT
+
+
+def run_generation(model, tokenizer, device, content: str, profile: str = DEFAULT_PROFILE) -> str:
+    ## 주어진 모델/토크나이저로 생성 + 후처리 (model_convert parity 검사에서도 사용)
+    prompt = content.strip() 
+    
+    inputs = tokenizer(prompt, return_tensors="pt").to(device)
+    
+    # KoBART 생성 파라미터 최적화
+    # TEMPERATURE = 0.7  <-- 제거됨
+    # TOP_P = 0.9        <-- 제거됨
+    REPETITION_PENALTY = 1.8
+    NO_REPEAT_NGRAM_SIZE = 2
+
+    ## beam 수 / 반환 개수 / 길이 등은 프로파일별 설정 사용
+    decoding = DECODING_PROFILES[resolve_profile(profile)]
+    
+    with torch.no_grad():
+        outputs = model.generate(
+            inputs.input_ids,
+            attention_mask=inputs.attention_mask,
+            do_sample=False,          
+            repetition_penalty=REPETITION_PENALTY,
+            no_repeat_ngram_size=NO_REPEAT_NGRAM_SIZE,
+            pad_token_id=tokenizer.pad_token_id,
+            eos_token_id=tokenizer.eos_token_id,
+            **decoding,
+        )
+    
+    candidates = [tokenizer.decode(output, skip_special_tokens=True).strip() for output in outputs]
+    generated_text = max(candidates, key=len)
+    
+    return postprocess_comment(generated_text)
+
+
+def postprocess_comment(generated_text: str) -> str:
+    response = generated_text.strip()
+    
+    # 2. 불필요한 공백 및 문장 잔여물 제거
+    if "\n" in response:
+        response = response.split("\n")[0].strip()
+    
+    # 3. 마침표 추가 (깔끔한 코멘트를 위해)
+    if response and not response.endswith(('.', '!', '?')):
+        response += '.'
+        
+    # 4. 길이 제한
+    if len(response) > 197:
+        response = response[:197].strip() + "..."
+        
+    return response
+
+
+def stream_generation(model, tokenizer, device, content: str, profile: str = PROFILE_FAST) -> Iterator[str]:
+    """
+    디코딩되는 대로 텍스트 조각을 yield (후처리 전 원문, 첫 줄까지만)
+    TextIteratorStreamer 는 beam search 를 지원하지 않으므로 greedy 프로파일만 사용
+    """
+    from transformers import TextIteratorStreamer
+
+    profile = streaming_profile(profile)
+
+    inputs = tokenizer(content.strip(), return_tensors="pt").to(device)
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=STREAM_TOKEN_TIMEOUT_SEC)
+    errors = []
+
+    def _generate():
+        try:
+            with torch.no_grad():
+                model.generate(
+                    inputs.input_ids,
+                    attention_mask=inputs.attention_mask,
+                    do_sample=False,
+                    repetition_penalty=1.8,
+                    no_repeat_ngram_size=2,
+                    pad_token_id=tokenizer.pad_token_id,
+                    eos_token_id=tokenizer.eos_token_id,
+                    streamer=streamer,
+                    **DECODING_PROFILES[profile],
+                )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            ## 예외가 나도 소비 측이 timeout 까지 기다리지 않도록 종료 신호
+            streamer.end()
+
+    thread = threading.Thread(target=_generate, name="chatbot-stream", daemon=True)
+    thread.start()
+
+    for text in streamer:
+        if "\n" in text:
+            ## 후처리에서 첫 줄만 사용하므로 그 뒤는 보내지 않음
+            text = text.split("\n")[0]
+            if text:
+                yield text
+            break
+        if text:
+            yield text
+
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def streaming_profile(profile: Optional[str]) -> str:
+    ## beam search 프로파일은 스트리밍할 수 없으므로 fast 로 생성
+    profile = resolve_profile(profile)
+    return PROFILE_FAST if DECODING_PROFILES[profile]["num_beams"] > 1 else profile
+
+
+def stream_comment(content: str, sink, profile: str = PROFILE_FAST) -> Tuple[str, Optional[str]]:
+    """
+    생성되는 텍스트 조각을 sink.put() 으로 넘기고, (후처리한 최종 코멘트, 실제 프로파일) 반환
+    (sink 는 queue.Queue 또는 워커 프로세스용 Manager().Queue())
+    """
+    models = get_models()
+    if not models.load_success:
+        sink.put(LOAD_FAILED_COMMENT)
+        return LOAD_FAILED_COMMENT, None
+
+    profile = streaming_profile(profile)
+    cached = get_cached_comment(content, profile)
+    if cached is not None:
+        sink.put(cached[0])
+        return cached
+
+    chunks = []
+    for chunk in stream_generation(models.model, models.tokenizer, models.device, content, profile):
+        chunks.append(chunk)
+        sink.put(chunk)
+
+    response = postprocess_comment("".join(chunks))
+    cache_comment(content, response, profile)
+    return response, profile
@@ -0,0 +1,608 @@
+# backend/app/service/comment_jobs.py
+import os
+import re
+import asyncio
+import time
+import queue
+import random
+import socket
+import threading
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..database import SessionLocal
+from ..metrics import Histogram
+from ..models.user import User
+from ..models.diary import Diary
+from ..config.templates import (
+    INTRO_TEMPLATES,
+    WARMTH_TEMPLATES,
+)
+from . import chatbot_service, inference_client
+from .model_registry import STATE_FAILED, STATE_LOADED, STATE_WARM, registry
+
+## AI 코멘트 생성 상태
+COMMENT_STATUS_PENDING = "pending"
+COMMENT_STATUS_DONE = "done"
+COMMENT_STATUS_FAILED = "failed"
+
+## 코멘트가 완성되기 전까지 저장해 둘 문구
+COMMENT_PLACEHOLDER = "AI 친구가 일기를 읽고 있어요. 잠시만 기다려 주세요✍️"
+
+## 0이면 기존처럼 요청 스레드에서 바로 코멘트를 생성
+COMMENT_JOBS_ENABLED = os.getenv("COMMENT_JOBS_ENABLED", "1") == "1"
+COMMENT_WORKERS = int(os.getenv("COMMENT_WORKERS", 1))
+COMMENT_RESUME_ON_STARTUP = os.getenv("COMMENT_RESUME_ON_STARTUP", "1") == "1"
+## 다른 프로세스가 맡은 pending 작업을 넘겨받기까지 기다릴 시간(초)
+# 같은 host 에서 이미 종료된 프로세스가 맡았던 작업은 바로 넘겨받음
+COMMENT_CLAIM_TIMEOUT_SEC = int(os.getenv("COMMENT_CLAIM_TIMEOUT_SEC", 300))
+
+## pending 작업을 맡은 프로세스 표시 (TB_diary.comment_claimed_by)
+_HOSTNAME = socket.gethostname()
+PROCESS_ID = f"{_HOSTNAME}:{os.getpid()}"
+
+## 코멘트 하나가 완성되기까지 허용할 시간(ms), 0이면 항상 기본 프로파일(CHATBOT_PROFILE) 사용
+# 앞에 밀려 있는 작업 + 새 작업의 예상 시간이 예산을 넘으면 더 가벼운 프로파일로 낮춤
+COMMENT_LATENCY_BUDGET_MS = float(os.getenv("COMMENT_LATENCY_BUDGET_MS", 0))
+
+## 프로파일별 예상 생성 시간(ms) 초기값, 모델이 준비된 상태에서 큐가 비어 있을 때 실행된 작업의 실측값으로 계속 보정
+_profile_cost_ms: Dict[str, float] = {
+    chatbot_service.PROFILE_QUALITY: float(os.getenv("COMMENT_COST_QUALITY_MS", 2500)),
+    chatbot_service.PROFILE_BALANCED: float(os.getenv("COMMENT_COST_BALANCED_MS", 1000)),
+    chatbot_service.PROFILE_FAST: float(os.getenv("COMMENT_COST_FAST_MS", 300)),
+}
+_COST_EWMA_ALPHA = 0.2
+
+## 프로파일별 실제 작업 소요 시간(ms) / 선택 횟수
+profile_latency_hist: Dict[str, Histogram] = {
+    profile: Histogram(f"comment_{profile}_latency_ms", [100, 250, 500, 1000, 2500, 5000, 10000, 30000])
+    for profile in chatbot_service.PROFILE_ORDER
+}
+_profile_counts: Dict[str, int] = {profile: 0 for profile in chatbot_service.PROFILE_ORDER}
+
+_executor: Optional[Executor] = None
+_manager: Optional[Any] = None
+## 워커 프로세스의 모델 상태 (warm_up_workers 결과, /health/ready 에 표시)
+workers_state: Optional[str] = None
+## warm-up 없이 시작한 경우에도 워커가 작업을 한 번 끝냈으면 모델이 로드된 것으로 봄 (executor 를 새로 만들면 초기화)
+_workers_warm = False
+_executor_lock = threading.Lock()
+
+## diary_id -> 진행 중인 작업 완료 이벤트 (long-poll 대기용)
+_jobs: Dict[str, threading.Event] = {}
+_jobs_lock = threading.Lock()
+## diary_id -> async long-poll 대기자 (이벤트 루프, future)
+_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+## 진행 중인 작업들의 예상 시간 합계(ms), 요청 스레드에서 바로 생성 중인 작업(generate_now) 포함
+_inflight_cost_ms = 0.0
+## generate_now 로 요청 스레드에서 생성 중인 작업 수
+_sync_jobs = 0
+
+
+def clean_content(content: str) -> str:
+    cleaned_content = re.sub(r'[^\w\s\.\,\!\?]', '', content)
+    return ' '.join(cleaned_content.split()).strip()
+
+
+def default_comment(user_name: str) -> str:
+    return f"오늘 {user_name}님은 여러가지 감정이 섞인 하루를 보냈군요"
+
+
+def pick_intro(user_name: str) -> str:
+    intro_template_list = list(INTRO_TEMPLATES)
+    selected_intro_template = random.choice(intro_template_list)
+    return f"{user_name}{selected_intro_template}"
+
+
+def pick_warmth(emotion_label: str) -> str:
+    warmth_templates = WARMTH_TEMPLATES.get(emotion_label, WARMTH_TEMPLATES["Natural"])
+    return random.choice(warmth_templates)
+
+
+def compose_comment(ai_comment_raw: str, user_name: str, emotion_label: str,
+                    intro_phrase: Optional[str] = None, warmth_phrase: Optional[str] = None) -> str:
+    ## 모델이 만든 본문 앞뒤로 인사말 / 감정별 덧붙임 문구를 붙임
+    if intro_phrase is None:
+        intro_phrase = pick_intro(user_name)
+    if warmth_phrase is None:
+        warmth_phrase = pick_warmth(emotion_label)
+
+    return f"{intro_phrase} {ai_comment_raw} {warmth_phrase}"
+
+
+def queue_depth() -> int:
+    with _jobs_lock:
+        return len(_jobs) + _sync_jobs
+
+
+def choose_profile(budget_ms: Optional[float] = None) -> str:
+    """
+    지연 시간 예산 안에 끝날 것으로 예상되는 가장 좋은 프로파일 선택
+    예상 시간 = 앞에 밀린 작업들의 예상 시간 / 워커 수 + 이 작업의 예상 시간
+    """
+    if budget_ms is None:
+        budget_ms = COMMENT_LATENCY_BUDGET_MS
+    default_profile = chatbot_service.DEFAULT_PROFILE
+    if budget_ms <= 0:
+        return default_profile
+
+    with _jobs_lock:
+        queued_ms = _inflight_cost_ms / max(1, COMMENT_WORKERS)
+        cost_ms = dict(_profile_cost_ms)
+
+    candidates = chatbot_service.PROFILE_ORDER[chatbot_service.PROFILE_ORDER.index(default_profile):]
+    for profile in candidates:
+        if queued_ms + cost_ms[profile] <= budget_ms:
+            return profile
+    ## 어떤 프로파일로도 예산을 맞출 수 없으면 가장 가벼운 프로파일
+    return candidates[-1]
+
+
+def _generation_warm(in_process: bool) -> bool:
+    ## 작업 시작 시점에 모델이 이미 준비되어 있는지 (생성 시간에 모델 로드 / warm-up 이 섞이지 않는지)
+    if inference_client.is_remote():
+        ## 모델은 추론 서버가 관리
+        return True
+    if in_process:
+        ## generate_now: 이 프로세스의 모델을 바로 사용
+        return registry.state("chatbot") in (STATE_LOADED, STATE_WARM)
+    return workers_state not in (None, STATE_FAILED) or _workers_warm
+
+
+def _record_latency(profile: str, used_profile: Optional[str], elapsed_ms: float, measurable: bool) -> None:
+    ## 요청한 프로파일로 실제 생성한 작업만 기록 (캐시 hit / 실패 문구는 생성 시간이 아님)
+    if used_profile != profile:
+        return
+    profile_latency_hist[profile].observe(elapsed_ms)
+    if measurable:
+        ## 모델이 준비된 상태에서 대기 없이 바로 실행된 작업만 순수 생성 시간으로 보고 예상치를 보정
+        with _jobs_lock:
+            _profile_cost_ms[profile] += _COST_EWMA_ALPHA * (elapsed_ms - _profile_cost_ms[profile])
+
+
+def _start_job(profile: str, diary_id: Optional[str] = None,
+               event: Optional[threading.Event] = None) -> Tuple[float, bool]:
+    ## 진행 중인 작업으로 등록하고 (예상 시간, 생성 시간을 예상치 보정에 쓸 수 있는지) 반환
+    global _inflight_cost_ms, _sync_jobs
+    warm = _generation_warm(in_process=diary_id is None)
+    with _jobs_lock:
+        cost_ms = _profile_cost_ms[profile]
+        measurable = warm and not _jobs and _sync_jobs == 0
+        if diary_id is None:
+            _sync_jobs += 1
+        else:
+            _jobs[diary_id] = event
+        _inflight_cost_ms += cost_ms
+        _profile_counts[profile] += 1
+    return cost_ms, measurable
+
+
+def get_job_metrics() -> Dict[str, object]:
+    return {
+        "queue_depth": queue_depth(),
+        "latency_budget_ms": COMMENT_LATENCY_BUDGET_MS,
+        "default_profile": chatbot_service.DEFAULT_PROFILE,
+        "profiles": {
+            profile: {
+                "selected": _profile_counts[profile],
+                "estimated_ms": round(_profile_cost_ms[profile], 1),
+                "latency_ms": profile_latency_hist[profile].snapshot(),
+            }
+            for profile in chatbot_service.PROFILE_ORDER
+        },
+    }
+
+
+def _get_executor() -> Executor:
+    ## torch 추론이 이벤트 루프/요청 스레드와 경쟁하지 않도록 별도 프로세스에서 실행
+    # 추론 서버를 쓰는 경우에는 이미 별도 프로세스이므로 HTTP 호출만 스레드에서 기다림
+    global _executor
+    with _executor_lock:
+        if _executor is None and inference_client.is_remote():
+            _executor = ThreadPoolExecutor(max_workers=COMMENT_WORKERS, thread_name_prefix="comment-job")
+        elif _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=COMMENT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=chatbot_service.worker_init,
+            )
+        return _executor
+
+
+def _get_stream_queue():
+    ## 워커 프로세스에서 생성한 조각을 받을 큐 (프로세스 간 전달은 Manager 큐 사용)
+    global _manager
+    if inference_client.is_remote():
+        return queue.Queue()
+    with _executor_lock:
+        if _manager is None:
+            _manager = multiprocessing.get_context("spawn").Manager()
+        return _manager.Queue()
+
+
+def _reset_executor() -> None:
+    global _executor, _workers_warm
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = None
+        _workers_warm = False
+
+
+def _save_comment(diary_id: str, content: str, ai_comment: str, status: str,
+                  profile: Optional[str] = None) -> None:
+    ## 작업 도중 일기가 수정/삭제되었으면 (content 불일치) 결과를 버림
+    db = SessionLocal()
+    try:
+        db.query(Diary).filter(
+            Diary.id == diary_id,
+            Diary.content == content,
+            Diary.comment_status == COMMENT_STATUS_PENDING,
+        ).update(
+            {"ai_comment": ai_comment, "comment_status": status, "comment_profile": profile},
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"ERROR: Failed to save AI comment for diary {diary_id}: {e}")
+    finally:
+        db.close()
+
+
+def claim_values(pending: bool) -> Dict[str, Any]:
+    ## 일기를 pending 으로 저장할 때 이 프로세스가 작업을 맡았다고 같이 기록
+    if not pending:
+        return {"comment_claimed_by": None, "comment_claimed_at": None}
+    return {"comment_claimed_by": PROCESS_ID, "comment_claimed_at": datetime.now(timezone.utc).replace(tzinfo=None)}
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _claim_expired(claimed_by: Optional[str], claimed_at: Optional[datetime], now: datetime) -> bool:
+    ## 맡은 프로세스가 없거나, 같은 host 에서 이미 종료되었거나, 너무 오래된 작업
+    if claimed_by is None or claimed_at is None:
+        return True
+    if claimed_by == PROCESS_ID:
+        return False
+    host, _, pid = claimed_by.rpartition(":")
+    ## os.kill(pid, 0) 은 POSIX 에서만 존재 확인 용도로 쓸 수 있음
+    if os.name == "posix" and host == _HOSTNAME and pid.isdigit():
+        if not _process_alive(int(pid)):
+            return True
+    return now - claimed_at > timedelta(seconds=COMMENT_CLAIM_TIMEOUT_SEC)
+
+
+def _claim_job(db, diary_id: str, content: str, claimed_by: Optional[str]) -> bool:
+    """
+    조회했을 때와 같은 프로세스가 맡고 있는 경우에만 이 프로세스로 바꿈 (compare-and-set)
+    여러 worker 가 동시에 재시작해도 한 곳만 rowcount 1 을 받음
+    """
+    claimed_filter = Diary.comment_claimed_by.is_(None) if claimed_by is None else Diary.comment_claimed_by == claimed_by
+    updated = db.query(Diary).filter(
+        Diary.id == diary_id,
+        Diary.content == content,
+        Diary.comment_status == COMMENT_STATUS_PENDING,
+        claimed_filter,
+    ).update(claim_values(True), synchronize_session=False)
+    db.commit()
+    return updated == 1
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(True)
+
+
+def _finish_job(diary_id: str, event: threading.Event, cost_ms: float = 0.0) -> None:
+    global _inflight_cost_ms
+    event.set()
+    waiters = []
+    with _jobs_lock:
+        _inflight_cost_ms = max(0.0, _inflight_cost_ms - cost_ms)
+        if _jobs.get(diary_id) is event:
+            del _jobs[diary_id]
+            waiters = _waiters.pop(diary_id, [])
+    ## 작업 완료 콜백은 워커 스레드에서 실행되므로 각 이벤트 루프에 넘겨서 깨움
+    for loop, future in waiters:
+        loop.call_soon_threadsafe(_wake, future)
+
+
+def _on_job_done(future: Future, diary_id: str, content: str, user_name: str,
+                 emotion_label: str, event: threading.Event, profile: str,
+                 cost_ms: float, started: float, measurable: bool) -> None:
+    global _workers_warm
+    used_profile = None
+    try:
+        ai_comment_raw, used_profile = future.result()
+        _record_latency(profile, used_profile, (time.perf_counter() - started) * 1000.0, measurable)
+        _workers_warm = _workers_warm or used_profile is not None
+        ## 워커 프로세스의 캐시와 별개로 이 프로세스의 캐시에도 저장
+        if used_profile is not None:
+            chatbot_service.cache_comment(clean_content(content), ai_comment_raw, used_profile)
+        ai_comment = compose_comment(ai_comment_raw, user_name, emotion_label)
+        status = COMMENT_STATUS_DONE
+    except Exception as e:
+        print(f"Chatbot Job Failed (diary {diary_id}): {e}")
+        if isinstance(e, BrokenProcessPool):
+            _reset_executor()
+        ai_comment = default_comment(user_name)
+        status = COMMENT_STATUS_FAILED
+
+    try:
+        ## 캐시 / 실패 문구로 끝났으면 요청한 프로파일이 아니라 실제 프로파일(없으면 None) 저장
+        _save_comment(diary_id, content, ai_comment, status, used_profile)
+    finally:
+        _finish_job(diary_id, event, cost_ms)
+
+
+def submit_comment_job(diary_id: str, content: str, user_name: str, emotion_label: str,
+                       budget_ms: Optional[float] = None) -> bool:
+    """
+    일기 저장 이후 호출: 워커 프로세스에서 코멘트를 생성하고 완료되면 DB에 반영
+    budget_ms 가 없으면 COMMENT_LATENCY_BUDGET_MS 기준으로 디코딩 프로파일을 고름
+    캐시 hit 등으로 이미 DB에 반영된 경우 True 반환
+    """
+    cleaned_content = clean_content(content)
+    profile = choose_profile(budget_ms)
+
+    ## 이전에 생성한 적 있는 내용이면 워커를 거치지 않고 바로 저장
+    cached = chatbot_service.get_cached_comment(cleaned_content, profile)
+    if cached is not None:
+        cached_comment, cached_profile = cached
+        _save_comment(diary_id, content, compose_comment(cached_comment, user_name, emotion_label),
+                      COMMENT_STATUS_DONE, cached_profile)
+        return True
+
+    event = threading.Event()
+    cost_ms, measurable = _start_job(profile, diary_id, event)
+
+    try:
+        generate = inference_client.generate_comment if inference_client.is_remote() else chatbot_service.generate_comment
+        started = time.perf_counter()
+        future = _get_executor().submit(generate, cleaned_content, profile)
+    except Exception as e:
+        print(f"ERROR: Failed to submit chatbot job (diary {diary_id}): {e}")
+        _reset_executor()
+        _save_comment(diary_id, content, default_comment(user_name), COMMENT_STATUS_FAILED)
+        _finish_job(diary_id, event, cost_ms)
+        return True
+
+    future.add_done_callback(
+        lambda f: _on_job_done(f, diary_id, content, user_name, emotion_label, event,
+                               profile, cost_ms, started, measurable)
+    )
+    return False
+
+
+def generate_now(content: str, budget_ms: Optional[float] = None) -> Tuple[str, Optional[str]]:
+    """
+    COMMENT_JOBS_ENABLED=0 일 때 요청 스레드에서 바로 코멘트 본문 생성 (run_in_threadpool 로 호출)
+    생성하는 동안 예상 시간을 진행 중인 작업에 포함해서 다른 요청의 프로파일 선택에 반영
+    (코멘트 본문, 실제 프로파일) 반환, 실패하면 예외를 그대로 올림
+    """
+    global _inflight_cost_ms, _sync_jobs
+    cleaned_content = clean_content(content)
+    profile = choose_profile(budget_ms)
+
+    cached = chatbot_service.get_cached_comment(cleaned_content, profile)
+    if cached is not None:
+        return cached
+
+    cost_ms, measurable = _start_job(profile)
+    try:
+        started = time.perf_counter()
+        ai_comment_raw, used_profile = inference_client.generate_comment(cleaned_content, profile)
+        _record_latency(profile, used_profile, (time.perf_counter() - started) * 1000.0, measurable)
+        return ai_comment_raw, used_profile
+    finally:
+        with _jobs_lock:
+            _sync_jobs -= 1
+            _inflight_cost_ms = max(0.0, _inflight_cost_ms - cost_ms)
+
+
+class CommentStream:
+    """
+    스트리밍 코멘트 작업 하나
+    인사말/덧붙임 문구는 바로 정해 두고, 본문 조각은 iter() 로 받음
+    최종 코멘트 저장은 작업 완료 콜백에서 하므로 클라이언트 연결이 끊겨도 DB에는 반영됨
+    """
+
+    def __init__(self, diary_id: str, content: str, user_name: str, emotion_label: str):
+        self.diary_id = diary_id
+        self.content = content
+        self.user_name = user_name
+        self.intro = pick_intro(user_name)
+        self.warmth = pick_warmth(emotion_label)
+        ## TextIteratorStreamer 는 greedy 디코딩만 지원
+        self.profile = chatbot_service.PROFILE_FAST
+        self.ai_comment: Optional[str] = None
+        self.status: Optional[str] = None
+        self.comment_profile: Optional[str] = None
+        self._chunks = None
+        self._done = threading.Event()
+
+    def start(self) -> None:
+        cleaned_content = clean_content(self.content)
+
+        cached = chatbot_service.get_cached_comment(cleaned_content, self.profile)
+        if cached is not None:
+            self._chunks = queue.Queue()
+            self._chunks.put(cached[0])
+            self._complete(cached[0], COMMENT_STATUS_DONE, cached[1])
+            return
+
+        cost_ms, measurable = _start_job(self.profile, self.diary_id, self._done)
+
+        try:
+            self._chunks = _get_stream_queue()
+            stream = inference_client.stream_comment if inference_client.is_remote() else chatbot_service.stream_comment
+            started = time.perf_counter()
+            future = _get_executor().submit(stream, cleaned_content, self._chunks, self.profile)
+        except Exception as e:
+            print(f"ERROR: Failed to submit streaming chatbot job (diary {self.diary_id}): {e}")
+            _reset_executor()
+            self._chunks = queue.Queue()
+            self._complete(None, COMMENT_STATUS_FAILED, None)
+            _finish_job(self.diary_id, self._done, cost_ms)
+            return
+
+        future.add_done_callback(
+            lambda f: self._on_done(f, cost_ms, started, measurable)
+        )
+
+    def _on_done(self, future: Future, cost_ms: float, started: float, measurable: bool) -> None:
+        global _workers_warm
+        try:
+            ai_comment_raw, used_profile = future.result()
+            _record_latency(self.profile, used_profile, (time.perf_counter() - started) * 1000.0, measurable)
+            _workers_warm = _workers_warm or used_profile is not None
+            if used_profile is not None:
+                chatbot_service.cache_comment(clean_content(self.content), ai_comment_raw, used_profile)
+            self._complete(ai_comment_raw, COMMENT_STATUS_DONE, used_profile)
+        except Exception as e:
+            print(f"Chatbot Stream Job Failed (diary {self.diary_id}): {e}")
+            if isinstance(e, BrokenProcessPool):
+                _reset_executor()
+            self._complete(None, COMMENT_STATUS_FAILED, None)
+        finally:
+            _finish_job(self.diary_id, self._done, cost_ms)
+
+    def _complete(self, ai_comment_raw: Optional[str], status: str, profile: Optional[str]) -> None:
+        if ai_comment_raw is None:
+            self.ai_comment = default_comment(self.user_name)
+        else:
+            self.ai_comment = compose_comment(ai_comment_raw, self.user_name, "", self.intro, self.warmth)
+        self.status = status
+        self.comment_profile = profile
+        try:
+            _save_comment(self.diary_id, self.content, self.ai_comment, status, profile)
+        finally:
+            ## 소비 측 iter() 종료 신호 (워커가 비정상 종료해도 반드시 전달)
+            try:
+                self._chunks.put(None)
+            except Exception:
+                pass
+            self._done.set()
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            try:
+                chunk = self._chunks.get(timeout=chatbot_service.STREAM_TOKEN_TIMEOUT_SEC)
+            except queue.Empty:
+                return
+            if chunk is None:
+                return
+            yield chunk
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+
+def warm_up_workers(timeout: Optional[float] = None) -> bool:
+    """
+    워커 프로세스를 미리 띄워 모델 로드 + warm-up 을 마침 (readiness 확인용)
+    """
+    global workers_state
+    if inference_client.is_remote():
+        ## 모델은 추론 서버가 관리
+        workers_state = "remote"
+        return True
+    try:
+        workers_state = _get_executor().submit(chatbot_service.worker_ready).result(timeout=timeout)
+    except Exception as e:
+        print(f"ERROR: Chatbot worker warm-up failed: {e}")
+        workers_state = STATE_FAILED
+    return workers_state != STATE_FAILED
+
+
+def wait_for_local_job(diary_id: str, timeout: float) -> bool:
+    """
+    이 프로세스에서 진행 중인 작업이면 완료까지 최대 timeout 초 대기
+    (작업이 없으면 False 반환 -> 호출 측에서 DB를 다시 확인)
+    """
+    with _jobs_lock:
+        event = _jobs.get(diary_id)
+    if event is None:
+        return False
+    return event.wait(timeout)
+
+
+async def wait_for_local_job_async(diary_id: str, timeout: float) -> bool:
+    """
+    wait_for_local_job 의 async 버전 (대기하는 동안 스레드를 점유하지 않음)
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    with _jobs_lock:
+        if diary_id not in _jobs:
+            return False
+        _waiters.setdefault(diary_id, []).append((loop, future))
+
+    try:
+        await asyncio.wait_for(future, timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        with _jobs_lock:
+            waiters = _waiters.get(diary_id)
+            if waiters and (loop, future) in waiters:
+                waiters.remove((loop, future))
+                if not waiters:
+                    del _waiters[diary_id]
+
+
+def resume_pending_jobs() -> None:
+    """
+    서버 재시작 등으로 pending 상태에 멈춘 일기들의 코멘트 작업을 다시 등록
+    uvicorn worker 마다 실행되므로 작업마다 먼저 claim 에 성공한 프로세스만 등록
+    (다른 살아 있는 프로세스가 맡고 있는 작업은 건드리지 않음)
+    """
+    if not COMMENT_JOBS_ENABLED or not COMMENT_RESUME_ON_STARTUP:
+        return
+
+    db = SessionLocal()
+    claimed = []
+    try:
+        pending = db.query(Diary.id, Diary.content, Diary.emotion_label, User.user_name,
+                           Diary.comment_claimed_by, Diary.comment_claimed_at)\
+            .join(User, Diary.user_id == User.id)\
+                .filter(Diary.comment_status == COMMENT_STATUS_PENDING).all()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for diary_id, content, emotion_label, user_name, claimed_by, claimed_at in pending:
+            if _claim_expired(claimed_by, claimed_at, now) and _claim_job(db, diary_id, content, claimed_by):
+                claimed.append((diary_id, content, emotion_label, user_name))
+    except Exception as e:
+        db.rollback()
+        print(f"ERROR: Failed to claim pending AI comment jobs: {e}")
+    finally:
+        db.close()
+
+    for diary_id, content, emotion_label, user_name in claimed:
+        submit_comment_job(diary_id, content, user_name, emotion_label)
+
+    if claimed:
+        print(f"INFO: Resumed {len(claimed)} pending AI comment jobs ({PROCESS_ID}).")
+
+
+def shutdown() -> None:
+    global _executor, _manager
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        if _manager is not None:
+            _manager.shutdown()
+        _manager = None
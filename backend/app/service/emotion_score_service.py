@@ -0,0 +1,164 @@
+# backend/app/service/emotion_score_service.py
+"""
+사용자 감정 점수 (최근 14일 일기 기반, 0~100)
+TB_user_emotion_score 에 사용자당 한 행으로 저장해 두고 일기 저장/수정/삭제 시 다시 계산
+시간 가중치가 날짜에 따라 바뀌므로 기준일(score_date)이 지난 점수는 조회 시점에 다시 계산 (lazy roll-forward)
+
+    # 매일 새벽 전체 사용자 점수를 미리 갱신 (cron 등, 선택 사항)
+    python -m app.service.emotion_score_service
+"""
+import asyncio
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import AsyncSessionLocal, get_async_engine
+from ..models.userEmotionScore import UserEmotionScore
+from ..repositories import diary_repository
+
+## 감정 중요도 가중치
+EMOTION_WEIGHTS = {
+    "Angry": -3.0, # 가장 부정
+    "Fear": -4.0,
+    "Sad": -5.0,
+    "Happy": 5.0,  # 가장 긍정
+    "Tender": 3.0,
+    "Neutral": 1.0, # 중립
+}
+
+DAYS_WINDOW = 14
+
+
+def calculate_emotion_score(diaries: List[Any], weights: Dict[str, float], today: Optional[date] = None) -> float:
+
+    current_score = 100.0  # 심리 건강 기준점
+
+    if not diaries:
+        return current_score
+
+    # 일기가 최신순으로 정렬되어 있다고 가정
+    today = today or date.today()
+
+    # 2. 총 일기 수
+    total_cnt = len(diaries)
+
+    # 3. 최대/최소 변동 폭 설정
+    MAX_SCORE_CHANGE_PER_DIARY = 5.0
+    MAX_TOTAL_CHANGE = total_cnt * MAX_SCORE_CHANGE_PER_DIARY
+
+    # 4. 점수 조정 누적
+    total_adjustment = 0.0
+
+    for diary in diaries:
+        label = diary.emotion_label
+
+        weight = weights.get(label)
+
+        if weight is not None:
+
+            days_ago = (today - diary.diary_date).days
+
+            # 최근일수록 1.0에 가깝고, 14일 전일수록 0.1(최소값)에 가까워짐
+            decay_factor = max(0.1, (DAYS_WINDOW - days_ago) / DAYS_WINDOW)
+
+            # 4-2. 조정 값 계산: 시간 가중치 적용
+            # 조정 값: (가중치 * 감정 확률) * 시간 가중치
+            adjustment_value = (weight * diary.emotion_score) * decay_factor
+            total_adjustment += adjustment_value
+
+    # 5. 최대/최소 변동 폭 적용하여 최종 점수 계산
+    if abs(total_adjustment) > MAX_TOTAL_CHANGE:
+        if total_adjustment > 0:
+            final_adjustment = MAX_TOTAL_CHANGE
+        else:
+            final_adjustment = -MAX_TOTAL_CHANGE
+    else:
+        final_adjustment = total_adjustment
+
+    # 시작 점수에 최종 조정 값 반영
+    final_score = current_score + final_adjustment
+
+    # 6. 최종 점수를 0점에서 100점 사이로 제한 및 반올림
+    user_emotion_score = round(max(0.0, min(100.0, final_score)), 1)
+
+    return user_emotion_score
+
+
+async def _compute_score(db: AsyncSession, user_pk: str, today: date) -> float:
+    ## 점수 계산에 필요한 세 컬럼만 조회 (content / overall_emotion_score JSON 은 읽지 않음)
+    rows = await diary_repository.list_scores_since(db, user_pk, today - timedelta(days=DAYS_WINDOW))
+    return calculate_emotion_score(diaries=rows, weights=EMOTION_WEIGHTS, today=today)
+
+
+async def _store_score(db: AsyncSession, user_pk: str, score: float, today: date) -> None:
+    row = await db.get(UserEmotionScore, user_pk)
+    if row is None:
+        db.add(UserEmotionScore(user_id=user_pk, score=score, score_date=today))
+    else:
+        row.score = score
+        row.score_date = today
+    await db.flush()
+
+
+async def refresh_user_score(db: AsyncSession, user_pk: str) -> float:
+    """
+    일기 저장/수정/삭제 직후, 같은 트랜잭션 안에서 호출 (commit 은 호출 측에서)
+    """
+    today = date.today()
+    ## 세션이 autoflush=False 이므로 방금 추가한 일기를 먼저 반영
+    await db.flush()
+    score = await _compute_score(db, user_pk, today)
+    await _store_score(db, user_pk, score, today)
+    return score
+
+
+async def get_user_score(db: AsyncSession, user_pk: str) -> float:
+    today = date.today()
+    row = await db.get(UserEmotionScore, user_pk)
+    if row is not None and row.score_date == today:
+        return row.score
+
+    ## 아직 계산한 적이 없거나 날짜가 바뀐 경우 -> 다시 계산해서 저장
+    score = await _compute_score(db, user_pk, today)
+    try:
+        await _store_score(db, user_pk, score, today)
+        await db.commit()
+    except SQLAlchemyError as e:
+        ## 저장 실패(동시 요청이 먼저 저장한 경우 등)해도 계산한 점수는 그대로 반환
+        await db.rollback()
+        print(f"WARNING: Emotion score roll-forward save failed for {user_pk}: {e}")
+    return score
+
+
+async def roll_forward_all(batch_size: int = 500) -> int:
+    ## 기준일이 지난 점수를 모두 오늘 기준으로 다시 계산
+    get_async_engine()
+    today = date.today()
+    updated = 0
+    async with AsyncSessionLocal() as db:
+        user_pks = (await db.execute(
+            select(UserEmotionScore.user_id).where(UserEmotionScore.score_date < today)
+        )).scalars().all()
+
+        for user_pk in user_pks:
+            score = await _compute_score(db, user_pk, today)
+            await _store_score(db, user_pk, score, today)
+            updated += 1
+            if updated % batch_size == 0:
+                await db.commit()
+        await db.commit()
+    return updated
+
+
+async def _main() -> int:
+    try:
+        return await roll_forward_all()
+    finally:
+        await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    print(f"감정 점수 갱신 완료: {asyncio.run(_main())}명")
@@ -0,0 +1,106 @@
+# backend/app/service/emotion_trend_service.py
+"""
+기간별 감정 추이 (연간 리뷰 / 임의 기간 차트)
+기간 안의 일기를 한 번에 조회한 뒤 일/주/월 구간별 개수, 평균 점수, 이동 평균을 NumPy 배열 연산으로 계산
+"""
+from datetime import date
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..repositories import diary_repository
+from .monthly_emotion_service import EMOTION_LABEL_CHART, EMOTION_LABEL
+
+BUCKETS = ("day", "week", "month")
+## 이동 평균 기본 구간 수 (일: 1주, 주: 약 1달, 월: 분기)
+DEFAULT_WINDOW = {"day": 7, "week": 4, "month": 3}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_LABEL_INDEX = {label: index for index, label in enumerate(EMOTION_LABEL)}
+_NEUTRAL_INDEX = _LABEL_INDEX["Neutral"]
+
+
+def _bucket_index(days: np.ndarray, bucket: str) -> np.ndarray:
+    ## days: 1970-01-01 기준 일수
+    if bucket == "day":
+        return days
+    if bucket == "week":
+        ## 1970-01-01 은 목요일 -> +3 일 해서 월요일 시작 주 번호
+        return (days + 3) // 7
+    return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+
+def _bucket_starts(first: int, last: int, bucket: str) -> List[str]:
+    ## 각 구간의 시작 날짜 (YYYY-MM-DD), 첫 구간은 시작 날짜보다 앞설 수 있음
+    index = np.arange(first, last + 1, dtype=np.int64)
+    if bucket == "day":
+        starts = index.astype("datetime64[D]")
+    elif bucket == "week":
+        starts = (index * 7 - 3).astype("datetime64[D]")
+    else:
+        starts = index.astype("datetime64[M]").astype("datetime64[D]")
+    return starts.astype(str).tolist()
+
+
+def _safe_divide(total: np.ndarray, count: np.ndarray) -> np.ndarray:
+    ## 일기가 없는 구간은 0.0 (월별 그래프의 일기 없는 날과 같은 기준)
+    count = count[:, None]
+    return np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+
+
+def aggregate_range(diary_dates: Sequence[date], emotion_labels: Sequence[str],
+                    overall_scores: Sequence[Dict[str, float]],
+                    start_date: date, end_date: date, bucket: str, window: int) -> Dict[str, Any]:
+    bounds = np.array([start_date.toordinal(), end_date.toordinal()], dtype=np.int64) - _EPOCH_ORDINAL
+    first, last = _bucket_index(bounds, bucket).tolist()
+    n_buckets = last - first + 1
+    n_labels = len(EMOTION_LABEL)
+    n_chart = len(EMOTION_LABEL_CHART)
+    count = len(diary_dates)
+
+    ## 일기 단위 배열 (행 변환만 파이썬에서, 구간 집계는 전부 배열 연산)
+    days = np.fromiter((day.toordinal() for day in diary_dates), dtype=np.int64, count=count) - _EPOCH_ORDINAL
+    buckets = _bucket_index(days, bucket) - first
+    labels = np.fromiter((_LABEL_INDEX.get(label, _NEUTRAL_INDEX) for label in emotion_labels),
+                         dtype=np.int64, count=count)
+    scores = np.array(
+        [[(overall or {}).get(label, 0.0) for label in EMOTION_LABEL_CHART] for overall in overall_scores],
+        dtype=np.float64,
+    ).reshape(count, n_chart)
+
+    diary_cnts = np.bincount(buckets, minlength=n_buckets)
+    emotion_cnts = np.bincount(buckets * n_labels + labels, minlength=n_buckets * n_labels).reshape(n_buckets, n_labels)
+    score_sums = np.zeros((n_buckets, n_chart), dtype=np.float64)
+    np.add.at(score_sums, buckets, scores)
+    mean_scores = _safe_divide(score_sums, diary_cnts)
+
+    ## 이동 평균: 현재 구간 포함 최근 window 개 구간에 속한 일기 전체의 평균 (누적합 차이로 계산)
+    cum_sums = np.vstack([np.zeros((1, n_chart)), np.cumsum(score_sums, axis=0)])
+    cum_cnts = np.concatenate([[0], np.cumsum(diary_cnts)])
+    lower = np.maximum(np.arange(1, n_buckets + 1) - window, 0)
+    moving_avg = _safe_divide(cum_sums[1:] - cum_sums[lower], cum_cnts[1:] - cum_cnts[lower])
+
+    mean_scores = np.round(mean_scores, 4)
+    moving_avg = np.round(moving_avg, 4)
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "bucket": bucket,
+        "window": window,
+        "diary_cnt": count,
+        "emotion_total": dict(zip(EMOTION_LABEL, np.bincount(labels, minlength=n_labels).tolist())),
+        "buckets": _bucket_starts(first, last, bucket),
+        "diary_cnts": diary_cnts.tolist(),
+        "emotion_cnts": dict(zip(EMOTION_LABEL, emotion_cnts.T.tolist())),
+        "mean_scores": dict(zip(EMOTION_LABEL_CHART, mean_scores.T.tolist())),
+        "moving_avg": dict(zip(EMOTION_LABEL_CHART, moving_avg.T.tolist())),
+    }
+
+
+async def get_range(db: AsyncSession, user_pk: str, start_date: date, end_date: date,
+                    bucket: str, window: int) -> Dict[str, Any]:
+    ## 필요한 세 컬럼만 한 번에 조회 (content 는 읽지 않음)
+    rows = await diary_repository.list_emotions(db, user_pk, start_date, end_date)
+    diary_dates, emotion_labels, overall_scores = zip(*rows) if rows else ((), (), ())
+    return aggregate_range(diary_dates, emotion_labels, overall_scores, start_date, end_date, bucket, window)
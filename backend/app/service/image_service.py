@@ -0,0 +1,162 @@
+# backend/app/service/image_service.py
+"""
+업로드 이미지 원본 메타데이터 제거 + 파생본(WebP) 생성
+원본은 저장할 때 EXIF(GPS 포함) / XMP / 주석을 지운 뒤 공개 경로에 둠 (strip_metadata, upload_service 에서 호출)
+파생본은 EXIF 회전을 적용하고 메타데이터를 뺀 WebP 로 같은 폴더에 만듦
+    <uuid>.thumb.webp    : 목록 / 달력용 (IMAGE_THUMB_MAX_PX 이내)
+    <uuid>.display.webp  : 상세 화면용 (IMAGE_DISPLAY_MAX_PX 이내)
+디코딩/리사이즈/인코딩은 요청 스레드가 아닌 전용 워커 풀에서 실행
+"""
+import os
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps
+
+## 파생본 이름 -> 긴 변의 최대 픽셀 (작은 것부터)
+IMAGE_VARIANTS: Dict[str, int] = {
+    "thumb": int(os.getenv("IMAGE_THUMB_MAX_PX", 320)),
+    "display": int(os.getenv("IMAGE_DISPLAY_MAX_PX", 1280)),
+}
+IMAGE_WEBP_QUALITY = int(os.getenv("IMAGE_WEBP_QUALITY", 80))
+## Pillow 는 디코딩/리사이즈/인코딩 중 GIL 을 놓으므로 스레드 풀로 충분 (기본 threadpool 과는 분리)
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+## 0 이면 파생본을 만들지 않음 (원본만 사용)
+IMAGE_VARIANTS_ENABLED = os.getenv("IMAGE_VARIANTS_ENABLED", "1") == "1"
+## 메타데이터를 지우면서 다시 인코딩할 때의 품질 (JPEG 는 회전이 없으면 원래 양자화 테이블 유지)
+IMAGE_REENCODE_QUALITY = int(os.getenv("IMAGE_REENCODE_QUALITY", 95))
+
+## 원본에서 지울 메타데이터 (EXIF 는 getexif() 로 따로 확인), ICC 색 정보는 유지
+_METADATA_INFO_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment", "photoshop", "iptc")
+## GIF 는 EXIF / GPS 를 담지 않으므로 다시 저장하지 않음
+_STRIP_FORMATS = ("JPEG", "PNG", "WEBP", "HEIF")
+_EXIF_ORIENTATION = 0x0112
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+_heif_checked = False
+
+
+def _register_heif_opener() -> None:
+    ## HEIC(iPhone 사진)는 pillow-heif 가 있어야 읽을 수 있음 (requirements.txt 9번, 없으면 HEIC 업로드는 415)
+    global _heif_checked
+    if not _heif_checked:
+        try:
+            from pillow_heif import register_heif_opener
+            register_heif_opener()
+        except ImportError:
+            print("WARNING: pillow-heif is not installed. HEIC uploads are rejected because their metadata cannot be removed.")
+        _heif_checked = True
+
+
+def strip_metadata(file_path: str) -> bool:
+    """
+    원본 이미지의 EXIF(GPS 포함) / XMP / 주석을 지우고 같은 형식으로 다시 저장 (blocking)
+    회전 정보는 픽셀에 반영, 지울 메타데이터가 없으면 파일을 그대로 둠 -> 다시 저장했으면 True
+    읽을 수 없는 파일이면 예외 (메타데이터를 확인하지 못한 원본은 공개하지 않도록 호출 측에서 거절)
+    """
+    _register_heif_opener()
+    with Image.open(file_path) as img:
+        image_format = img.format
+        exif = img.getexif()
+        if image_format not in _STRIP_FORMATS or (not exif and not any(key in img.info for key in _METADATA_INFO_KEYS)):
+            return False
+
+        options = {"format": image_format, "exif": b"", "xmp": b"", "comment": b""}
+        if img.info.get("icc_profile"):
+            options["icc_profile"] = img.info["icc_profile"]
+        if getattr(img, "is_animated", False):
+            ## 움직이는 WebP / PNG 는 프레임을 그대로 두고 메타데이터만 뺌
+            options["save_all"] = True
+            img.load()
+            cleaned = img
+        elif exif.get(_EXIF_ORIENTATION, 1) != 1:
+            cleaned = ImageOps.exif_transpose(img)
+        else:
+            img.load()
+            cleaned = img
+            if image_format == "JPEG":
+                options.update(quality="keep", subsampling="keep")
+        if image_format != "PNG" and "quality" not in options:
+            options["quality"] = IMAGE_REENCODE_QUALITY
+        ## 저장 옵션으로 넘기지 않은 값을 info 에서 다시 가져가지 않도록
+        cleaned.info = {}
+
+        temp_path = f"{file_path}.{threading.get_ident()}.clean"
+        try:
+            cleaned.save(temp_path, **options)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    os.replace(temp_path, file_path)
+    return True
+
+
+def variant_path(file_path: str, variant: str) -> str:
+    stem, _ = os.path.splitext(file_path)
+    return f"{stem}.{variant}.webp"
+
+
+def build_variants(file_path: str) -> Dict[str, str]:
+    """
+    원본 파일 -> {파생본 이름: 파일 경로} (blocking, 워커 풀에서 실행)
+    같은 내용의 원본(content-addressed)으로 이미 만든 파생본이 있으면 다시 만들지 않음
+    """
+    existing = {variant: variant_path(file_path, variant) for variant in IMAGE_VARIANTS}
+    if all(os.path.exists(path) for path in existing.values()):
+        return existing
+
+    largest = max(IMAGE_VARIANTS.values())
+    with Image.open(file_path) as img:
+        ## JPEG 는 필요한 크기 근처로 축소 디코딩 (큰 사진의 디코딩 비용 / 메모리 절약)
+        img.draft("RGB", (largest, largest))
+        ## 회전 정보를 픽셀에 반영 (이후 EXIF 는 저장하지 않음)
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+
+    paths: Dict[str, str] = {}
+    ## 큰 파생본부터 만들고, 작은 파생본은 직전 결과를 다시 줄여서 만듦
+    for variant, max_px in sorted(IMAGE_VARIANTS.items(), key=lambda item: item[1], reverse=True):
+        img.thumbnail((max_px, max_px), Image.LANCZOS)
+        path = variant_path(file_path, variant)
+        ## exif/icc_profile 을 넘기지 않으므로 메타데이터 없이 저장 (임시 파일 -> 교체, 파일이 있으면 완성본)
+        temp_path = f"{path}.{threading.get_ident()}.part"
+        img.save(temp_path, "WEBP", quality=IMAGE_WEBP_QUALITY, method=4)
+        os.replace(temp_path, path)
+        paths[variant] = path
+    return paths
+
+
+def _get_executor() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-variant")
+        return _executor
+
+
+async def create_variants(file_path: str, url_prefix: str) -> Optional[Dict[str, str]]:
+    """
+    파생본을 만들고 {파생본 이름: URL} 반환
+    이미지로 읽을 수 없는 파일이거나 실패하면 None (원본 URL 만 사용)
+    """
+    if not IMAGE_VARIANTS_ENABLED:
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        paths = await loop.run_in_executor(_get_executor(), build_variants, file_path)
+    except Exception as e:
+        print(f"WARNING: Image variant generation failed for {file_path}: {e}")
+        return None
+    return {variant: f"{url_prefix}/{os.path.basename(path)}" for variant, path in paths.items()}
+
+
+def shutdown() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,338 @@
+# backend/app/service/image_storage.py
+"""
+업로드 이미지 저장 backend (IMAGE_STORAGE=local|s3)
+    local : UPLOAD_DIR/<user pk>/<파일> 에 저장하고 /static/images 로 직접 서빙 (기본)
+    s3    : S3 호환 object storage (AWS S3, MinIO 등) 의 <IMAGE_S3_PREFIX><user pk>/<파일> 에 저장
+            클라이언트에는 presigned URL (또는 IMAGE_S3_PUBLIC_URL 의 CDN 주소) 을 내려서
+            이미지 byte 가 파이썬 워커를 거치지 않도록 함 (boto3 필요)
+DB 에는 backend 와 상관없이 /static/images/<user pk>/<파일> 형태의 URL 을 저장
+
+    # 설정한 backend 로 올리기/조회/삭제 확인 (예: 로컬 MinIO)
+    IMAGE_STORAGE=s3 IMAGE_S3_BUCKET=grooming IMAGE_S3_ENDPOINT_URL=http://localhost:9000 \\
+        AWS_ACCESS_KEY_ID=minioadmin AWS_SECRET_ACCESS_KEY=minioadmin python -m app.service.image_storage --check
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import contextlib
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from ..http_cache import IMMUTABLE_CACHE_CONTROL
+from .upload_service import IMAGE_EXTENSIONS
+
+IMAGE_STORAGE = os.getenv("IMAGE_STORAGE", "local")
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "app/images")
+IMAGE_URL_PREFIX = "/static/images"
+
+IMAGE_S3_BUCKET = os.getenv("IMAGE_S3_BUCKET", "")
+IMAGE_S3_PREFIX = os.getenv("IMAGE_S3_PREFIX", "images/")
+## MinIO 등 S3 호환 서버 주소 (비우면 AWS)
+IMAGE_S3_ENDPOINT_URL = os.getenv("IMAGE_S3_ENDPOINT_URL") or None
+IMAGE_S3_REGION = os.getenv("IMAGE_S3_REGION") or None
+## 공개 읽기 가능한 CDN / bucket 주소, 설정하면 presigned URL 대신 사용
+IMAGE_S3_PUBLIC_URL = os.getenv("IMAGE_S3_PUBLIC_URL", "").rstrip("/")
+IMAGE_S3_PRESIGN_TTL_SEC = int(os.getenv("IMAGE_S3_PRESIGN_TTL_SEC", 3600))
+IMAGE_S3_MAX_POOL_CONNECTIONS = int(os.getenv("IMAGE_S3_MAX_POOL_CONNECTIONS", 20))
+## s3 backend 에서 업로드 / 파생본 생성 중 임시로 쓰는 로컬 폴더
+IMAGE_STAGING_DIR = os.getenv("IMAGE_STAGING_DIR", os.path.join(tempfile.gettempdir(), "grooming-uploads"))
+
+
+_CONTENT_TYPES = {extension: content_type for content_type, extension in IMAGE_EXTENSIONS.items()}
+_CONTENT_TYPES[".jpeg"] = "image/jpeg"
+## presigned URL 캐시 최대 개수 (넘으면 비움)
+_PRESIGN_CACHE_MAX = 10000
+
+
+class StoredObject(NamedTuple):
+    name: str
+    size: int
+    mtime: float
+
+
+def content_type_for(name: str) -> str:
+    return _CONTENT_TYPES.get(os.path.splitext(name)[1].lower(), "application/octet-stream")
+
+
+class LocalStorage:
+    """
+    업로드 폴더 = 최종 저장 위치 (staging 후 옮길 필요 없음)
+    """
+    is_local = True
+
+    def __init__(self, root: str):
+        self.root = root
+        with contextlib.suppress(FileExistsError):
+            os.makedirs(root, exist_ok=True)
+
+    def user_dir(self, user_pk: str) -> str:
+        return os.path.join(self.root, user_pk)
+
+    def staging_dir(self, user_pk: str) -> str:
+        return self.user_dir(user_pk)
+
+    def put_files(self, user_pk: str, paths: List[str]) -> None:
+        target_dir = self.user_dir(user_pk)
+        for path in paths:
+            target = os.path.join(target_dir, os.path.basename(path))
+            if os.path.abspath(path) != os.path.abspath(target):
+                os.makedirs(target_dir, exist_ok=True)
+                os.replace(path, target)
+
+    def list_names(self, user_pk: str, prefix: str = "") -> Set[str]:
+        try:
+            return {name for name in os.listdir(self.user_dir(user_pk)) if name.startswith(prefix)}
+        except FileNotFoundError:
+            return set()
+
+    def mtime(self, user_pk: str, name: str) -> Optional[float]:
+        try:
+            return os.stat(os.path.join(self.user_dir(user_pk), name)).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def touch(self, user_pk: str, names: Iterable[str]) -> None:
+        for name in names:
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(os.path.join(self.user_dir(user_pk), name))
+
+    def delete(self, user_pk: str, names: Iterable[str]) -> int:
+        deleted = 0
+        for name in names:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(self.user_dir(user_pk), name))
+                deleted += 1
+        return deleted
+
+    def delete_user(self, user_pk: str) -> None:
+        shutil.rmtree(self.user_dir(user_pk), ignore_errors=True)
+
+    def iter_users(self) -> Iterator[str]:
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield entry.name
+
+    def iter_objects(self, user_pk: str) -> Iterator[StoredObject]:
+        with os.scandir(self.user_dir(user_pk)) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    yield StoredObject(entry.name, entry_stat.st_size, entry_stat.st_mtime)
+
+    def prune_user(self, user_pk: str) -> bool:
+        ## 빈 사용자 폴더 삭제 (파일이 남아 있으면 그대로)
+        try:
+            os.rmdir(self.user_dir(user_pk))
+            return True
+        except OSError:
+            return False
+
+    def url(self, user_pk: str, name: str) -> str:
+        return f"{IMAGE_URL_PREFIX}/{user_pk}/{name}"
+
+
+class S3Storage:
+    """
+    S3 호환 object storage, client 하나를 공유 (botocore 커넥션 풀, 스레드 안전)
+    모든 메서드는 blocking 이므로 run_in_threadpool 로 호출
+    """
+    is_local = False
+
+    def __init__(self, bucket: str, prefix: str = IMAGE_S3_PREFIX, endpoint_url: Optional[str] = IMAGE_S3_ENDPOINT_URL,
+                 region: Optional[str] = IMAGE_S3_REGION, public_url: str = IMAGE_S3_PUBLIC_URL,
+                 presign_ttl_sec: int = IMAGE_S3_PRESIGN_TTL_SEC,
+                 max_pool_connections: int = IMAGE_S3_MAX_POOL_CONNECTIONS):
+        import boto3
+        from botocore.config import Config
+
+        if not bucket:
+            raise ValueError("IMAGE_S3_BUCKET 이 설정되지 않았습니다.")
+        self.bucket = bucket
+        self.prefix = prefix
+        self.public_url = public_url
+        self.presign_ttl_sec = presign_ttl_sec
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            config=Config(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 3, "mode": "standard"},
+                signature_version="s3v4",
+                ## MinIO 등은 virtual-host 방식 bucket 주소를 지원하지 않는 경우가 많음
+                s3={"addressing_style": "path" if endpoint_url else "auto"},
+            ),
+        )
+        ## key -> (presigned URL, 만료 시각), 만료 전까지 같은 URL 을 내려서 브라우저 캐시가 동작하도록
+        self._presigned: Dict[str, Tuple[str, float]] = {}
+        self._presigned_lock = threading.Lock()
+
+    def key(self, user_pk: str, name: str = "") -> str:
+        return f"{self.prefix}{user_pk}/{name}"
+
+    def staging_dir(self, user_pk: str) -> str:
+        ## 업로드마다 새 폴더 (같은 내용의 동시 업로드가 서로의 임시 파일을 지우지 않도록)
+        os.makedirs(IMAGE_STAGING_DIR, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f"{user_pk}-", dir=IMAGE_STAGING_DIR)
+
+    def put_files(self, user_pk: str, paths: List[str]) -> None:
+        for path in paths:
+            name = os.path.basename(path)
+            ## 파일 이름이 내용 해시이므로 같은 key 의 내용은 바뀌지 않음
+            self.client.upload_file(path, self.bucket, self.key(user_pk, name), ExtraArgs={
+                "ContentType": content_type_for(name),
+                "CacheControl": IMMUTABLE_CACHE_CONTROL,
+            })
+
+    def _iter_pages(self, **params) -> Iterator[dict]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        yield from paginator.paginate(Bucket=self.bucket, **params)
+
+    def list_names(self, user_pk: str, prefix: str = "") -> Set[str]:
+        user_key = self.key(user_pk)
+        return {
+            item["Key"][len(user_key):]
+            for page in self._iter_pages(Prefix=user_key + prefix)
+            for item in page.get("Contents", [])
+        }
+
+    def mtime(self, user_pk: str, name: str) -> Optional[float]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self.key(user_pk, name))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return head["LastModified"].timestamp()
+
+    def touch(self, user_pk: str, names: Iterable[str]) -> None:
+        ## 같은 key 로 자기 자신을 복사해서 LastModified 갱신 (GC 유예 시간 기준)
+        # 메타데이터를 바꾸지 않는 자기 복사는 S3 가 거부하므로 REPLACE 로 기존 헤더를 다시 지정
+        for name in names:
+            key = self.key(user_pk, name)
+            self.client.copy_object(
+                Bucket=self.bucket, Key=key, CopySource={"Bucket": self.bucket, "Key": key},
+                MetadataDirective="REPLACE", ContentType=content_type_for(name), CacheControl=IMMUTABLE_CACHE_CONTROL,
+            )
+
+    def _delete_keys(self, keys: Iterable[str]) -> int:
+        deleted = 0
+        batch: List[str] = []
+        for key in keys:
+            batch.append(key)
+            ## delete_objects 는 요청당 최대 1000개
+            if len(batch) == 1000:
+                deleted += self._delete_batch(batch)
+                batch = []
+        if batch:
+            deleted += self._delete_batch(batch)
+        return deleted
+
+    def _delete_batch(self, keys: List[str]) -> int:
+        response = self.client.delete_objects(
+            Bucket=self.bucket, Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True}
+        )
+        for error in response.get("Errors", []):
+            print(f"WARNING: S3 delete failed for {error.get('Key')}: {error.get('Message')}")
+        return len(keys) - len(response.get("Errors", []))
+
+    def delete(self, user_pk: str, names: Iterable[str]) -> int:
+        return self._delete_keys(self.key(user_pk, name) for name in names)
+
+    def delete_user(self, user_pk: str) -> None:
+        self._delete_keys(
+            item["Key"] for page in self._iter_pages(Prefix=self.key(user_pk)) for item in page.get("Contents", [])
+        )
+
+    def iter_users(self) -> Iterator[str]:
+        for page in self._iter_pages(Prefix=self.prefix, Delimiter="/"):
+            for common in page.get("CommonPrefixes", []):
+                yield common["Prefix"][len(self.prefix):].rstrip("/")
+
+    def iter_objects(self, user_pk: str) -> Iterator[StoredObject]:
+        user_key = self.key(user_pk)
+        for page in self._iter_pages(Prefix=user_key):
+            for item in page.get("Contents", []):
+                yield StoredObject(item["Key"][len(user_key):], item["Size"], item["LastModified"].timestamp())
+
+    def prune_user(self, user_pk: str) -> bool:
+        ## object storage 에는 폴더가 따로 없음
+        return False
+
+    def url(self, user_pk: str, name: str) -> str:
+        key = self.key(user_pk, name)
+        if self.public_url:
+            return f"{self.public_url}/{key}"
+
+        now = time.time()
+        cached = self._presigned.get(key)
+        ## 남은 유효 시간이 절반 이상이면 재사용
+        if cached is not None and cached[1] - now > self.presign_ttl_sec / 2:
+            return cached[0]
+        url = self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=self.presign_ttl_sec
+        )
+        with self._presigned_lock:
+            if len(self._presigned) >= _PRESIGN_CACHE_MAX:
+                self._presigned.clear()
+            self._presigned[key] = (url, now + self.presign_ttl_sec)
+        return url
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            if IMAGE_STORAGE == "s3":
+                _storage = S3Storage(IMAGE_S3_BUCKET)
+            elif IMAGE_STORAGE == "local":
+                _storage = LocalStorage(UPLOAD_DIR)
+            else:
+                raise ValueError(f"지원하지 않는 IMAGE_STORAGE: {IMAGE_STORAGE} (local/s3)")
+        return _storage
+
+
+def check(storage) -> None:
+    ## 올리기 -> 목록 -> URL -> 삭제 확인 (임시 사용자 폴더 사용)
+    user_pk = f"storage-check-{int(time.time())}"
+    staging = tempfile.mkdtemp()
+    try:
+        path = os.path.join(staging, "check.png")
+        with open(path, "wb") as buffer:
+            buffer.write(b"\x89PNG\r\n\x1a\n" + os.urandom(64))
+        storage.put_files(user_pk, [path])
+        print(f"put      : {sorted(storage.list_names(user_pk))}")
+        print(f"mtime    : {storage.mtime(user_pk, 'check.png')}")
+        print(f"url      : {storage.url(user_pk, 'check.png')}")
+        print(f"objects  : {list(storage.iter_objects(user_pk))}")
+        print(f"deleted  : {storage.delete(user_pk, ['check.png'])}")
+        print(f"after    : {sorted(storage.list_names(user_pk))}")
+    finally:
+        storage.delete_user(user_pk)
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="이미지 저장 backend 확인")
+    parser.add_argument("--check", action="store_true", help="설정한 backend 에 올리기/조회/삭제 실행")
+    args = parser.parse_args(argv)
+
+    storage = get_storage()
+    print(f"IMAGE_STORAGE={IMAGE_STORAGE} ({type(storage).__name__})")
+    if args.check:
+        check(storage)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
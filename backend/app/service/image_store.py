@@ -0,0 +1,216 @@
+# backend/app/service/image_store.py
+"""
+일기 첨부 이미지 저장소 (content-addressed, 저장 위치는 image_storage backend)
+    <user pk>/<sha256><확장자>                 원본 (업로드 내용의 해시, 저장할 때 EXIF/GPS 등 메타데이터 제거)
+    <user pk>/<sha256>.<thumb|display>.webp    파생본
+같은 사용자가 같은 사진을 여러 일기에 첨부하면 파일 하나를 공유하고,
+참조 수는 따로 저장하지 않고 TB_diary.image_url 을 세어서 판단 (DB 가 유일한 기준)
+
+일기 수정/삭제로 참조가 없어진 파일은 release() 로 바로 지우고,
+그 밖에 남은 파일(저장 후 DB 실패, 예전 uuid 파일 등)은 GC 명령으로 정리
+
+    python -m app.service.image_store --dry-run
+    python -m app.service.image_store
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..repositories import diary_repository
+from . import image_service, upload_service
+from .image_storage import IMAGE_URL_PREFIX, get_storage
+
+## 참조가 없어도 이 시간 안에 쓰인 파일은 지우지 않음 (저장 직후 아직 commit 되지 않은 업로드 보호)
+IMAGE_GC_GRACE_SEC = float(os.getenv("IMAGE_GC_GRACE_SEC", 600))
+
+
+class StoredImage(NamedTuple):
+    url: str
+    variants: Optional[Dict[str, str]]
+    deduplicated: bool
+
+
+def split_url(url: Optional[str]) -> Optional[Tuple[str, str]]:
+    ## /static/images/<user>/<file> -> (user, file) (다른 형태의 URL 이면 None)
+    prefix = IMAGE_URL_PREFIX + "/"
+    if not url or not url.startswith(prefix):
+        return None
+    parts = url[len(prefix):].split("/")
+    if len(parts) != 2 or any(part in ("", ".", "..") for part in parts):
+        return None
+    return parts[0], parts[1]
+
+
+def public_url(url: Optional[str]) -> Optional[str]:
+    ## DB 에 저장된 URL -> 클라이언트가 내려받을 URL (local 은 그대로, s3 는 presigned / CDN 주소)
+    storage = get_storage()
+    if storage.is_local:
+        return url
+    parts = split_url(url)
+    return storage.url(*parts) if parts else url
+
+
+def blob_names(name: str) -> List[str]:
+    ## 원본 + 파생본 파일 이름
+    return [name, *(image_service.variant_path(name, variant) for variant in image_service.IMAGE_VARIANTS)]
+
+
+async def store_upload(user_pk: str, upload: UploadFile) -> StoredImage:
+    storage = get_storage()
+    staging_dir = await run_in_threadpool(storage.staging_dir, user_pk)
+    url_prefix = f"{IMAGE_URL_PREFIX}/{user_pk}"
+    if storage.is_local:
+        ## 업로드 폴더에 바로 저장, 같은 파일이 이미 있었으면 만들어 둔 파생본을 그대로 사용
+        saved = await upload_service.save_upload(upload, staging_dir, prepare=image_service.strip_metadata)
+        if saved.deduplicated:
+            ## save_upload 는 원본 시각만 갱신하므로 파생본도 같이 갱신 (GC 가 예전 시각을 보고 지우지 않도록)
+            await run_in_threadpool(storage.touch, user_pk, blob_names(saved.filename))
+        variants = await image_service.create_variants(saved.path, url_prefix)
+        return StoredImage(f"{url_prefix}/{saved.filename}", variants, saved.deduplicated)
+
+    try:
+        saved = await upload_service.save_upload(upload, staging_dir, prepare=image_service.strip_metadata)
+        ## 같은 내용이 이미 올라가 있으면 파생본 생성 / 업로드 생략 (목록 요청 한 번으로 원본 + 파생본 확인)
+        stored_names = await run_in_threadpool(storage.list_names, user_pk, saved.digest)
+        deduplicated = saved.filename in stored_names
+        if deduplicated:
+            ## 로컬 저장소의 os.utime 처럼 시각을 갱신해서, 곧 이 파일을 참조할 일기가 commit 되기 전에
+            # release / GC 가 예전 시각을 보고 지우지 않도록
+            await run_in_threadpool(
+                storage.touch, user_pk, [name for name in blob_names(saved.filename) if name in stored_names]
+            )
+        else:
+            await image_service.create_variants(saved.path, url_prefix)
+            staged = [os.path.join(staging_dir, name) for name in blob_names(saved.filename)]
+            staged = [path for path in staged if os.path.exists(path)]
+            ## 원본을 마지막에 올려서 원본이 있으면 파생본도 올라가 있도록
+            await run_in_threadpool(storage.put_files, user_pk, staged[1:] + staged[:1])
+            stored_names = {os.path.basename(path) for path in staged}
+    finally:
+        await run_in_threadpool(shutil.rmtree, staging_dir, ignore_errors=True)
+
+    variants = {}
+    for variant in image_service.IMAGE_VARIANTS:
+        name = image_service.variant_path(saved.filename, variant)
+        if name in stored_names:
+            variants[variant] = f"{url_prefix}/{name}"
+    return StoredImage(f"{url_prefix}/{saved.filename}", variants or None, deduplicated)
+
+
+def _remove_blob(user_pk: str, name: str, grace_sec: float) -> int:
+    ## 원본 + 파생본 삭제, 지운 파일 수 반환
+    storage = get_storage()
+    mtime = storage.mtime(user_pk, name)
+    if mtime is not None and time.time() - mtime < grace_sec:
+        return 0
+    return storage.delete(user_pk, blob_names(name))
+
+
+async def release(db: AsyncSession, user_pk: str, url: Optional[str]) -> int:
+    """
+    일기 수정(이미지 교체)/삭제 commit 후 호출
+    이전 이미지를 참조하는 일기가 더 없으면 원본 + 파생본 삭제
+    """
+    parts = split_url(url)
+    if parts is None or parts[0] != user_pk:
+        return 0
+    in_use = await db.scalar(diary_repository.image_ref_count_query(user_pk, url))
+    if in_use:
+        return 0
+    try:
+        return await run_in_threadpool(_remove_blob, user_pk, parts[1], IMAGE_GC_GRACE_SEC)
+    except Exception as e:
+        ## 지우지 못한 파일은 GC 에서 다시 정리
+        print(f"WARNING: Image release failed for {url}: {e}")
+        return 0
+
+
+async def delete_user_images(user_pk: str) -> None:
+    ## 회원 탈퇴 commit 후 호출
+    try:
+        await run_in_threadpool(get_storage().delete_user, user_pk)
+    except Exception as e:
+        print(f"WARNING: Image cleanup failed for user {user_pk}: {e}")
+
+
+def referenced_names(db: Session, user_pk: str, batch_size: int = 500) -> Set[str]:
+    ## 사용자 일기가 참조하는 파일 이름 (원본 + 파생본), 한 사용자 분량만 메모리에 올림
+    url_prefix = f"{IMAGE_URL_PREFIX}/{user_pk}/"
+    names: Set[str] = set()
+    result = db.execute(diary_repository.image_refs_query(user_pk).execution_options(yield_per=batch_size))
+    for image_url, image_variants in result:
+        for url in (image_url, *(image_variants or {}).values()):
+            if url and url.startswith(url_prefix):
+                names.add(url[len(url_prefix):])
+        ## image_variants 가 비어 있어도 원본이 쓰이는 동안은 파생본도 유지
+        if image_url.startswith(url_prefix):
+            names.update(blob_names(image_url[len(url_prefix):]))
+    return names
+
+
+def collect_garbage(dry_run: bool = False, grace_sec: float = IMAGE_GC_GRACE_SEC,
+                    batch_size: int = 500) -> Dict[str, int]:
+    """
+    저장소를 사용자 폴더 단위로 훑으면서 일기가 참조하지 않는 파일 삭제
+    파일 목록은 backend 에서 순서대로 받아 오고 (os.scandir / S3 목록 페이지) DB 는 사용자별로 나눠 읽으므로
+    메모리는 사용자 한 명 분량 + 삭제 대기 batch_size 개만 사용
+    """
+    storage = get_storage()
+    stats = {"users": 0, "files": 0, "orphans": 0, "orphan_bytes": 0, "removed_dirs": 0}
+    now = time.time()
+    db = SessionLocal()
+    try:
+        for user_pk in storage.iter_users():
+            stats["users"] += 1
+            names = referenced_names(db, user_pk, batch_size)
+            ## 다음 사용자 조회 전에 읽기 트랜잭션 종료
+            db.rollback()
+
+            orphans: List[str] = []
+            for stored in storage.iter_objects(user_pk):
+                stats["files"] += 1
+                if stored.name in names or now - stored.mtime < grace_sec:
+                    continue
+                stats["orphans"] += 1
+                stats["orphan_bytes"] += stored.size
+                orphans.append(stored.name)
+                if len(orphans) >= batch_size:
+                    if not dry_run:
+                        storage.delete(user_pk, orphans)
+                    orphans = []
+            if orphans and not dry_run:
+                storage.delete(user_pk, orphans)
+
+            if not dry_run and storage.prune_user(user_pk):
+                stats["removed_dirs"] += 1
+    finally:
+        db.close()
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="일기에서 참조하지 않는 업로드 이미지 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    parser.add_argument("--grace-sec", type=float, default=IMAGE_GC_GRACE_SEC,
+                        help="이 시간 안에 쓰인 파일은 건너뜀")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    stats = collect_garbage(args.dry_run, args.grace_sec, args.batch_size)
+    action = "삭제 대상" if args.dry_run else "삭제"
+    print(f"사용자 폴더 {stats['users']}개, 파일 {stats['files']}개 중 {action} {stats['orphans']}개 "
+          f"({stats['orphan_bytes'] / (1024 * 1024):.1f} MiB), 빈 폴더 삭제 {stats['removed_dirs']}개")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# backend/app/service/inference_backend.py
+import os
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
+import torch
+
+## 추론 백엔드 종류
+# eager: 기존 fp32 PyTorch
+# int8 : torch dynamic quantization (nn.Linear -> qint8)
+# onnx : model_convert CLI 로 export 한 ONNX Runtime 그래프
+BACKEND_EAGER = "eager"
+BACKEND_INT8 = "int8"
+BACKEND_ONNX = "onnx"
+BACKENDS = (BACKEND_EAGER, BACKEND_INT8, BACKEND_ONNX)
+
+## 서비스별 환경 변수(NLP_BACKEND / CHATBOT_BACKEND)가 없으면 INFERENCE_BACKEND 사용
+DEFAULT_BACKEND = os.getenv("INFERENCE_BACKEND", BACKEND_EAGER)
+
+## ONNX Runtime 스레드 수 (0 이면 onnxruntime 기본값)
+ORT_INTRA_OP_THREADS = int(os.getenv("ORT_INTRA_OP_THREADS", 0))
+
+ONNX_SUBDIR = "onnx"
+ONNX_CLASSIFIER_FILE = "model.onnx"
+
+
+def resolve_backend(env_name: str) -> str:
+    backend = (os.getenv(env_name) or DEFAULT_BACKEND).strip().lower()
+    if backend not in BACKENDS:
+        print(f"WARNING: Unknown inference backend '{backend}' ({env_name}). Falling back to '{BACKEND_EAGER}'.")
+        return BACKEND_EAGER
+    return backend
+
+
+def onnx_dir(model_path: str) -> str:
+    return os.path.join(model_path, ONNX_SUBDIR)
+
+
+def quantize_int8(model: torch.nn.Module) -> torch.nn.Module:
+    ## Linear 레이어 가중치를 int8 로 변환 (CPU 전용, activation 은 실행 시 동적으로 양자화)
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    quantized.eval()
+    return quantized
+
+
+def _ort_session_options():
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if ORT_INTRA_OP_THREADS > 0:
+        options.intra_op_num_threads = ORT_INTRA_OP_THREADS
+    return options
+
+
+class OnnxSequenceClassifier:
+    """
+    HuggingFace 분류 모델과 같은 방식(model(**inputs).logits)으로 호출할 수 있는 ONNX Runtime 래퍼
+    """
+
+    def __init__(self, onnx_path: str):
+        import onnxruntime as ort
+
+        self.session = ort.InferenceSession(
+            onnx_path,
+            sess_options=_ort_session_options(),
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_names = {item.name for item in self.session.get_inputs()}
+
+    def __call__(self, **inputs):
+        feed = {
+            name: tensor.cpu().numpy()
+            for name, tensor in inputs.items()
+            if name in self.input_names
+        }
+        logits = self.session.run(["logits"], feed)[0]
+        return SimpleNamespace(logits=torch.from_numpy(logits))
+
+    def to(self, device): return self
+    def eval(self): return self
+
+
+def load_sequence_classifier(model_path: str, backend: str, device) -> Tuple[Any, str]:
+    """
+    감정 분석(KoBERT) 모델 로드 -> (model, 실제 사용된 backend)
+    ONNX/int8 준비가 안 되어 있으면 eager 로 대체
+    """
+    from transformers import AutoModelForSequenceClassification
+
+    if backend == BACKEND_ONNX:
+        onnx_path = os.path.join(onnx_dir(model_path), ONNX_CLASSIFIER_FILE)
+        try:
+            return OnnxSequenceClassifier(onnx_path), BACKEND_ONNX
+        except Exception as e:
+            print(f"WARNING: ONNX classifier unavailable ({onnx_path}): {e}. Falling back to '{BACKEND_EAGER}'.")
+
+    model = AutoModelForSequenceClassification.from_pretrained(model_path, trust_remote_code=True)
+    model.eval()
+
+    if backend == BACKEND_INT8:
+        if str(device) == "cpu":
+            return quantize_int8(model), BACKEND_INT8
+        print(f"WARNING: int8 dynamic quantization is CPU only (device={device}). Using '{BACKEND_EAGER}'.")
+
+    return model.to(device), BACKEND_EAGER
+
+
+def load_seq2seq(model_path: str, backend: str, device) -> Tuple[Any, str]:
+    """
+    코멘트 생성(KoBART) 모델 로드 -> (model, 실제 사용된 backend)
+    ONNX 는 optimum 의 ORTModelForSeq2SeqLM 을 사용 (generate() 그대로 호출 가능)
+    """
+    from transformers import AutoModelForSeq2SeqLM
+
+    if backend == BACKEND_ONNX:
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                onnx_dir(model_path),
+                session_options=_ort_session_options(),
+                provider="CPUExecutionProvider",
+            )
+            return model, BACKEND_ONNX
+        except Exception as e:
+            print(f"WARNING: ONNX seq2seq model unavailable ({onnx_dir(model_path)}): {e}. Falling back to '{BACKEND_EAGER}'.")
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
+    model.eval()
+
+    if backend == BACKEND_INT8:
+        if str(device) == "cpu":
+            return quantize_int8(model), BACKEND_INT8
+        print(f"WARNING: int8 dynamic quantization is CPU only (device={device}). Using '{BACKEND_EAGER}'.")
+
+    return model.to(device), BACKEND_EAGER
+
+
+def export_sequence_classifier(model_path: str, tokenizer, opset: int = 17) -> str:
+    ## KoBERT 분류 모델 -> <model_path>/onnx/model.onnx (batch, sequence 축은 동적)
+    from transformers import AutoModelForSequenceClassification
+
+    model = AutoModelForSequenceClassification.from_pretrained(model_path, trust_remote_code=True)
+    model.eval()
+
+    sample = tokenizer(["오늘 하루는 정말 즐거웠다"], return_tensors="pt", padding=True)
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes: Dict[str, Dict[int, str]] = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    out_dir = onnx_dir(model_path)
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, ONNX_CLASSIFIER_FILE)
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            args=({name: sample[name] for name in input_names},),
+            f=out_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+    return out_path
+
+
+def export_seq2seq(model_path: str) -> str:
+    ## KoBART -> <model_path>/onnx/ (encoder / decoder / decoder_with_past + tokenizer, config)
+    from optimum.exporters.onnx import main_export
+
+    out_dir = onnx_dir(model_path)
+    main_export(model_path, output=out_dir, task="text2text-generation-with-past")
+    return out_dir
@@ -0,0 +1,210 @@
+# backend/app/service/inference_client.py
+import os
+import json
+import select
+import socket
+import threading
+import http.client
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse, unquote
+
+from . import nlp_service, chatbot_service
+
+## 추론 서버 주소 (없으면 기존처럼 이 프로세스 안에서 추론)
+# unix:///tmp/grooming-inference.sock  또는  http://127.0.0.1:8001
+INFERENCE_SERVER_URL = os.getenv("INFERENCE_SERVER_URL")
+INFERENCE_ANALYZE_TIMEOUT_SEC = float(os.getenv("INFERENCE_ANALYZE_TIMEOUT_SEC", 5))
+INFERENCE_COMMENT_TIMEOUT_SEC = float(os.getenv("INFERENCE_COMMENT_TIMEOUT_SEC", 60))
+
+
+class InferenceUnavailable(Exception):
+    pass
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def _is_dropped(sock: socket.socket) -> bool:
+    ## 응답을 기다리지 않는 keep-alive 소켓에 읽을 것이 있으면 서버가 연결을 닫은 것 (EOF)
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class InferenceClient:
+    """
+    추론 서버용 얇은 HTTP 클라이언트
+    스레드별로 keep-alive 연결을 재사용하고, 서버가 닫은 연결은 보내기 전에 새 연결로 바꿈
+    요청을 끝까지 보내지 못한 경우에만 한 번 재시도 (POST 는 보낸 뒤 실패하면 재시도하지 않음)
+    """
+
+    def __init__(self, url: str):
+        parsed = urlparse(url)
+        self.scheme = parsed.scheme
+        if self.scheme == "unix":
+            self.socket_path = unquote(parsed.netloc + parsed.path)
+        elif self.scheme == "http":
+            self.host = parsed.hostname or "127.0.0.1"
+            self.port = parsed.port or 80
+        else:
+            raise ValueError(f"지원하지 않는 INFERENCE_SERVER_URL 형식입니다: {url}")
+        self._local = threading.local()
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self.scheme == "unix":
+            return _UnixHTTPConnection(self.socket_path, timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _connection(self, timeout: float) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and conn.sock is not None and _is_dropped(conn.sock):
+            ## 쉬는 동안 서버가 닫은 keep-alive 연결은 요청을 보내기 전에 버림
+            self._drop_connection()
+            conn = None
+        if conn is None:
+            conn = self._new_connection(timeout)
+            self._local.conn = conn
+        ## 요청마다 timeout 이 다르므로 이미 열린 소켓에도 다시 적용
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def _send(self, method: str, path: str, payload: Optional[Dict[str, Any]],
+              timeout: float) -> http.client.HTTPResponse:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+
+        ## 응답을 받기 전에 끊긴 요청을 다시 보내도 되는지 (POST 는 서버가 이미 추론을 시작했을 수 있음)
+        idempotent = method in ("GET", "HEAD")
+        for attempt in range(2):
+            conn = self._connection(timeout)
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+            except socket.timeout as e:
+                ## timeout 은 재시도하지 않음 (서버가 이미 작업 중일 수 있음)
+                self._drop_connection()
+                raise InferenceUnavailable(f"{path} timed out after {timeout}s") from e
+            except (http.client.HTTPException, ConnectionError, OSError) as e:
+                self._drop_connection()
+                ## 연결 거부 / 요청 전송 실패 -> 서버가 요청을 받지 못했으므로 새 연결로 한 번 재시도
+                # 요청을 다 보낸 뒤 끊긴 POST 는 다시 보내면 모델이 두 번 실행될 수 있어서 그대로 실패 처리
+                if attempt == 0 and (not sent or idempotent):
+                    continue
+                raise InferenceUnavailable(f"{path} failed: {e}") from e
+
+            if response.status != 200:
+                response.read()
+                raise InferenceUnavailable(f"{path} returned HTTP {response.status}")
+            return response
+
+        raise InferenceUnavailable(f"{path} failed")
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]], timeout: float) -> Dict[str, Any]:
+        response = self._send(method, path, payload, timeout)
+        try:
+            return json.loads(response.read())
+        except (socket.timeout, http.client.HTTPException, OSError) as e:
+            self._drop_connection()
+            raise InferenceUnavailable(f"{path} failed while reading: {e}") from e
+
+    def stream(self, method: str, path: str, payload: Optional[Dict[str, Any]], timeout: float) -> Iterator[Dict[str, Any]]:
+        ## 줄 단위 JSON 응답을 도착하는 대로 하나씩 반환 (timeout 은 줄 사이 대기 시간)
+        response = self._send(method, path, payload, timeout)
+        completed = False
+        try:
+            while True:
+                line = response.readline()
+                if not line:
+                    completed = True
+                    return
+                yield json.loads(line)
+        except (socket.timeout, http.client.HTTPException, OSError) as e:
+            raise InferenceUnavailable(f"{path} stream failed: {e}") from e
+        finally:
+            ## 끝까지 읽지 않은 응답이 남은 연결은 재사용할 수 없음
+            if not completed:
+                self._drop_connection()
+
+
+_client: Optional[InferenceClient] = InferenceClient(INFERENCE_SERVER_URL) if INFERENCE_SERVER_URL else None
+
+
+def is_remote() -> bool:
+    return _client is not None
+
+
+def get_emotion_analysis(text: str) -> dict:
+    if _client is None:
+        return nlp_service.get_emotion_analysis(text)
+
+    if not text:
+        return nlp_service.neutral_result()
+
+    try:
+        return _client.request("POST", "/analyze", {"text": text}, INFERENCE_ANALYZE_TIMEOUT_SEC)
+    except InferenceUnavailable as e:
+        ## 추론 서버 장애 시 중립 감정으로 저장
+        print(f"ERROR: Inference server analyze failed: {e}")
+        return nlp_service.neutral_result()
+
+
+def generate_comment(content: str, profile: str = chatbot_service.DEFAULT_PROFILE) -> Tuple[str, Optional[str]]:
+    """
+    (코멘트 본문, 실제 프로파일) 반환 (chatbot_service.generate_comment 와 같은 형태)
+    실패 시 InferenceUnavailable 을 그대로 올려서 호출 측의 기본 코멘트 처리로 넘어가도록 함
+    """
+    if _client is None:
+        return chatbot_service.generate_comment(content, profile)
+
+    payload = {"content": content, "profile": profile}
+    result = _client.request("POST", "/comment", payload, INFERENCE_COMMENT_TIMEOUT_SEC)
+    return result["comment"], result.get("profile")
+
+
+def stream_comment(content: str, sink, profile: str = chatbot_service.PROFILE_FAST) -> Tuple[str, Optional[str]]:
+    """
+    생성되는 조각을 sink.put() 으로 넘기고 (최종 코멘트 본문, 실제 프로파일) 반환 (chatbot_service.stream_comment 와 같은 형태)
+    """
+    if _client is None:
+        return chatbot_service.stream_comment(content, sink, profile)
+
+    payload = {"content": content, "profile": profile}
+    for item in _client.stream("POST", "/comment/stream", payload, INFERENCE_COMMENT_TIMEOUT_SEC):
+        if "text" in item:
+            sink.put(item["text"])
+        elif "comment" in item:
+            return item["comment"], item.get("profile")
+        elif "error" in item:
+            raise InferenceUnavailable(f"/comment/stream failed: {item['error']}")
+    raise InferenceUnavailable("/comment/stream ended without a comment")
+
+
+def server_ready() -> bool:
+    if _client is None:
+        return True
+    try:
+        _client.request("GET", "/health/ready", None, INFERENCE_ANALYZE_TIMEOUT_SEC)
+        return True
+    except InferenceUnavailable:
+        return False
@@ -0,0 +1,196 @@
+# backend/app/service/model_convert.py
+"""
+추론 백엔드 변환 / 검증 CLI
+
+    # ONNX 그래프 export (<모델 경로>/onnx/ 에 저장)
+    python -m app.service.model_convert export --model all
+
+    # fp32(eager) 출력과 비교 + 지연 시간 측정
+    python -m app.service.model_convert parity --model nlp --backend int8
+    python -m app.service.model_convert parity --model chatbot --backend onnx --input samples.txt
+
+    # 디코딩 프로파일(quality/balanced/fast)별 생성 시간 비교
+    python -m app.service.model_convert profiles
+"""
+import sys
+import time
+import argparse
+from typing import Callable, List
+
+import torch
+import torch.nn.functional as F
+
+from . import inference_backend
+
+## --input 이 없을 때 사용할 샘플 일기
+SAMPLE_DIARIES = [
+    "오늘은 친구랑 맛있는 저녁을 먹어서 정말 행복했다",
+    "시험을 망쳐서 너무 속상하고 눈물이 났다",
+    "버스에서 누가 새치기를 해서 화가 났다",
+    "내일 발표가 있는데 잘할 수 있을지 걱정된다",
+    "따뜻한 차 한 잔 마시면서 조용히 책을 읽었다",
+    "오랜만에 가족들과 산책을 해서 마음이 편안했다",
+    "회사에서 실수를 해서 하루 종일 불안했다",
+    "생일 선물을 받아서 기분이 너무 좋았다",
+]
+
+
+def _nlp_model_path():
+    from .nlp_service import LOCAL_NLP_MODEL_PATH
+    return LOCAL_NLP_MODEL_PATH
+
+
+def _chatbot_model_path():
+    from .chatbot_service import LOCAL_MODEL_PATH
+    return LOCAL_MODEL_PATH
+
+
+def _load_kobert_tokenizer():
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained('monologg/kobert', trust_remote_code=True)
+
+
+def _timed(fn: Callable, texts: List[str]):
+    ## 문장별 결과와 평균 지연 시간(ms)
+    fn(texts[0])  # warm-up
+    results = []
+    started = time.perf_counter()
+    for text in texts:
+        results.append(fn(text))
+    elapsed_ms = (time.perf_counter() - started) * 1000.0 / len(texts)
+    return results, elapsed_ms
+
+
+def export(target: str) -> None:
+    if target in ("nlp", "all"):
+        model_path = _nlp_model_path()
+        out_path = inference_backend.export_sequence_classifier(model_path, _load_kobert_tokenizer())
+        print(f"INFO: NLP classifier exported to {out_path}")
+
+    if target in ("chatbot", "all"):
+        model_path = _chatbot_model_path()
+        out_dir = inference_backend.export_seq2seq(model_path)
+        print(f"INFO: KoBART exported to {out_dir}")
+
+
+def parity_nlp(backend: str, texts: List[str], atol: float) -> bool:
+    model_path = _nlp_model_path()
+    tokenizer = _load_kobert_tokenizer()
+    device = torch.device("cpu")
+
+    reference, _ = inference_backend.load_sequence_classifier(model_path, inference_backend.BACKEND_EAGER, device)
+    candidate, used_backend = inference_backend.load_sequence_classifier(model_path, backend, device)
+    if used_backend != backend:
+        print(f"ERROR: backend '{backend}' could not be loaded.")
+        return False
+
+    def probabilities(model):
+        def run(text):
+            inputs = tokenizer([text], return_tensors="pt", padding=True, truncation=True, max_length=128)
+            with torch.no_grad():
+                return F.softmax(model(**inputs).logits, dim=1)[0]
+        return run
+
+    ref_probs, ref_ms = _timed(probabilities(reference), texts)
+    cand_probs, cand_ms = _timed(probabilities(candidate), texts)
+
+    max_diff = max(float((a - b).abs().max()) for a, b in zip(ref_probs, cand_probs))
+    label_match = sum(int(a.argmax() == b.argmax()) for a, b in zip(ref_probs, cand_probs)) / len(texts)
+
+    print(f"[nlp] eager {ref_ms:.1f}ms/문장 -> {backend} {cand_ms:.1f}ms/문장 (x{ref_ms / cand_ms:.2f})")
+    print(f"[nlp] max |Δprob| = {max_diff:.5f} (허용 {atol}), label 일치율 = {label_match:.2%}")
+    return max_diff <= atol and label_match == 1.0
+
+
+def parity_chatbot(backend: str, texts: List[str], min_match: float, profile: str) -> bool:
+    from transformers import AutoTokenizer
+    from .chatbot_service import run_generation
+
+    model_path = _chatbot_model_path()
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    device = torch.device("cpu")
+
+    reference, _ = inference_backend.load_seq2seq(model_path, inference_backend.BACKEND_EAGER, device)
+    candidate, used_backend = inference_backend.load_seq2seq(model_path, backend, device)
+    if used_backend != backend:
+        print(f"ERROR: backend '{backend}' could not be loaded.")
+        return False
+
+    ref_texts, ref_ms = _timed(lambda text: run_generation(reference, tokenizer, device, text, profile), texts)
+    cand_texts, cand_ms = _timed(lambda text: run_generation(candidate, tokenizer, device, text, profile), texts)
+
+    match = sum(int(a == b) for a, b in zip(ref_texts, cand_texts)) / len(texts)
+
+    print(f"[chatbot] eager {ref_ms:.1f}ms/문장 -> {backend} {cand_ms:.1f}ms/문장 (x{ref_ms / cand_ms:.2f})")
+    print(f"[chatbot] 생성 문장 일치율 = {match:.2%} (최소 {min_match:.0%})")
+    for a, b in zip(ref_texts, cand_texts):
+        if a != b:
+            print(f"  - eager: {a}\n    {backend}: {b}")
+    return match >= min_match
+
+
+def compare_profiles(texts: List[str]) -> bool:
+    ## 현재 CHATBOT_BACKEND 로 프로파일별 생성 시간 / 결과 비교 (COMMENT_COST_*_MS 초기값 설정용)
+    from .chatbot_service import PROFILE_ORDER, get_models, run_generation
+
+    models = get_models()
+    if not models.load_success:
+        print("ERROR: chatbot model could not be loaded.")
+        return False
+
+    outputs = {}
+    for profile in PROFILE_ORDER:
+        generated, elapsed_ms = _timed(
+            lambda text: run_generation(models.model, models.tokenizer, models.device, text, profile), texts
+        )
+        outputs[profile] = generated
+        print(f"[{profile}] {elapsed_ms:.1f}ms/문장 ({models.backend})")
+
+    for index, text in enumerate(texts):
+        print(f"- {text}")
+        for profile in PROFILE_ORDER:
+            print(f"    {profile}: {outputs[profile][index]}")
+    return True
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="추론 백엔드 변환 / parity 검사")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = sub.add_parser("export", help="ONNX 그래프 export")
+    export_parser.add_argument("--model", choices=["nlp", "chatbot", "all"], default="all")
+
+    parity_parser = sub.add_parser("parity", help="fp32 출력과 비교")
+    parity_parser.add_argument("--model", choices=["nlp", "chatbot"], required=True)
+    parity_parser.add_argument("--backend", choices=[inference_backend.BACKEND_INT8, inference_backend.BACKEND_ONNX], required=True)
+    parity_parser.add_argument("--input", help="한 줄에 한 문장씩 적힌 텍스트 파일")
+    parity_parser.add_argument("--atol", type=float, default=0.05, help="nlp: 허용 확률 오차")
+    parity_parser.add_argument("--min-match", type=float, default=0.8, help="chatbot: 최소 문장 일치율")
+    parity_parser.add_argument("--profile", default="quality", help="chatbot: 디코딩 프로파일")
+
+    profiles_parser = sub.add_parser("profiles", help="디코딩 프로파일별 생성 시간 비교")
+    profiles_parser.add_argument("--input", help="한 줄에 한 문장씩 적힌 텍스트 파일")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        export(args.model)
+        return 0
+
+    texts = SAMPLE_DIARIES
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+    if args.command == "profiles":
+        return 0 if compare_profiles(texts) else 1
+
+    if args.model == "nlp":
+        ok = parity_nlp(args.backend, texts, args.atol)
+    else:
+        ok = parity_chatbot(args.backend, texts, args.min_match, args.profile)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# backend/app/service/model_registry.py
+import gc
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+## 모델 상태
+STATE_UNLOADED = "unloaded"
+STATE_LOADING = "loading"
+STATE_LOADED = "loaded"
+STATE_WARM = "warm"
+STATE_FAILED = "failed"
+
+
+class _Entry:
+    def __init__(self, loader: Callable[[], Any], warmup: Optional[Callable[[Any], None]]):
+        self.loader = loader
+        self.warmup = warmup
+        self.value: Any = None
+        self.state = STATE_UNLOADED
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    모델을 import 시점이 아니라 처음 사용할 때 한 번만 로드하는 레지스트리
+    (uvicorn reload / 워커별로 불필요한 모델 로딩을 피하기 위함)
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any],
+                 warmup: Optional[Callable[[Any], None]] = None) -> None:
+        self._entries[name] = _Entry(loader, warmup)
+
+    @staticmethod
+    def _has_value(entry: _Entry) -> bool:
+        ## 로드 실패 시 loader 가 돌려준 fallback(load_success=False)도 캐시해서 매 요청 재로드하지 않음
+        return entry.state in (STATE_LOADED, STATE_WARM) or (entry.state == STATE_FAILED and entry.value is not None)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries[name]
+        if self._has_value(entry):
+            return entry.value
+
+        with entry.lock:
+            if not self._has_value(entry):
+                entry.state = STATE_LOADING
+                try:
+                    entry.value = entry.loader()
+                except Exception:
+                    entry.value = None
+                    entry.state = STATE_FAILED
+                    raise
+                ## loader 가 예외를 삼키고 fallback 을 반환한 경우도 실패로 기록
+                loaded = getattr(entry.value, "load_success", True)
+                entry.state = STATE_LOADED if loaded else STATE_FAILED
+        return entry.value
+
+    def warm_up(self, name: str) -> None:
+        ## 로드 + 더미 추론 1회 (첫 요청이 lazy init / 메모리 할당 비용을 떠안지 않도록)
+        entry = self._entries[name]
+        try:
+            value = self.get(name)
+        except Exception as e:
+            print(f"ERROR: Failed to load model '{name}': {e}")
+            return
+        if entry.state in (STATE_WARM, STATE_FAILED):
+            return
+
+        with entry.lock:
+            if entry.state in (STATE_WARM, STATE_FAILED):
+                return
+            try:
+                if entry.warmup is not None:
+                    entry.warmup(value)
+            except Exception as e:
+                print(f"ERROR: Warm-up failed for model '{name}': {e}")
+                entry.state = STATE_FAILED
+                return
+            entry.state = STATE_WARM
+
+    def preload(self, names: Iterable[str]) -> None:
+        """
+        부모 프로세스에서 미리 로드 (gunicorn --preload 등으로 fork 되는 워커와 copy-on-write 공유)
+        fork 이후 refcount 변경으로 페이지가 복사되지 않도록 gc.freeze() 로 현재 객체를 고정
+        """
+        for name in names:
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"ERROR: Failed to preload model '{name}': {e}")
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+
+    def state(self, name: str) -> str:
+        return self._entries[name].state
+
+    def status(self) -> Dict[str, str]:
+        return {name: entry.state for name, entry in self._entries.items()}
+
+    def all_warm(self, names: Iterable[str]) -> bool:
+        return all(self._entries[name].state == STATE_WARM for name in names)
+
+    def any_failed(self) -> bool:
+        return any(entry.state == STATE_FAILED for entry in self._entries.values())
+
+
+registry = ModelRegistry()
@@ -0,0 +1,105 @@
+# backend/app/service/monthly_emotion_service.py
+"""
+사용자별 월간 감정 집계 (감정 그래프 API 용)
+TB_monthly_emotion 에 (사용자, 월) 단위로 라벨별 개수 + 일별 감정 점수를 저장해 두고
+일기 저장/수정/삭제 시 해당 월만 다시 집계 (일기가 없는 달은 행을 만들지 않음)
+"""
+import json
+import hashlib
+import calendar
+from datetime import date
+from types import SimpleNamespace
+from typing import Dict, List, Tuple, Union
+
+from sqlalchemy import delete
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.monthlyEmotion import MonthlyEmotion
+from ..repositories import diary_repository
+
+EMOTION_LABEL_CHART = ["Angry", "Fear", "Happy", "Tender", "Sad"]
+EMOTION_LABEL = EMOTION_LABEL_CHART + ["Neutral"]
+
+
+def month_range(day: date) -> Tuple[date, date]:
+    start = day.replace(day=1)
+    _, days_in_month = calendar.monthrange(start.year, start.month)
+    return start, date(start.year, start.month, days_in_month)
+
+
+def aggregate_etag(diary_cnt: int, emotion_cnt: Dict[str, int], daily_scores: Dict[str, List[float]]) -> str:
+    payload = json.dumps([diary_cnt, emotion_cnt, daily_scores], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+async def _build(db: AsyncSession, user_pk: str, month_start: date) -> SimpleNamespace:
+    start_date, end_date = month_range(month_start)
+    ## 집계에 필요한 컬럼만 조회 (content 는 읽지 않음)
+    rows = await diary_repository.list_emotions(db, user_pk, start_date, end_date)
+
+    emotion_cnt = {label: 0 for label in EMOTION_LABEL}
+    daily_scores: Dict[str, List[float]] = {}
+    for diary_date, emotion_label, overall_emotion_score in rows:
+        emotion_cnt[emotion_label] = emotion_cnt.get(emotion_label, 0) + 1
+        db_scores: Dict[str, float] = overall_emotion_score or {}
+        daily_scores[diary_date.strftime("%Y-%m-%d")] = [
+            round(db_scores.get(label, 0.0), 4) for label in EMOTION_LABEL_CHART
+        ]
+
+    diary_cnt = len(rows)
+    return SimpleNamespace(
+        user_id=user_pk,
+        month_start=start_date,
+        diary_cnt=diary_cnt,
+        emotion_cnt=emotion_cnt,
+        daily_scores=daily_scores,
+        etag=aggregate_etag(diary_cnt, emotion_cnt, daily_scores),
+    )
+
+
+async def _store(db: AsyncSession, aggregate: SimpleNamespace) -> None:
+    row = await db.get(MonthlyEmotion, (aggregate.user_id, aggregate.month_start))
+    if aggregate.diary_cnt == 0:
+        if row is not None:
+            await db.delete(row)
+    elif row is None:
+        db.add(MonthlyEmotion(**vars(aggregate)))
+    else:
+        row.diary_cnt = aggregate.diary_cnt
+        row.emotion_cnt = aggregate.emotion_cnt
+        row.daily_scores = aggregate.daily_scores
+        row.etag = aggregate.etag
+    await db.flush()
+
+
+async def refresh_month(db: AsyncSession, user_pk: str, diary_date: date) -> None:
+    """
+    일기 저장/수정/삭제 직후, 같은 트랜잭션 안에서 호출 (commit 은 호출 측에서)
+    """
+    await db.flush()
+    await _store(db, await _build(db, user_pk, diary_date.replace(day=1)))
+
+
+async def get_month(db: AsyncSession, user_pk: str, month_start: date) -> Union[MonthlyEmotion, SimpleNamespace]:
+    row = await db.get(MonthlyEmotion, (user_pk, month_start))
+    if row is not None:
+        return row
+
+    ## 집계가 아직 없는 달 (집계 테이블 도입 전 일기) -> 만들어서 저장
+    aggregate = await _build(db, user_pk, month_start)
+    if aggregate.diary_cnt > 0:
+        try:
+            await _store(db, aggregate)
+            await db.commit()
+        except SQLAlchemyError as e:
+            ## 동시 요청이 먼저 저장한 경우 등 -> 계산한 집계는 그대로 사용
+            await db.rollback()
+            print(f"WARNING: Monthly emotion aggregate save failed for {user_pk} {month_start}: {e}")
+    return aggregate
+
+
+async def delete_user_months(db: AsyncSession, user_pk: str) -> None:
+    await db.execute(
+        delete(MonthlyEmotion).where(MonthlyEmotion.user_id == user_pk).execution_options(synchronize_session=False)
+    )
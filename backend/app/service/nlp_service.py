@@ -2,7 +2,17 @@
 import torch
 import torch.nn.functional as F
 import os
-from typing import Dict, Any
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
+
+from ..metrics import Histogram
+from .result_cache import create_cache, model_fingerprint
+from . import inference_backend
+from .model_registry import registry
 
 LOCAL_NLP_MODEL_PATH = os.getenv(
     "LOCAL_NLP_MODEL_PATH", 
@@ -20,76 +30,84 @@ EMOTION_LABELS = {
 ## 임계값 (임시)
 CONFIDENCE_THRESHOLD = 0.65
 
+## 마이크로 배칭 설정
+# NLP_BATCH_WINDOW_MS: 첫 요청이 들어온 뒤 다른 요청을 모으는 최대 대기 시간(ms)
+# NLP_MAX_BATCH_SIZE: 한 번의 forward pass에 넣을 최대 문장 수
+NLP_BATCHING_ENABLED = os.getenv("NLP_BATCHING_ENABLED", "1") == "1"
+NLP_BATCH_WINDOW_MS = float(os.getenv("NLP_BATCH_WINDOW_MS", 10))
+NLP_MAX_BATCH_SIZE = int(os.getenv("NLP_MAX_BATCH_SIZE", 16))
+NLP_BATCH_TIMEOUT_SEC = float(os.getenv("NLP_BATCH_TIMEOUT_SEC", 30))
+
+## 추론 백엔드 (eager / int8 / onnx)
+NLP_BACKEND = inference_backend.resolve_backend("NLP_BACKEND")
+
+## 결과 캐시 키에 들어갈 모델 버전 (모델/백엔드/임계값이 바뀌면 이전 결과는 사용하지 않음)
+# 모델을 로드하지 않고도 계산할 수 있도록 설정값 기준으로 구성
+NLP_MODEL_VERSION = os.getenv("NLP_MODEL_VERSION") or model_fingerprint(LOCAL_NLP_MODEL_PATH)
+NLP_MODEL_VERSION = f"{NLP_MODEL_VERSION}:{NLP_BACKEND}:t{CONFIDENCE_THRESHOLD}"
+
 # '중립' 감정 레이블 정보 (모델이 확신하지 못할 때 사용)
 NEUTRAL_EMOTION = {
     "emotion_label": "Neutral",
     "emotion_emoji": "default.png" 
 }
 
-try:
-    from transformers import AutoTokenizer, AutoModelForSequenceClassification 
-    
-    tokenizer = AutoTokenizer.from_pretrained('monologg/kobert', trust_remote_code=True)
-    
-    DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    
-    model = AutoModelForSequenceClassification.from_pretrained(LOCAL_NLP_MODEL_PATH, trust_remote_code=True).to(DEVICE)
-    model.eval() # 추론 모드로 설정
-    
-    print(f"INFO: Fine-tuned NLP model loaded successfully from {LOCAL_NLP_MODEL_PATH} on {DEVICE}.")
-    LOAD_SUCCESS = True
-except ImportError:
-    print(f"ERROR: 'transformers' 라이브러리가 설치되지 않았습니다.")
-    LOAD_SUCCESS = False
-except OSError as e:
-    print(f"ERROR: Failed to load NLP model from {LOCAL_NLP_MODEL_PATH}. 경로 및 파일 존재 여부 확인 필요. 상세 오류: {e}")
-    LOAD_SUCCESS = False
-except Exception as e:
-    print(f"ERROR: Failed to load NLP model: {e}")
-    LOAD_SUCCESS = False
-
-# 모델 로딩 실패 시 더미 함수로 대체 (기존 로직 유지)
-if not LOAD_SUCCESS:
-    def tokenizer(text, **kwargs): return {'input_ids': torch.tensor([[101, 102]]), 'attention_mask': torch.tensor([[1, 1]])}
-    
-    class DummyModel:
-        def __call__(self, **kwargs):
-            return type('Outputs', (object,), {'logits': torch.tensor([[0.1, 0.1, 10.0, 0.1, 0.1]])})
-        def to(self, device): return self
-        def eval(self): pass
+def _load_models() -> SimpleNamespace:
+    ## 토크나이저 + 모델 로드 (model_registry 를 통해 처음 사용할 때 한 번만 호출됨)
+    try:
+        from transformers import AutoTokenizer
         
-    model = DummyModel()
-    DEVICE = "cpu"
-
-def get_emotion_analysis(text: str) -> dict:
-    if not text or not LOAD_SUCCESS:
-        # 모델 로딩 실패 또는 텍스트가 비어 있을 경우 기본값 반환
-        return {
-            "emotion_label": NEUTRAL_EMOTION["emotion_label"],
-            "emotion_emoji": NEUTRAL_EMOTION["emotion_emoji"],
-            "emotion_score": 0.0,
-            "overall_emotion_score": {label[0]: 0.0 for label in EMOTION_LABELS.values()}
-        }
+        tokenizer = AutoTokenizer.from_pretrained('monologg/kobert', trust_remote_code=True)
         
-    # 텍스트 토큰화
-    inputs = tokenizer(
-        text, 
-        return_tensors='pt', 
-        padding=True, 
-        truncation=True,
-        max_length=128 
-    ).to(DEVICE)
-    
-    # 모델 추론
-    with torch.no_grad():
-        outputs = model(**inputs)
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        
+        ## 추론 모드(eval)로 로드된 모델 + 실제 적용된 백엔드
+        model, backend = inference_backend.load_sequence_classifier(LOCAL_NLP_MODEL_PATH, NLP_BACKEND, device)
         
-    ## 확률 계산 (Softmax 적용)
-    # probabilities: 모든 감정 레이블의 확률 리스트 
-    probabilities = F.softmax(outputs.logits, dim=1).squeeze().tolist()
+        print(f"INFO: Fine-tuned NLP model loaded successfully from {LOCAL_NLP_MODEL_PATH} on {device} ({backend}).")
+        return SimpleNamespace(tokenizer=tokenizer, model=model, device=device, backend=backend, load_success=True)
+    except ImportError:
+        print(f"ERROR: 'transformers' 라이브러리가 설치되지 않았습니다.")
+    except OSError as e:
+        print(f"ERROR: Failed to load NLP model from {LOCAL_NLP_MODEL_PATH}. 경로 및 파일 존재 여부 확인 필요. 상세 오류: {e}")
+    except Exception as e:
+        print(f"ERROR: Failed to load NLP model: {e}")
     
+    # 모델 로딩 실패 시 get_emotion_analysis 는 중립 결과를 반환
+    return SimpleNamespace(tokenizer=None, model=None, device="cpu", backend=None, load_success=False)
+
+
+def _warm_up(models: SimpleNamespace) -> None:
+    ## 더미 문장으로 한 번 추론 (배치 스케줄러 / 캐시를 거치지 않음)
+    if models.load_success:
+        _analyze_batch(["오늘 하루는 정말 즐거웠다"], models)
+
+
+registry.register("nlp", _load_models, _warm_up)
+
+
+def get_models() -> SimpleNamespace:
+    return registry.get("nlp")
+
+
+def is_loaded() -> bool:
+    return get_models().load_success
+
+
+def neutral_result() -> dict:
+    ## 모델 로딩 실패 또는 텍스트가 비어 있을 경우 사용할 기본값
+    return {
+        "emotion_label": NEUTRAL_EMOTION["emotion_label"],
+        "emotion_emoji": NEUTRAL_EMOTION["emotion_emoji"],
+        "emotion_score": 0.0,
+        "overall_emotion_score": {label[0]: 0.0 for label in EMOTION_LABELS.values()}
+    }
+
+
+def _build_result(probabilities: List[float]) -> dict:
+    ## 한 문장의 softmax 확률 리스트 -> 감정 분석 결과
     # 가장 높은 확률을 가진 감정의 인덱스 추출
-    predicted_label_index = torch.argmax(outputs.logits, dim=1).item()
+    predicted_label_index = max(range(len(probabilities)), key=probabilities.__getitem__)
     
     # 가장 높은 확률값
     emotion_score = probabilities[predicted_label_index]
@@ -116,3 +134,152 @@ def get_emotion_analysis(text: str) -> dict:
         "emotion_score": emotion_score,
         "overall_emotion_score": overall_emotion_score
     }
+
+
+def _analyze_batch(texts: List[str], models: Optional[SimpleNamespace] = None) -> List[dict]:
+    ## 여러 문장을 padding 하여 한 번의 forward pass로 추론
+    models = models or get_models()
+    inputs = models.tokenizer(
+        texts, 
+        return_tensors='pt', 
+        padding=True, 
+        truncation=True,
+        max_length=128 
+    ).to(models.device)
+    
+    # 모델 추론
+    with torch.no_grad():
+        outputs = models.model(**inputs)
+        
+    ## 확률 계산 (Softmax 적용) -> 문장별 확률 리스트
+    probabilities = F.softmax(outputs.logits, dim=1).tolist()
+    
+    return [_build_result(row) for row in probabilities]
+
+
+class _BatchRequest:
+    __slots__ = ("text", "future", "enqueued_at")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class EmotionBatcher:
+    """
+    동시에 들어온 감정 분석 요청을 짧은 시간(window) 동안 모아서
+    하나의 배치로 추론하는 스케줄러 (전용 스레드 1개)
+    """
+
+    def __init__(self, run_batch, window_ms: float, max_batch_size: int):
+        self._run_batch = run_batch
+        self.window_sec = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        
+        self._queue: "queue.Queue[_BatchRequest]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        
+        ## 배치 크기 / 큐 대기 시간 분포 (window 튜닝용)
+        self.batch_size_hist = Histogram("nlp_batch_size", [1, 2, 4, 8, 16, 32, 64])
+        self.queue_wait_hist = Histogram(
+            "nlp_queue_wait_seconds",
+            [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+        )
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="nlp-batcher", daemon=True)
+                self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        self._ensure_started()
+        request = _BatchRequest(text)
+        self._queue.put(request)
+        return request.future
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _collect(self) -> List[_BatchRequest]:
+        ## 첫 요청 도착 시점부터 window 만큼만 기다림 (이미 쌓여있는 요청은 즉시 합류)
+        first = self._queue.get()
+        batch = [first]
+        deadline = first.enqueued_at + self.window_sec
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            
+            started_at = time.monotonic()
+            for request in batch:
+                self.queue_wait_hist.observe(started_at - request.enqueued_at)
+            self.batch_size_hist.observe(len(batch))
+            
+            try:
+                results = self._run_batch([request.text for request in batch])
+            except Exception as e:
+                print(f"ERROR: NLP batch inference failed (size={len(batch)}): {e}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            
+            for request, result in zip(batch, results):
+                request.future.set_result(result)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "window_ms": self.window_sec * 1000.0,
+            "max_batch_size": self.max_batch_size,
+            "queue_depth": self.queue_depth(),
+            "batch_size": self.batch_size_hist.snapshot(),
+            "queue_wait_seconds": self.queue_wait_hist.snapshot(),
+        }
+
+
+batcher = EmotionBatcher(_analyze_batch, NLP_BATCH_WINDOW_MS, NLP_MAX_BATCH_SIZE)
+
+## 같은/되돌린 내용은 다시 추론하지 않도록 결과 캐시
+emotion_cache = create_cache("emotion_analysis")
+
+
+def get_emotion_analysis(text: str) -> dict:
+    if not text or not is_loaded():
+        # 모델 로딩 실패 또는 텍스트가 비어 있을 경우 기본값 반환
+        return neutral_result()
+    
+    cache_key = emotion_cache.make_key(text, NLP_MODEL_VERSION)
+    cached = emotion_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if not NLP_BATCHING_ENABLED:
+        result = _analyze_batch([text])[0]
+    else:
+        ## 배치 스케줄러에 요청을 넣고 결과를 기다림 (요청 스레드는 대기만 함)
+        result = batcher.submit(text).result(timeout=NLP_BATCH_TIMEOUT_SEC)
+    
+    emotion_cache.put(cache_key, result)
+    return result
+
+
+def get_batch_metrics() -> Dict[str, Any]:
+    return {
+        "batching_enabled": NLP_BATCHING_ENABLED,
+        **batcher.metrics(),
+    }
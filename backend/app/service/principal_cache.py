@@ -0,0 +1,204 @@
+# backend/app/service/principal_cache.py
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+## 인증된 사용자 스냅샷 캐시 (0 이면 사용 안 함)
+PRINCIPAL_CACHE_TTL_SEC = float(os.getenv("PRINCIPAL_CACHE_TTL_SEC", 300))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+## 설정 시 uvicorn 워커들이 같은 sqlite 파일을 공유 (회원탈퇴 무효화가 모든 워커에 바로 반영됨)
+PRINCIPAL_CACHE_PATH = os.getenv("PRINCIPAL_CACHE_PATH")
+
+
+class UserPrincipal(NamedTuple):
+    ## 라우터가 current_user 에서 읽는 필드만 보관 (ORM 객체 대신 사용)
+    id: str
+    user_name: str
+    user_id: str
+    created_at: datetime
+
+
+class PrincipalCache:
+    """
+    JWT 의 사용자 id -> UserPrincipal TTL 캐시
+    기본은 프로세스 메모리 LRU, store_path 가 주어지면 sqlite 파일을 저장소로 사용해서 워커 간 공유
+    async 라우터에서는 *_async 를 사용 (공유 모드의 sqlite I/O 는 이벤트 루프 밖 threadpool 에서 실행)
+    """
+
+    def __init__(self, ttl_sec: float, max_entries: int, store_path: Optional[str] = None):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, Tuple[float, UserPrincipal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        if store_path and ttl_sec > 0:
+            self._open_store(store_path)
+
+    def _open_store(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS principal_cache ("
+                "id TEXT PRIMARY KEY, user_name TEXT NOT NULL, user_id TEXT NOT NULL, "
+                "created_at TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            ## 만료 항목 정리 / 항목 수 상한 유지용
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS ix_principal_cache_expires_at ON principal_cache (expires_at)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"ERROR: Failed to open principal cache file {path}: {e}")
+            self._db = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0
+
+    @property
+    def shared(self) -> bool:
+        return self._db is not None
+
+    def get(self, user_pk: str) -> Optional[UserPrincipal]:
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            if self._db is not None:
+                principal = self._get_shared(user_pk, now)
+            else:
+                principal = self._get_memory(user_pk, now)
+
+            if principal is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return principal
+
+    def _get_memory(self, user_pk: str, now: float) -> Optional[UserPrincipal]:
+        ## lock 을 잡은 상태에서 호출
+        entry = self._entries.get(user_pk)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at <= now:
+            del self._entries[user_pk]
+            return None
+        self._entries.move_to_end(user_pk)
+        return principal
+
+    def _get_shared(self, user_pk: str, now: float) -> Optional[UserPrincipal]:
+        try:
+            row = self._db.execute(
+                "SELECT id, user_name, user_id, created_at FROM principal_cache "
+                "WHERE id = ? AND expires_at > ?",
+                (user_pk, now),
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"ERROR: Principal cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return UserPrincipal(row[0], row[1], row[2], datetime.fromisoformat(row[3]))
+
+    def put(self, principal: UserPrincipal) -> None:
+        if not self.enabled:
+            return
+
+        now = time.time()
+        expires_at = now + self.ttl_sec
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO principal_cache (id, user_name, user_id, created_at, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (principal.id, principal.user_name, principal.user_id,
+                         principal.created_at.isoformat(), expires_at),
+                    )
+                    self._prune_shared(now)
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"ERROR: Principal cache write failed: {e}")
+                return
+
+            self._entries.pop(principal.id, None)
+            self._entries[principal.id] = (expires_at, principal)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _prune_shared(self, now: float) -> None:
+        ## lock 을 잡은 상태에서 호출, 만료된 항목을 지우고 max_entries 를 넘는 항목은 가장 먼저 만료될 것부터 삭제
+        self._db.execute("DELETE FROM principal_cache WHERE expires_at <= ?", (now,))
+        cursor = self._db.execute(
+            "DELETE FROM principal_cache WHERE id IN ("
+            "SELECT id FROM principal_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+    def invalidate(self, user_pk: str) -> None:
+        with self._lock:
+            self.invalidations += 1
+            self._entries.pop(user_pk, None)
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM principal_cache WHERE id = ?", (user_pk,))
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    print(f"ERROR: Principal cache invalidate failed: {e}")
+
+    ## async 라우터용: 메모리 모드는 바로 실행, 공유 모드는 sqlite 대기(busy timeout)가 루프를 막지 않도록 threadpool 에서 실행
+    async def get_async(self, user_pk: str) -> Optional[UserPrincipal]:
+        if self.shared:
+            return await run_in_threadpool(self.get, user_pk)
+        return self.get(user_pk)
+
+    async def put_async(self, principal: UserPrincipal) -> None:
+        if self.shared:
+            await run_in_threadpool(self.put, principal)
+        else:
+            self.put(principal)
+
+    async def invalidate_async(self, user_pk: str) -> None:
+        if self.shared:
+            await run_in_threadpool(self.invalidate, user_pk)
+        else:
+            self.invalidate(user_pk)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": "principal",
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "shared": self._db is not None,
+            }
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_TTL_SEC, PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_PATH)
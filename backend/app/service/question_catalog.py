@@ -0,0 +1,75 @@
+# backend/app/service/question_catalog.py
+"""
+긍정 질문 목록(TB_positive_question) 메모리 캐시
+질문은 거의 바뀌지 않으므로 한 번 읽어서 id / question_number 로 색인해 두고,
+QUESTION_CATALOG_TTL_SEC 가 지나거나 모르는 질문 id / 번호를 만나면 다시 읽음
+(질문을 추가/수정하는 코드는 invalidate() 를 호출, 예: query_plan_check.seed_sample_data)
+"""
+import os
+import time
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.positiveQuestion import PositiveQuestion
+
+QUESTION_CATALOG_TTL_SEC = float(os.getenv("QUESTION_CATALOG_TTL_SEC", 300))
+## 모르는 질문 id / 번호로 인한 재조회 최소 간격 (잘못된 id 요청이 매번 전체 목록을 읽지 않도록)
+_MIN_RELOAD_SEC = 5.0
+
+
+class QuestionEntry(NamedTuple):
+    id: str
+    question_number: int
+    text: str
+
+
+class QuestionCatalog:
+
+    def __init__(self, ttl_sec: float):
+        self.ttl_sec = ttl_sec
+        self.by_id: Dict[str, QuestionEntry] = {}
+        self.by_number: Dict[int, QuestionEntry] = {}
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_sec
+
+    async def load(self, db: AsyncSession) -> "QuestionCatalog":
+        result = await db.execute(
+            select(PositiveQuestion.id, PositiveQuestion.question_number, PositiveQuestion.text)
+        )
+        entries = list(map(QuestionEntry._make, result))
+        ## 색인을 새로 만든 뒤 한 번에 교체 (읽는 쪽은 항상 완성된 dict 를 봄)
+        self.by_id = {entry.id: entry for entry in entries}
+        self.by_number = {entry.question_number: entry for entry in entries}
+        self._loaded_at = time.monotonic()
+        return self
+
+    async def ensure(self, db: AsyncSession) -> "QuestionCatalog":
+        if not self._is_fresh():
+            await self.load(db)
+        return self
+
+    async def _lookup(self, db: AsyncSession, index: str, key) -> Optional[QuestionEntry]:
+        ## index 는 "by_id" / "by_number", load() 가 색인을 교체하므로 매번 속성으로 다시 찾음
+        await self.ensure(db)
+        entry = getattr(self, index).get(key)
+        if entry is None and time.monotonic() - self._loaded_at >= _MIN_RELOAD_SEC:
+            ## 캐시 이후 추가된 질문일 수 있으므로 한 번 다시 읽음
+            await self.load(db)
+            entry = getattr(self, index).get(key)
+        return entry
+
+    async def get_by_id(self, db: AsyncSession, question_id: str) -> Optional[QuestionEntry]:
+        return await self._lookup(db, "by_id", question_id)
+
+    async def get_by_number(self, db: AsyncSession, question_number: int) -> Optional[QuestionEntry]:
+        return await self._lookup(db, "by_number", question_number)
+
+
+question_catalog = QuestionCatalog(QUESTION_CATALOG_TTL_SEC)
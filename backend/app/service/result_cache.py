@@ -0,0 +1,197 @@
+# backend/app/service/result_cache.py
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+## 캐시별 메모리 상한 (MB) / 디스크 영속화 디렉토리 (설정 시에만 사용)
+RESULT_CACHE_MAX_MB = float(os.getenv("RESULT_CACHE_MAX_MB", 32))
+RESULT_CACHE_DIR = os.getenv("RESULT_CACHE_DIR")
+RESULT_CACHE_MAX_DISK_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_DISK_ENTRIES", 100000))
+
+## 항목당 key/OrderedDict 노드 등 부가 메모리 추정치 (byte)
+_ENTRY_OVERHEAD = 200
+## put 몇 번마다 디스크 항목 수 상한을 맞출지
+_DISK_TRIM_INTERVAL = 1000
+
+
+def normalize_text(text: str) -> str:
+    ## 유니코드 정규화 + 공백 정리 (공백만 다른 일기는 같은 내용으로 취급)
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+def model_fingerprint(model_path: str) -> str:
+    ## 모델 경로 + config 수정 시각 -> 모델 교체 시 캐시 키가 자동으로 바뀜
+    config_path = os.path.join(model_path, "config.json")
+    try:
+        mtime = int(os.path.getmtime(config_path))
+    except OSError:
+        mtime = 0
+    return f"{os.path.basename(os.path.normpath(model_path))}@{mtime}"
+
+
+class ResultCache:
+    """
+    정규화된 내용 해시 + 모델 버전을 key로 하는 LRU 캐시
+    메모리 사용량(UTF-8 byte) 기준으로 오래된 항목부터 제거하고,
+    persist_path 가 주어지면 sqlite 파일에도 저장하여 재시작/다른 프로세스와 공유
+    (sqlite 읽기/쓰기는 _db_lock 으로만 보호해서 디스크 I/O 중에도 메모리 조회는 막히지 않음)
+    """
+
+    def __init__(self, name: str, max_bytes: int, persist_path: Optional[str] = None,
+                 max_disk_entries: int = RESULT_CACHE_MAX_DISK_ENTRIES):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+
+        ## key -> (JSON 문자열, UTF-8 byte 수) (get 할 때마다 새 객체를 돌려주기 위해 직렬화해서 보관)
+        self._entries: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._puts_since_trim = 0
+        if persist_path:
+            self._open_disk(persist_path)
+
+    def _open_disk(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"ERROR: Failed to open result cache file {path}: {e}")
+            self._db = None
+
+    @staticmethod
+    def make_key(text: str, model_version: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(model_version.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(normalize_text(text).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _store_memory(self, key: str, payload: str) -> None:
+        ## lock 을 잡은 상태에서 호출, 한글은 글자당 3 byte 이므로 len(payload) 가 아닌 UTF-8 길이로 계산
+        size = len(payload.encode("utf-8")) + _ENTRY_OVERHEAD
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (payload, size)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(entry[0])
+
+        payload = self._read_disk(key) if self._db is not None else None
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            ## 디스크를 읽는 동안 put 으로 들어온 값이 있으면 그대로 둠
+            if key not in self._entries:
+                self._store_memory(key, payload)
+            self.disk_hits += 1
+        return json.loads(payload)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        ## 찾은 항목은 accessed_at 을 갱신해서 디스크도 최근에 쓴 순서로 정리되도록 (LRU)
+        with self._db_lock:
+            try:
+                row = self._db.execute(
+                    "SELECT value FROM result_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE result_cache SET accessed_at = julianday('now') WHERE key = ?", (key,)
+                    )
+                    self._db.commit()
+            except sqlite3.Error as e:
+                print(f"ERROR: Result cache ({self.name}) disk read failed: {e}")
+                return None
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: Any) -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._store_memory(key, payload)
+            trim_keys = None
+            if self._db is not None:
+                self._puts_since_trim += 1
+                if self._puts_since_trim >= _DISK_TRIM_INTERVAL:
+                    self._puts_since_trim = 0
+                    ## 메모리에서 계속 쓰이는 항목은 디스크에서 먼저 지워지지 않도록 함께 갱신
+                    trim_keys = list(self._entries)
+
+        if self._db is None:
+            return
+        with self._db_lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO result_cache (key, value, accessed_at) "
+                    "VALUES (?, ?, julianday('now'))",
+                    (key, payload),
+                )
+                if trim_keys is not None:
+                    self._trim_disk(trim_keys)
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"ERROR: Result cache ({self.name}) disk write failed: {e}")
+
+    def _trim_disk(self, recent_keys) -> None:
+        ## _db_lock 을 잡은 상태에서 호출, 디스크 항목 수 상한 유지 (가장 오래 쓰이지 않은 것부터 삭제)
+        self._db.executemany(
+            "UPDATE result_cache SET accessed_at = julianday('now') WHERE key = ?",
+            ((key,) for key in recent_keys),
+        )
+        self._db.execute(
+            "DELETE FROM result_cache WHERE key NOT IN ("
+            "SELECT key FROM result_cache ORDER BY accessed_at DESC LIMIT ?)",
+            (self.max_disk_entries,),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "persistent": self._db is not None,
+            }
+
+
+def create_cache(name: str) -> ResultCache:
+    persist_path = os.path.join(RESULT_CACHE_DIR, f"{name}.sqlite3") if RESULT_CACHE_DIR else None
+    return ResultCache(name, int(RESULT_CACHE_MAX_MB * 1024 * 1024), persist_path)
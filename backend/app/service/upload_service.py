@@ -0,0 +1,149 @@
+# backend/app/service/upload_service.py
+"""
+일기 첨부 이미지 업로드 저장
+- 첫 바이트(magic bytes)로 이미지 형식 확인, 확장자는 파일 이름이 아닌 실제 형식으로 결정
+- UPLOAD_CHUNK_BYTES 단위로 읽고 쓰면서 UPLOAD_MAX_BYTES 를 넘는 순간 중단 (413)
+- 쓰면서 SHA-256 을 계산해 파일 이름을 <hash><확장자> 로 결정 (같은 사진은 같은 파일 하나만 저장)
+- 같은 폴더의 임시 파일에 쓴 뒤 os.replace 로 교체 (중간에 실패해도 반쯤 쓴 파일이 보이지 않음)
+- prepare 가 있으면 교체 전에 임시 파일에 적용 (원본 메타데이터 제거, 처리할 수 없는 파일은 415)
+파일 읽기/쓰기는 chunk 마다 anyio 워커 스레드 한 번에 실행 (이벤트 루프를 막지 않음)
+"""
+import os
+import uuid
+import hashlib
+import contextlib
+from typing import BinaryIO, Callable, NamedTuple, Optional
+
+import anyio
+from fastapi import HTTPException, UploadFile, status
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", 1024 * 1024))
+
+## 형식 판별에 필요한 앞부분 길이
+_SNIFF_BYTES = 12
+
+
+class SavedUpload(NamedTuple):
+    path: str
+    filename: str
+    size: int
+    content_type: str
+    digest: str
+    ## 같은 내용의 파일이 이미 있어서 새로 쓰지 않았는지
+    deduplicated: bool
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    ## 파일 앞부분 -> content_type (지원하지 않는 형식이면 None)
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    ## iPhone 사진 (ISO BMFF ftyp box)
+    if head[4:8] == b"ftyp" and head[8:12] in (b"heic", b"heix", b"mif1", b"msf1"):
+        return "image/heic"
+    return None
+
+
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+}
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"이미지 파일은 {round(max_bytes / (1024 * 1024), 1):g}MB 이하만 첨부할 수 있습니다."
+    )
+
+
+def _open_temp(dest_dir: str, temp_path: str, head: bytes) -> BinaryIO:
+    os.makedirs(dest_dir, exist_ok=True)
+    buffer = open(temp_path, "wb")
+    buffer.write(head)
+    return buffer
+
+
+def _copy_chunk(src: BinaryIO, dst: BinaryIO, hasher, remaining: int) -> int:
+    ## 읽기 + 해시 + 쓰기를 워커 스레드 한 번에 처리, 남은 허용량보다 많이 읽히면 쓰지 않고 -1
+    chunk = src.read(min(UPLOAD_CHUNK_BYTES, remaining + 1))
+    if len(chunk) > remaining:
+        return -1
+    hasher.update(chunk)
+    dst.write(chunk)
+    return len(chunk)
+
+
+def _commit_temp(buffer: BinaryIO, temp_path: str, final_path: str,
+                 prepare: Optional[Callable[[str], object]] = None) -> bool:
+    ## 같은 내용의 파일이 이미 있으면 임시 파일을 버리고 True
+    buffer.close()
+    if os.path.exists(final_path):
+        os.remove(temp_path)
+        ## 수정 시각 갱신 (GC 의 유예 시간 기준, 방금 다시 쓰인 파일을 지우지 않도록)
+        os.utime(final_path)
+        return True
+    if prepare is not None:
+        ## 공개 경로로 옮기기 전에 처리 (처리 전 파일이 잠깐이라도 보이지 않도록)
+        try:
+            prepare(temp_path)
+        except Exception as e:
+            print(f"WARNING: Rejected upload that could not be processed: {e}")
+            raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="이미지를 읽을 수 없습니다. 다른 파일로 다시 시도해 주세요.")
+    os.replace(temp_path, final_path)
+    return False
+
+
+async def save_upload(upload: UploadFile, dest_dir: str, max_bytes: Optional[int] = None,
+                      prepare: Optional[Callable[[str], object]] = None) -> SavedUpload:
+    """
+    업로드 이미지를 dest_dir/<sha256><확장자> 로 저장 (upload 는 닫지 않음, 호출 측에서 close)
+    형식이 이미지가 아니면 415, 크기 제한을 넘으면 413
+    파일 이름은 업로드된 내용의 해시, prepare 는 새로 저장하는 경우에만 적용
+    """
+    if max_bytes is None:
+        max_bytes = UPLOAD_MAX_BYTES
+    ## multipart 파싱 때 크기를 이미 알고 있으면 쓰기 전에 거절
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    head = await upload.read(_SNIFF_BYTES)
+    content_type = sniff_image_type(head)
+    if content_type is None:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="지원하지 않는 이미지 형식입니다. (jpg/png/gif/webp/heic)")
+
+    temp_path = os.path.join(dest_dir, f".{uuid.uuid4()}.part")
+
+    hasher = hashlib.sha256(head)
+    size = len(head)
+    buffer: Optional[BinaryIO] = None
+    try:
+        buffer = await anyio.to_thread.run_sync(_open_temp, dest_dir, temp_path, head)
+        while True:
+            copied = await anyio.to_thread.run_sync(_copy_chunk, upload.file, buffer, hasher, max_bytes - size)
+            if copied < 0:
+                raise _too_large(max_bytes)
+            if copied == 0:
+                break
+            size += copied
+        digest = hasher.hexdigest()
+        filename = digest + IMAGE_EXTENSIONS[content_type]
+        final_path = os.path.join(dest_dir, filename)
+        deduplicated = await anyio.to_thread.run_sync(_commit_temp, buffer, temp_path, final_path, prepare)
+    except BaseException:
+        ## 크기 초과 / 쓰기 실패 / 요청 취소 시 임시 파일 정리 (취소된 상태에서도 실행되도록 동기 호출)
+        if buffer is not None:
+            buffer.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+    return SavedUpload(final_path, filename, size, content_type, digest, deduplicated)
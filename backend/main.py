@@ -1,7 +1,10 @@
 #backend/main.py
+import os
 import uvicorn
 
 def main():
+    ## 개발용 reload 모드에서는 재시작마다 모델을 올리지 않고 첫 요청 때 로드
+    os.environ.setdefault("MODEL_WARMUP", "0")
     uvicorn.run(app="app.app:app", host="0.0.0.0", port=8000, reload=True) 
 
 if __name__ == "__main__":
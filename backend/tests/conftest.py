@@ -0,0 +1,17 @@
+# backend/tests/conftest.py
+"""
+테스트 공통 설정: 앱 모듈이 import 시점에 읽는 환경 변수를 먼저 지정
+DB 는 임시 SQLite 파일 (TEST_DATABASE_URL 로 MySQL 등 다른 DB 지정 가능)
+"""
+import os
+import sys
+import tempfile
+
+_TMP_DIR = tempfile.mkdtemp(prefix="grooming-tests-")
+
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{os.path.join(_TMP_DIR, 'test.db')}")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_TMP_DIR, "images"))
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,87 @@
+# backend/tests/test_comment_jobs_resume.py
+"""
+resume_pending_jobs 가 여러 worker 에서 동시에 실행되어도 pending 작업을 한 번씩만 다시 등록하는지 확인
+"""
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import delete
+
+from app.database import Base, SessionLocal, engine
+from app.models.user import User
+from app.models.diary import Diary
+from app.service import comment_jobs
+
+
+@pytest.fixture
+def user_pk():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(user_name="테스트", user_id=f"resume_user_{time.time_ns()}", user_pwd="x",
+                    birth_date=date(2000, 1, 1), gender="F")
+        db.add(user)
+        db.commit()
+        yield user.id
+        db.execute(delete(Diary).where(Diary.user_id == user.id))
+        db.delete(user)
+        db.commit()
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    calls = []
+    monkeypatch.setattr(comment_jobs, "submit_comment_job",
+                        lambda diary_id, content, user_name, emotion_label: calls.append(diary_id))
+    return calls
+
+
+def add_pending(user_pk: str, days_ago: int, claimed_by=None, claimed_at=None) -> str:
+    with SessionLocal() as db:
+        diary = Diary(user_id=user_pk, diary_date=date.today() - timedelta(days=days_ago), content=f"일기 {days_ago}",
+                      emotion_score=0.5, emotion_emoji="happy.png", emotion_label="Happy",
+                      overall_emotion_score={"Happy": 0.5}, ai_comment=comment_jobs.COMMENT_PLACEHOLDER,
+                      comment_status=comment_jobs.COMMENT_STATUS_PENDING,
+                      comment_claimed_by=claimed_by, comment_claimed_at=claimed_at)
+        db.add(diary)
+        db.commit()
+        return diary.id
+
+
+def claimed_by(diary_id: str):
+    with SessionLocal() as db:
+        return db.get(Diary, diary_id).comment_claimed_by
+
+
+def as_worker(monkeypatch, process_id: str) -> None:
+    monkeypatch.setattr(comment_jobs, "PROCESS_ID", process_id)
+    comment_jobs.resume_pending_jobs()
+
+
+def test_each_pending_job_is_resumed_by_one_worker(monkeypatch, user_pk, submitted):
+    now = datetime.utcnow()
+    host = comment_jobs._HOSTNAME
+    unclaimed = add_pending(user_pk, 1)
+    expired = add_pending(user_pk, 2, "other-host:1", now - timedelta(seconds=comment_jobs.COMMENT_CLAIM_TIMEOUT_SEC + 60))
+    ## 같은 host 에서 살아 있는 프로세스(pytest 자신)가 방금 맡은 작업은 그대로 둠
+    running = add_pending(user_pk, 3, f"{host}:{os.getpid()}", now)
+    recent_remote = add_pending(user_pk, 4, "other-host:1", now)
+
+    as_worker(monkeypatch, f"{host}:worker-a")
+    as_worker(monkeypatch, f"{host}:worker-b")
+
+    assert sorted(submitted) == sorted([unclaimed, expired])
+    assert claimed_by(unclaimed) == claimed_by(expired) == f"{host}:worker-a"
+    assert claimed_by(running) == f"{host}:{os.getpid()}"
+    assert claimed_by(recent_remote) == "other-host:1"
+
+
+def test_job_of_exited_process_on_same_host_is_taken_over(monkeypatch, user_pk, submitted):
+    ## 존재하지 않는 pid
+    dead = add_pending(user_pk, 1, f"{comment_jobs._HOSTNAME}:{2 ** 22 + 1}", datetime.utcnow())
+
+    as_worker(monkeypatch, f"{comment_jobs._HOSTNAME}:worker-a")
+
+    assert submitted == [dead]
+    assert claimed_by(dead) == f"{comment_jobs._HOSTNAME}:worker-a"
@@ -0,0 +1,113 @@
+# backend/tests/test_comment_profiles.py
+"""
+comment_jobs 의 프로파일 선택 / 기록 확인
+    - 요청 스레드에서 바로 생성하는 경로(generate_now)도 진행 중인 예상 시간에 포함되는지
+    - 캐시 / 실패 문구로 끝난 결과는 요청한 프로파일이 아니라 실제 프로파일로 기록되는지
+    - warm-up 없이 실행해도 모델이 준비된 뒤의 실측값으로 예상 시간이 보정되는지
+"""
+import time
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from app.service import chatbot_service, comment_jobs, inference_client
+from app.service.model_registry import STATE_UNLOADED, STATE_WARM, registry
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    monkeypatch.setattr(comment_jobs, "COMMENT_LATENCY_BUDGET_MS", 3000.0)
+    monkeypatch.setattr(comment_jobs, "COMMENT_WORKERS", 1)
+    monkeypatch.setattr(comment_jobs, "_profile_cost_ms", {
+        chatbot_service.PROFILE_QUALITY: 2500.0,
+        chatbot_service.PROFILE_BALANCED: 1000.0,
+        chatbot_service.PROFILE_FAST: 300.0,
+    })
+    monkeypatch.setattr(chatbot_service, "DEFAULT_PROFILE", chatbot_service.PROFILE_QUALITY)
+    monkeypatch.setattr(chatbot_service, "get_cached_comment", lambda content, profile: None)
+
+
+def test_sync_generation_counts_as_inflight(monkeypatch, budget):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_generate(content, profile):
+        started.set()
+        release.wait(5)
+        return "생성된 코멘트.", profile
+
+    monkeypatch.setattr(inference_client, "generate_comment", slow_generate)
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(first=comment_jobs.generate_now("첫 번째 일기")))
+    worker.start()
+    try:
+        assert started.wait(5)
+        ## quality(2500ms) 가 진행 중이면 다음 요청은 예산(3000ms) 안에 들어가는 fast 로 낮춤
+        assert comment_jobs.queue_depth() == 1
+        assert comment_jobs.choose_profile() == chatbot_service.PROFILE_FAST
+    finally:
+        release.set()
+        worker.join(5)
+
+    assert result["first"] == ("생성된 코멘트.", chatbot_service.PROFILE_QUALITY)
+    assert comment_jobs.queue_depth() == 0
+    assert comment_jobs.choose_profile() == chatbot_service.PROFILE_QUALITY
+
+
+def test_fallback_comment_is_recorded_without_profile(monkeypatch, budget):
+    monkeypatch.setattr(inference_client, "generate_comment",
+                        lambda content, profile: (chatbot_service.GENERATION_FAILED_COMMENT, None))
+    before = comment_jobs.profile_latency_hist[chatbot_service.PROFILE_QUALITY].snapshot()
+
+    assert comment_jobs.generate_now("일기") == (chatbot_service.GENERATION_FAILED_COMMENT, None)
+    ## 실패 문구는 생성 시간 통계에도 넣지 않음
+    assert comment_jobs.profile_latency_hist[chatbot_service.PROFILE_QUALITY].snapshot() == before
+
+
+def test_cache_hit_keeps_cached_profile(monkeypatch, budget):
+    ## fast 를 요청했는데 quality 로 만든 캐시가 있으면 quality 로 기록
+    monkeypatch.setattr(chatbot_service, "get_cached_comment",
+                        lambda content, profile: ("캐시된 코멘트.", chatbot_service.PROFILE_QUALITY))
+    monkeypatch.setattr(inference_client, "generate_comment", lambda content, profile: pytest.fail("cache miss"))
+
+    assert comment_jobs.generate_now("일기", budget_ms=100) == ("캐시된 코멘트.", chatbot_service.PROFILE_QUALITY)
+
+
+def test_uncontended_sync_generation_updates_estimate(monkeypatch, budget):
+    monkeypatch.setattr(comment_jobs, "workers_state", None)
+    monkeypatch.setattr(inference_client, "generate_comment", lambda content, profile: ("생성된 코멘트.", profile))
+    entry = registry._entries["chatbot"]
+
+    ## 모델을 아직 로드하지 않은 첫 요청은 로드 시간이 섞이므로 보정하지 않음
+    monkeypatch.setattr(entry, "state", STATE_UNLOADED)
+    comment_jobs.generate_now("일기")
+    assert comment_jobs._profile_cost_ms[chatbot_service.PROFILE_QUALITY] == 2500.0
+
+    monkeypatch.setattr(entry, "state", STATE_WARM)
+    comment_jobs.generate_now("일기")
+    assert comment_jobs._profile_cost_ms[chatbot_service.PROFILE_QUALITY] < 2500.0
+
+
+def test_worker_jobs_update_estimate_after_first_result(monkeypatch, budget):
+    ## MODEL_WARMUP=0 이면 workers_state 가 없으므로 워커가 결과를 한 번 돌려준 뒤부터 보정
+    monkeypatch.setattr(comment_jobs, "workers_state", None)
+    monkeypatch.setattr(comment_jobs, "_workers_warm", False)
+    monkeypatch.setattr(comment_jobs, "_save_comment", lambda *args, **kwargs: None)
+    monkeypatch.setattr(comment_jobs, "_finish_job", lambda *args, **kwargs: None)
+    monkeypatch.setattr(chatbot_service, "cache_comment", lambda *args: None)
+    profile = chatbot_service.PROFILE_QUALITY
+
+    def finish_job():
+        cost_ms, measurable = comment_jobs._start_job(profile, "diary", threading.Event())
+        comment_jobs._jobs.pop("diary", None)
+        comment_jobs._inflight_cost_ms -= cost_ms
+        future = Future()
+        future.set_result(("생성된 코멘트.", profile))
+        comment_jobs._on_job_done(future, "diary", "일기", "홍길동", "Happy", threading.Event(),
+                                  profile, cost_ms, time.perf_counter(), measurable)
+
+    finish_job()
+    assert comment_jobs._profile_cost_ms[profile] == 2500.0
+    finish_job()
+    assert comment_jobs._profile_cost_ms[profile] < 2500.0
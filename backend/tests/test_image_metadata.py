@@ -0,0 +1,89 @@
+# backend/tests/test_image_metadata.py
+"""
+업로드 원본의 메타데이터(EXIF/GPS, XMP, 주석) 제거 확인
+"""
+import io
+import os
+import asyncio
+
+import pytest
+from PIL import Image
+from starlette.datastructures import UploadFile
+
+from app.service import image_service, upload_service
+
+GPS_IFD = 0x8825
+ORIENTATION = 0x0112
+XMP = b'<x:xmpmeta xmlns:x="adobe:ns:meta/"><rdf:RDF/></x:xmpmeta>'
+
+
+def exif_with_gps(orientation: int = 1) -> Image.Exif:
+    exif = Image.Exif()
+    exif[ORIENTATION] = orientation
+    exif[0x010F] = "PhoneMaker"
+    exif.get_ifd(GPS_IFD).update({1: "N", 2: (37.0, 33.0, 59.0), 3: "E", 4: (126.0, 58.0, 41.0)})
+    return exif
+
+
+def image_bytes(image_format: str, orientation: int = 1, **options) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 32), (200, 30, 30)).save(buffer, image_format, exif=exif_with_gps(orientation), **options)
+    return buffer.getvalue()
+
+
+def assert_clean(path: str) -> None:
+    with Image.open(path) as img:
+        assert not img.getexif()
+        assert not any(key in img.info for key in ("exif", "xmp", "XML:com.adobe.xmp", "comment"))
+
+
+@pytest.mark.parametrize("image_format, extension, options", [
+    ("JPEG", ".jpg", {"xmp": XMP, "comment": b"taken at home"}),
+    ("PNG", ".png", {}),
+    ("WEBP", ".webp", {"xmp": XMP}),
+])
+def test_strip_metadata_removes_gps(tmp_path, image_format, extension, options):
+    path = str(tmp_path / f"photo{extension}")
+    with open(path, "wb") as f:
+        f.write(image_bytes(image_format, **options))
+
+    assert image_service.strip_metadata(path)
+    assert_clean(path)
+    with Image.open(path) as img:
+        assert img.format == image_format and img.size == (64, 32)
+    ## 이미 지운 파일은 다시 저장하지 않음
+    assert not image_service.strip_metadata(path)
+
+
+def test_strip_metadata_applies_orientation(tmp_path):
+    path = str(tmp_path / "rotated.jpg")
+    with open(path, "wb") as f:
+        f.write(image_bytes("JPEG", orientation=6))
+
+    assert image_service.strip_metadata(path)
+    assert_clean(path)
+    with Image.open(path) as img:
+        assert img.size == (32, 64)
+
+
+def test_saved_upload_never_exposes_metadata(tmp_path):
+    payload = image_bytes("JPEG", xmp=XMP)
+    upload = UploadFile(io.BytesIO(payload), size=len(payload), filename="photo.jpg")
+
+    saved = asyncio.run(upload_service.save_upload(upload, str(tmp_path), prepare=image_service.strip_metadata))
+
+    assert_clean(saved.path)
+    ## 파일 이름은 업로드된 내용 기준이라 같은 사진을 다시 올리면 그대로 중복 처리
+    again = UploadFile(io.BytesIO(payload), size=len(payload), filename="photo.jpg")
+    assert asyncio.run(upload_service.save_upload(again, str(tmp_path), prepare=image_service.strip_metadata)).deduplicated
+    assert os.listdir(tmp_path) == [saved.filename]
+
+
+def test_unreadable_upload_is_rejected(tmp_path):
+    payload = b"\xff\xd8\xff\xe0" + b"not really a jpeg" * 10
+    upload = UploadFile(io.BytesIO(payload), size=len(payload), filename="broken.jpg")
+
+    with pytest.raises(upload_service.HTTPException) as exc_info:
+        asyncio.run(upload_service.save_upload(upload, str(tmp_path), prepare=image_service.strip_metadata))
+    assert exc_info.value.status_code == 415
+    assert os.listdir(tmp_path) == []
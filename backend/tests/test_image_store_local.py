@@ -0,0 +1,43 @@
+# backend/tests/test_image_store_local.py
+"""
+로컬 저장소에서 같은 사진을 다시 올렸을 때 원본 + 파생본 시각이 모두 갱신되는지 확인
+"""
+import io
+import os
+import asyncio
+
+import pytest
+from PIL import Image
+from starlette.datastructures import UploadFile
+
+from app.service import image_storage, image_store
+
+USER_PK = "local-user"
+
+
+def jpeg_upload() -> UploadFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480), (0, 0, 255)).save(buffer, "JPEG")
+    payload = buffer.getvalue()
+    return UploadFile(io.BytesIO(payload), size=len(payload), filename="photo.jpg")
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    local = image_storage.LocalStorage(str(tmp_path / "images"))
+    monkeypatch.setattr(image_storage, "_storage", local)
+    return local
+
+
+def test_dedup_hit_touches_variants(storage):
+    stored = asyncio.run(image_store.store_upload(USER_PK, jpeg_upload()))
+    names = image_store.blob_names(image_store.split_url(stored.url)[1])
+    assert set(stored.variants) == {"thumb", "display"}
+
+    ## 오래된 파일처럼 만들어 둔 뒤 같은 사진을 다시 올림
+    for name in names:
+        os.utime(os.path.join(storage.user_dir(USER_PK), name), (1_000_000, 1_000_000))
+    again = asyncio.run(image_store.store_upload(USER_PK, jpeg_upload()))
+
+    assert again.deduplicated
+    assert all(storage.mtime(USER_PK, name) > 1_000_000 for name in names)
@@ -0,0 +1,166 @@
+# backend/tests/test_image_store_s3.py
+"""
+S3 저장소(moto) 에서 image_store 의 업로드 / 중복 제거 / release / GC 확인
+"""
+import io
+import time
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+from PIL import Image
+from sqlalchemy import delete
+from starlette.datastructures import UploadFile
+
+from app.database import AsyncSessionLocal, Base, SessionLocal, engine, get_async_engine
+from app.models.user import User
+from app.models.diary import Diary
+from app.service import image_storage, image_store
+
+BUCKET = "grooming-test"
+
+
+def jpeg_bytes(color) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def make_upload(payload: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(payload), size=len(payload), filename="photo.jpg")
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    with moto.mock_aws():
+        s3 = image_storage.S3Storage(BUCKET, endpoint_url=None, region="us-east-1", public_url="")
+        s3.client.create_bucket(Bucket=BUCKET)
+        monkeypatch.setattr(image_storage, "_storage", s3)
+        monkeypatch.setattr(image_storage, "IMAGE_STAGING_DIR", str(tmp_path / "staging"))
+        yield s3
+
+
+@pytest.fixture
+def user_pk():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        user = User(user_name="테스트", user_id=f"s3_user_{time.time_ns()}", user_pwd="x",
+                    birth_date=date(2000, 1, 1), gender="M")
+        db.add(user)
+        db.commit()
+        yield user.id
+        db.execute(delete(Diary).where(Diary.user_id == user.id))
+        db.delete(user)
+        db.commit()
+
+
+def add_diary(user_pk: str, url: str, days_ago: int = 0) -> str:
+    with SessionLocal() as db:
+        diary = Diary(user_id=user_pk, diary_date=date.today() - timedelta(days=days_ago), content="사진 일기", image_url=url,
+                      emotion_score=0.5, emotion_emoji="happy.png", emotion_label="Happy",
+                      overall_emotion_score={"Happy": 0.5}, ai_comment="코멘트")
+        db.add(diary)
+        db.commit()
+        return diary.id
+
+
+def remove_diary(diary_id: str) -> None:
+    with SessionLocal() as db:
+        db.execute(delete(Diary).where(Diary.id == diary_id))
+        db.commit()
+
+
+def run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await get_async_engine().dispose()
+    return asyncio.run(wrapper())
+
+
+async def release(user_pk: str, url: str) -> int:
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        return await image_store.release(db, user_pk, url)
+
+
+def test_upload_puts_original_and_variants(storage, user_pk):
+    stored = run(image_store.store_upload(user_pk, make_upload(jpeg_bytes((255, 0, 0)))))
+
+    name = image_store.split_url(stored.url)[1]
+    assert not stored.deduplicated
+    assert storage.list_names(user_pk) == set(image_store.blob_names(name))
+    assert set(stored.variants) == {"thumb", "display"}
+    head = storage.client.head_object(Bucket=BUCKET, Key=storage.key(user_pk, name))
+    assert head["ContentType"] == "image/jpeg"
+    assert head["CacheControl"] == image_storage.IMMUTABLE_CACHE_CONTROL
+
+
+def test_dedup_refreshes_last_modified(storage, user_pk):
+    payload = jpeg_bytes((0, 255, 0))
+    first = run(image_store.store_upload(user_pk, make_upload(payload)))
+    name = image_store.split_url(first.url)[1]
+    before = {blob: storage.mtime(user_pk, blob) for blob in image_store.blob_names(name)}
+
+    ## LastModified 는 초 단위
+    time.sleep(1.1)
+    second = run(image_store.store_upload(user_pk, make_upload(payload)))
+
+    assert second.deduplicated
+    assert second.url == first.url and second.variants == first.variants
+    for blob, mtime in before.items():
+        assert storage.mtime(user_pk, blob) > mtime
+    head = storage.client.head_object(Bucket=BUCKET, Key=storage.key(user_pk, name))
+    assert head["CacheControl"] == image_storage.IMMUTABLE_CACHE_CONTROL
+
+
+def test_release_deletes_only_unreferenced(storage, user_pk, monkeypatch):
+    monkeypatch.setattr(image_store, "IMAGE_GC_GRACE_SEC", 0)
+    stored = run(image_store.store_upload(user_pk, make_upload(jpeg_bytes((0, 0, 255)))))
+    first = add_diary(user_pk, stored.url)
+    second = add_diary(user_pk, stored.url, days_ago=1)
+
+    remove_diary(first)
+    assert run(release(user_pk, stored.url)) == 0
+    assert len(storage.list_names(user_pk)) == 3
+
+    remove_diary(second)
+    assert run(release(user_pk, stored.url)) == 3
+    assert storage.list_names(user_pk) == set()
+
+
+def test_release_respects_grace_period(storage, user_pk, monkeypatch):
+    monkeypatch.setattr(image_store, "IMAGE_GC_GRACE_SEC", 600)
+    stored = run(image_store.store_upload(user_pk, make_upload(jpeg_bytes((9, 9, 9)))))
+
+    assert run(release(user_pk, stored.url)) == 0
+    assert len(storage.list_names(user_pk)) == 3
+
+
+def test_collect_garbage(storage, user_pk, tmp_path):
+    kept = run(image_store.store_upload(user_pk, make_upload(jpeg_bytes((1, 2, 3)))))
+    orphan = run(image_store.store_upload(user_pk, make_upload(jpeg_bytes((200, 100, 50)))))
+    add_diary(user_pk, kept.url)
+    stray = tmp_path / "stray.png"
+    stray.write_bytes(b"\x89PNG\r\n\x1a\n")
+    storage.put_files(user_pk, [str(stray)])
+    storage.put_files("ghost-user", [str(stray)])
+
+    ## 유예 시간 안의 파일은 그대로
+    assert image_store.collect_garbage(grace_sec=600)["orphans"] == 0
+
+    dry_run = image_store.collect_garbage(dry_run=True, grace_sec=0)
+    assert dry_run["orphans"] == 5
+    assert len(storage.list_names(user_pk)) == 7
+
+    assert image_store.collect_garbage(grace_sec=0)["orphans"] == 5
+    kept_name = image_store.split_url(kept.url)[1]
+    orphan_name = image_store.split_url(orphan.url)[1]
+    assert storage.list_names(user_pk) == set(image_store.blob_names(kept_name))
+    assert orphan_name not in storage.list_names(user_pk)
+    assert storage.list_names("ghost-user") == set()
@@ -0,0 +1,80 @@
+# backend/tests/test_inference_client.py
+"""
+InferenceClient 재시도 규칙 확인
+    - 요청을 보낸 뒤 끊긴 POST 는 다시 보내지 않음 (모델 중복 실행 방지)
+    - 서버가 닫은 keep-alive 연결은 보내기 전에 새 연결로 교체
+"""
+import json
+import time
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.service.inference_client import InferenceClient, InferenceUnavailable
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server.posts += 1
+        if server.mode == "drop":
+            ## 요청을 받은 뒤 응답 없이 연결을 끊음 (추론 도중 서버가 죽은 경우)
+            self.close_connection = True
+            return
+        body = json.dumps({"comment": f"응답 {server.posts}"}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        ## keep-alive 헤더는 그대로 두고 연결만 닫음 (idle timeout 으로 닫힌 연결과 같은 상태)
+        self.close_connection = server.mode == "close_idle"
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.posts = 0
+    httpd.mode = "ok"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def client_for(httpd) -> InferenceClient:
+    return InferenceClient(f"http://127.0.0.1:{httpd.server_address[1]}")
+
+
+def test_post_is_not_resent_after_the_server_received_it(server):
+    server.mode = "drop"
+    with pytest.raises(InferenceUnavailable):
+        client_for(server).request("POST", "/comment", {"content": "일기"}, timeout=5)
+    assert server.posts == 1
+
+
+def test_idle_closed_keep_alive_connection_is_replaced_before_sending(server):
+    server.mode = "close_idle"
+    client = client_for(server)
+    assert client.request("POST", "/comment", {"content": "일기"}, timeout=5) == {"comment": "응답 1"}
+    time.sleep(0.05)
+    ## 서버가 닫은 소켓을 그대로 쓰면 RemoteDisconnected -> 재시도 없이 실패하게 됨
+    assert client.request("POST", "/comment", {"content": "일기"}, timeout=5) == {"comment": "응답 2"}
+    assert server.posts == 2
+
+
+def test_refused_connection_fails_without_reaching_the_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    with pytest.raises(InferenceUnavailable):
+        InferenceClient(f"http://127.0.0.1:{port}").request("POST", "/comment", {"content": "일기"}, timeout=1)
@@ -0,0 +1,42 @@
+# backend/tests/test_middleware.py
+"""
+CompressionMiddleware 가 압축한 응답의 ETag 를 약한 ETag 로 바꾸는지 확인
+"""
+import asyncio
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.http_cache import etag_matches
+from app.middleware import CompressionMiddleware
+
+ETAG = '"0123456789abcdef"'
+
+
+async def monthly(request):
+    return JSONResponse({"emotion": ["Happy"] * 500}, headers={"ETag": ETAG})
+
+
+def fetch(accept_encoding: str) -> httpx.Response:
+    app = CompressionMiddleware(Starlette(routes=[Route("/graph", monthly)]))
+
+    async def request():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get("/graph", headers={"Accept-Encoding": accept_encoding})
+    return asyncio.run(request())
+
+
+def test_gzip_weakens_strong_etag():
+    compressed = fetch("gzip")
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == f"W/{ETAG}"
+    ## 클라이언트가 약한 ETag 를 보내도 304 비교는 그대로 성공
+    assert etag_matches(compressed.headers["etag"], ETAG)
+
+
+def test_identity_response_keeps_strong_etag():
+    identity = fetch("identity")
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == ETAG
@@ -0,0 +1,68 @@
+# backend/tests/test_principal_cache.py
+"""
+PrincipalCache 공유(sqlite) 모드의 항목 정리 / 이벤트 루프 밖 실행 확인
+"""
+import time
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+
+from app.service.principal_cache import PrincipalCache, UserPrincipal
+
+
+def principal(index: int) -> UserPrincipal:
+    return UserPrincipal(f"pk-{index}", f"사용자{index}", f"user{index}", datetime(2025, 1, 1, 9, 0, 0))
+
+
+def stored_ids(path: str):
+    with sqlite3.connect(path) as db:
+        return {row[0] for row in db.execute("SELECT id FROM principal_cache")}
+
+
+def test_shared_put_enforces_max_entries(tmp_path):
+    path = str(tmp_path / "principal.sqlite3")
+    cache = PrincipalCache(ttl_sec=300, max_entries=3, store_path=path)
+    for index in range(5):
+        cache.put(principal(index))
+        time.sleep(0.001)
+
+    ## 가장 먼저 만료될(먼저 저장된) 항목부터 제거
+    assert stored_ids(path) == {"pk-2", "pk-3", "pk-4"}
+    assert cache.stats()["evictions"] == 2
+    assert cache.get("pk-0") is None
+    assert cache.get("pk-4") == principal(4)
+
+
+def test_shared_put_prunes_expired_rows(tmp_path):
+    path = str(tmp_path / "principal.sqlite3")
+    short = PrincipalCache(ttl_sec=0.05, max_entries=100, store_path=path)
+    short.put(principal(0))
+    short.put(principal(1))
+    time.sleep(0.1)
+
+    PrincipalCache(ttl_sec=300, max_entries=100, store_path=path).put(principal(2))
+    assert stored_ids(path) == {"pk-2"}
+
+
+def test_shared_mode_runs_sqlite_off_the_event_loop(tmp_path):
+    cache = PrincipalCache(ttl_sec=300, max_entries=100, store_path=str(tmp_path / "principal.sqlite3"))
+    threads = []
+    original_get = cache.get
+    cache.get = lambda user_pk: threads.append(threading.current_thread()) or original_get(user_pk)
+
+    async def lookup():
+        await cache.put_async(principal(0))
+        return await cache.get_async("pk-0")
+
+    assert asyncio.run(lookup()) == principal(0)
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_memory_mode_async_wrappers_keep_lru_limit():
+    cache = PrincipalCache(ttl_sec=300, max_entries=2)
+    assert not cache.shared
+    for index in range(3):
+        asyncio.run(cache.put_async(principal(index)))
+    assert asyncio.run(cache.get_async("pk-0")) is None
+    assert asyncio.run(cache.get_async("pk-2")) == principal(2)
@@ -0,0 +1,34 @@
+# backend/tests/test_query_plans.py
+"""
+repositories 의 실제 조회 쿼리가 인덱스를 타는지 확인 (app/query_plan_check.py 와 같은 점검)
+full scan 또는 filesort 가 나오면 실패
+기본은 임시 SQLite, QUERY_PLAN_TEST_URL 로 MySQL / PostgreSQL 테스트 DB 지정 가능 (빈 DB 에 샘플 데이터 생성)
+"""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import query_plan_check
+
+CASES = query_plan_check.plan_cases()
+
+
+@pytest.fixture(scope="module")
+def plan_db(tmp_path_factory):
+    url = os.getenv("QUERY_PLAN_TEST_URL") or f"sqlite:///{tmp_path_factory.mktemp('plans') / 'query_plan.db'}"
+    engine = create_engine(url)
+    query_plan_check.prepare_database(engine)
+    with Session(engine) as db:
+        yield db, query_plan_check.sample_context(db)
+    engine.dispose()
+
+
+@pytest.mark.parametrize("build", [build for _, build in CASES], ids=[name for name, _ in CASES])
+def test_query_uses_index(plan_db, build):
+    db, ctx = plan_db
+    result = query_plan_check.explain(db.connection(), build(ctx))
+    plan = "\n".join(result.lines)
+    assert not result.full_scan, f"full scan:\n{plan}"
+    assert not result.filesort, f"filesort:\n{plan}"
@@ -0,0 +1,71 @@
+# backend/tests/test_question_catalog.py
+"""
+QuestionCatalog 가 캐시 이후 추가된 질문을 id / 번호로 찾는지, 샘플 데이터 생성 후 무효화되는지 확인
+"""
+import asyncio
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+from app.database import AsyncSessionLocal, Base, SessionLocal, engine, get_async_engine
+from app.models.positiveQuestion import PositiveQuestion
+from app.service import question_catalog as catalog_module
+from app.service.question_catalog import QuestionCatalog, question_catalog
+from app.query_plan_check import seed_sample_data
+
+NEW_NUMBER = 9001
+
+
+def run(coro):
+    async def wrapper():
+        try:
+            return await coro
+        finally:
+            await get_async_engine().dispose()
+    return asyncio.run(wrapper())
+
+
+async def lookup(catalog: QuestionCatalog, method: str, key):
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        return await getattr(catalog, method)(db, key)
+
+
+def add_question(number: int) -> str:
+    with SessionLocal() as db:
+        question = PositiveQuestion(question_number=number, text=f"질문 {number}")
+        db.add(question)
+        db.commit()
+        return question.id
+
+
+def test_lookup_reloads_once_for_questions_added_after_load(monkeypatch):
+    Base.metadata.create_all(bind=engine)
+    catalog = QuestionCatalog(ttl_sec=300)
+    try:
+        assert run(lookup(catalog, "get_by_number", NEW_NUMBER)) is None
+        question_id = add_question(NEW_NUMBER)
+
+        ## 최소 재조회 간격 안에서는 다시 읽지 않음
+        assert run(lookup(catalog, "get_by_number", NEW_NUMBER)) is None
+
+        monkeypatch.setattr(catalog_module, "_MIN_RELOAD_SEC", 0.0)
+        entry = run(lookup(catalog, "get_by_number", NEW_NUMBER))
+        assert entry is not None and entry.id == question_id
+        assert run(lookup(catalog, "get_by_id", question_id)).question_number == NEW_NUMBER
+    finally:
+        with SessionLocal() as db:
+            db.execute(delete(PositiveQuestion).where(PositiveQuestion.question_number == NEW_NUMBER))
+            db.commit()
+
+
+def test_seed_sample_data_invalidates_catalog(tmp_path):
+    question_catalog._loaded_at = 0.0
+    sample_engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    try:
+        Base.metadata.create_all(bind=sample_engine)
+        with Session(sample_engine) as db:
+            seed_sample_data(db)
+    finally:
+        sample_engine.dispose()
+    assert question_catalog._loaded_at is None
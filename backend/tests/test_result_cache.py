@@ -0,0 +1,67 @@
+# backend/tests/test_result_cache.py
+"""
+ResultCache 의 메모리 byte 상한 / 디스크 LRU / lock 범위 확인
+"""
+import json
+import time
+import threading
+
+from app.service import result_cache
+from app.service.result_cache import ResultCache, _ENTRY_OVERHEAD
+
+
+def entry_size(value) -> int:
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8")) + _ENTRY_OVERHEAD
+
+
+def test_memory_budget_counts_utf8_bytes():
+    korean = "오늘 하루도 고생 많았어요" * 10
+    cache = ResultCache("test", max_bytes=entry_size(korean) * 2)
+    for index in range(3):
+        cache.put(f"key-{index}", korean)
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert stats["bytes"] == entry_size(korean) * 2
+    assert cache.get("key-0") is None
+
+
+def test_disk_hit_refreshes_access_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "_DISK_TRIM_INTERVAL", 3)
+    path = str(tmp_path / "cache.sqlite3")
+    writer = ResultCache("test", max_bytes=10 * 1024 * 1024, persist_path=path, max_disk_entries=2)
+    writer.put("old", "처음 저장")
+    writer.put("other", "두 번째")
+    ## accessed_at(julianday) 은 ms 단위
+    time.sleep(0.01)
+
+    ## 새 프로세스처럼 메모리가 빈 캐시에서 old 를 읽으면 디스크에서도 최근 항목이 됨
+    reader = ResultCache("test", max_bytes=10 * 1024 * 1024, persist_path=path, max_disk_entries=2)
+    assert reader.get("old") == "처음 저장"
+    assert reader.stats()["disk_hits"] == 1
+
+    writer._entries.clear()
+    time.sleep(0.01)
+    writer.put("new", "세 번째")
+
+    fresh = ResultCache("test", max_bytes=10 * 1024 * 1024, persist_path=path, max_disk_entries=2)
+    assert fresh.get("old") == "처음 저장"
+    assert fresh.get("new") == "세 번째"
+    assert fresh.get("other") is None
+
+
+def test_memory_hits_do_not_wait_for_disk(tmp_path):
+    cache = ResultCache("test", max_bytes=10 * 1024 * 1024, persist_path=str(tmp_path / "cache.sqlite3"))
+    cache.put("hot", "메모리에 있음")
+
+    results = {}
+    with cache._db_lock:
+        ## 디스크 조회가 막혀 있는 동안에도 메모리 hit / stats 는 바로 응답
+        reader = threading.Thread(target=lambda: results.update(cold=cache.get("cold")))
+        reader.start()
+        reader.join(0.2)
+        assert reader.is_alive()
+        assert cache.get("hot") == "메모리에 있음"
+        assert cache.stats()["hits"] == 1
+    reader.join(5)
+    assert results == {"cold": None}